@@ -16,6 +16,7 @@ from src.app.bases.app_event_listener import AppEventListener
 from src.app.bases.app_queue_processor import AppQueueProcessor
 from src.app.bases.app_scheduler import AppScheduler
 from src.app.bases.app_schedule_loader import AppScheduleLoader
+from src.app.bases.app_webpush import AppWebpush
 from src.app.routes.app_http_router import AppHttpRouter as AppHttpRouterProvider
 from src.app.routes.app_ws_router import AppWsRouter as AppWsRouterProvider, getSocketIOServer
 from fastapi.exceptions import HTTPException
@@ -61,10 +62,11 @@ async def lifespan (app: FastAPI):
     yield
 
     AppScheduler.shutdown ()
+    await AppWebpush.close ()
     if hasattr (app.state, "cacheRedis") and app.state.cacheRedis:
         await app.state.cacheRedis.aclose ()
     if hasattr (app.state, "databasePostgresql") and app.state.databasePostgresql:
-        pass
+        await AppDatabase.databasePostgresqlClose ()
     if hasattr (app.state, "databaseMongodb") and app.state.databaseMongodb:
         await AppDatabase.databaseMongonosqlClose ()
     app.state.log = None
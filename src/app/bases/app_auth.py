@@ -1,14 +1,35 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-import bcrypt
+from typing import Dict, List, Optional
 from jose import jwt, JWTError
+from ulid import ULID
 from src.app.bases.app_context import AppContext
 from src.app.configs.auth_config import AuthConfig
+from src.app.contracts.app_password_hasher_contract import AppPasswordHasherContract
+from src.app.helpers.password_helper import PASSWORD_HASHERS, passwordHashBatch, passwordHasher
+
+BLACKLIST_KEY_PREFIX = "blacklist:token"
+BLACKLIST_ACCESS_KEY = "blacklist:tokens:access"
+BLACKLIST_CHANNEL = "blacklist:tokens"
 
 class AppAuth:
     """
     AppAuth
+
+    Attributes:
+        _hash_process_pool (Optional[ProcessPoolExecutor])
+        _hash_process_workers (int)
+        _hashers (Dict[str, AppPasswordHasherContract])
     """
+    _hash_process_pool: Optional[ProcessPoolExecutor] = None
+    _hash_process_workers: int = 1
+    _hashers: Dict[str, AppPasswordHasherContract] = {}
+
     @classmethod
     def config (cls) -> AuthConfig:
         """
@@ -19,6 +40,53 @@ class AppAuth:
         """
         return AuthConfig.config ()
 
+    @classmethod
+    def hashParams (cls, algorithm: str) -> Dict[str, int]:
+        """
+        Args:
+            cls
+            algorithm (str)
+        Returns:
+            Dict[str, int]
+        """
+        config = cls.config ()
+        if algorithm == "argon2id":
+            return {
+                "timeCost": config.auth_hash_argon2_time_cost,
+                "memoryCost": config.auth_hash_argon2_memory_cost,
+                "parallelism": config.auth_hash_argon2_parallelism,
+            }
+        return {"rounds": config.auth_hash_bcrypt_rounds}
+
+    @classmethod
+    def hasher (cls, algorithm: Optional[str] = None) -> AppPasswordHasherContract:
+        """
+        Args:
+            cls
+            algorithm (Optional[str])
+        Returns:
+            AppPasswordHasherContract
+        """
+        algorithm = algorithm or cls.config ().auth_hash_algorithm
+        if algorithm not in cls._hashers:
+            cls._hashers[algorithm] = passwordHasher (algorithm, cls.hashParams (algorithm))
+        return cls._hashers[algorithm]
+
+    @classmethod
+    def identifyHasher (cls, hashedPassword: str) -> Optional[AppPasswordHasherContract]:
+        """
+        Args:
+            cls
+            hashedPassword (str)
+        Returns:
+            Optional[AppPasswordHasherContract]
+        """
+        for algorithm in PASSWORD_HASHERS:
+            hasher = cls.hasher (algorithm)
+            if hasher.identify (hashedPassword):
+                return hasher
+        return None
+
     @classmethod
     def hashPassword (cls, password: str) -> str:
         """
@@ -27,9 +95,64 @@ class AppAuth:
         Returns:
             str
         """
-        salt = bcrypt.gensalt ()
-        hashed = bcrypt.hashpw (password.encode ('utf-8'), salt)
-        return hashed.decode ('utf-8')
+        return cls.hasher ().hash (password)
+
+    @classmethod
+    def needsRehash (cls, hashedPassword: str) -> bool:
+        """
+        Args:
+            cls
+            hashedPassword (str)
+        Returns:
+            bool
+        """
+        hasher = cls.identifyHasher (hashedPassword)
+        if hasher is None:
+            return False
+        if hasher.name != cls.config ().auth_hash_algorithm:
+            return True
+        return hasher.needsRehash (hashedPassword)
+
+    @classmethod
+    def hashProcessPool (cls) -> ProcessPoolExecutor:
+        """
+        Args:
+            cls
+        Returns:
+            ProcessPoolExecutor
+        """
+        if cls._hash_process_pool is None:
+            config = cls.config ()
+            cls._hash_process_workers = config.auth_hash_process_workers or os.cpu_count () or 1
+            # Spawned workers only import the password helper and its bcrypt or argon2 hasher instead of inheriting the event loop and open sockets.
+            cls._hash_process_pool = ProcessPoolExecutor (
+                max_workers=cls._hash_process_workers,
+                mp_context=multiprocessing.get_context ("spawn")
+            )
+        return cls._hash_process_pool
+
+    @classmethod
+    async def hashPasswords (cls, passwords: List[str]) -> List[str]:
+        """
+        Args:
+            cls
+            passwords (List[str])
+        Returns:
+            List[str]
+        """
+        if not passwords:
+            return []
+        # Spawned workers do not share the hasher cache, they rebuild it from the algorithm and parameters sent along.
+        algorithm = cls.config ().auth_hash_algorithm
+        params = cls.hashParams (algorithm)
+        pool = cls.hashProcessPool ()
+        size = max (1, -(-len (passwords) // cls._hash_process_workers))
+        loop = asyncio.get_running_loop ()
+        slices = await asyncio.gather (*[
+            loop.run_in_executor (pool, passwordHashBatch, passwords[index:index + size], algorithm, params)
+            for index in range (0, len (passwords), size)
+        ])
+        return [hashed for hashedSlice in slices for hashed in hashedSlice]
 
     @classmethod
     def verifyPassword (cls, plainPassword: str, hashedPassword: str) -> bool:
@@ -40,10 +163,11 @@ class AppAuth:
         Returns:
             bool
         """
-        try:
-            return bcrypt.checkpw (plainPassword.encode ('utf-8'), hashedPassword.encode ('utf-8'))
-        except Exception:
+        # The hash names its own algorithm, so hashes from before a switch keep verifying until they are upgraded.
+        hasher = cls.identifyHasher (hashedPassword or "")
+        if hasher is None:
             return False
+        return hasher.verify (plainPassword, hashedPassword)
 
     @classmethod
     def createAccessToken (cls, data: Dict[str, object], expiresDelta: Optional[timedelta] = None) -> str:
@@ -63,6 +187,7 @@ class AppAuth:
         toEncode.update ({
             "exp": expire,
             "iat": datetime.utcnow (),
+            "jti": str (ULID ()),
             "type": "access"
         })
         if config.jwt_issuer:
@@ -115,6 +240,7 @@ class AppAuth:
         toEncode.update ({
             "exp": expire,
             "iat": datetime.utcnow (),
+            "jti": str (ULID ()),
             "type": "refresh",
             "remember": remember,
         })
@@ -176,10 +302,27 @@ class AppAuth:
             return None
 
     @classmethod
-    async def isTokenBlacklisted (cls, token: str) -> bool:
+    def tokenId (cls, token: str, payload: Optional[Dict[str, object]] = None) -> str:
         """
         Args:
             token (str)
+            payload (Optional[Dict[str, object]])
+        Returns:
+            str
+        """
+        if payload is None:
+            payload = cls.decodeToken (token)
+        if payload and payload.get ("jti"):
+            return str (payload["jti"])
+        # Tokens issued before jti existed are keyed by a short digest instead of the whole JWT.
+        return hashlib.sha256 (token.encode ("utf-8")).hexdigest ()[:32]
+
+    @classmethod
+    async def isTokenBlacklisted (cls, token: str, payload: Optional[Dict[str, object]] = None) -> bool:
+        """
+        Args:
+            token (str)
+            payload (Optional[Dict[str, object]])
         Returns:
             bool
         """
@@ -187,9 +330,13 @@ class AppAuth:
             cacheRedis = AppContext.cacheRedis ()
             if not cacheRedis:
                 return False
-            key = f"blacklist:token:{token}"
-            result = await cacheRedis.get (key)
-            return result is not None
+            if payload is None:
+                payload = cls.decodeToken (token)
+            keys = [f"{BLACKLIST_KEY_PREFIX}:{cls.tokenId (token, payload)}"]
+            if not payload or not payload.get ("jti"):
+                # Blacklist entries written before the key change are still honoured until those tokens expire.
+                keys.append (f"{BLACKLIST_KEY_PREFIX}:{token}")
+            return any (value is not None for value in await cacheRedis.mget (keys))
         except Exception:
             return False
 
@@ -206,19 +353,27 @@ class AppAuth:
             cacheRedis = AppContext.cacheRedis ()
             if not cacheRedis:
                 return False
-            key = f"blacklist:token:{token}"
+            payload = cls.decodeToken (token)
+            now = int (time.time ())
             if ttl is None:
-                payload = cls.decodeToken (token)
                 if payload and "exp" in payload:
-                    exp = payload["exp"]
-                    now = int (datetime.utcnow ().timestamp ())
-                    ttl = max (0, exp - now)
+                    ttl = max (0, int (payload["exp"]) - now)
                 else:
                     config = cls.config ()
                     ttl = config.jwt_access_token_expire_minutes * 60
-            if ttl > 0:
-                await cacheRedis.setex (key, ttl, "1")
-                return True
-            return False
+            if ttl <= 0:
+                return False
+
+            tokenId = cls.tokenId (token, payload)
+            pipeline = cacheRedis.pipeline (transaction=False)
+            pipeline.setex (f"{BLACKLIST_KEY_PREFIX}:{tokenId}", ttl, "1")
+            if payload and payload.get ("jti") and payload.get ("type") == "access":
+                # Access revocations are also mirrored into every process, the sorted set lets a new process catch up.
+                expiresAt = now + ttl
+                pipeline.zadd (BLACKLIST_ACCESS_KEY, {tokenId: expiresAt})
+                pipeline.zremrangebyscore (BLACKLIST_ACCESS_KEY, "-inf", now)
+                pipeline.publish (BLACKLIST_CHANNEL, f"{tokenId}:{expiresAt}")
+            await pipeline.execute ()
+            return True
         except Exception:
             return False
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.app.bases.app_auth import AppAuth, BLACKLIST_ACCESS_KEY, BLACKLIST_CHANNEL
+from src.app.bases.app_context import AppContext
+from src.app.configs.auth_config import AuthConfig
+
+logger = logging.getLogger (__name__)
+
+class AppAuthToken:
+    """
+    AppAuthToken
+
+    Attributes:
+        _verified (OrderedDict[str, Tuple[float, Dict[str, object]]])
+        _revoked (Dict[str, float])
+        _synced (bool)
+        _listener (Optional[asyncio.Task])
+        _loop (Optional[asyncio.AbstractEventLoop])
+    """
+    _verified: "OrderedDict[str, Tuple[float, Dict[str, object]]]" = OrderedDict ()
+    _revoked: Dict[str, float] = {}
+    _synced: bool = False
+    _listener: Optional[asyncio.Task] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    RECONNECT_DELAY = 1.0
+    PRUNE_EVERY = 1024
+
+    @classmethod
+    def config (cls) -> AuthConfig:
+        """
+        Args:
+            cls
+        Returns:
+            AuthConfig
+        """
+        return AuthConfig.config ()
+
+    @classmethod
+    def bindLoop (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        # The listener task and its pub/sub connection belong to one event loop, a new loop starts them over unsynced.
+        loop = asyncio.get_running_loop ()
+        if cls._loop is not loop:
+            cls._loop = loop
+            cls._synced = False
+            cls._listener = None
+            cls._revoked = {}
+        if cls._listener is None and cls.config ().auth_token_revocation_sync and AppContext.cacheRedis () is not None:
+            cls._listener = loop.create_task (cls.listen ())
+
+    @classmethod
+    async def listen (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        while True:
+            cacheRedis = AppContext.cacheRedis ()
+            pubsub = None
+            try:
+                pubsub = cacheRedis.pubsub (ignore_subscribe_messages=True)
+                await pubsub.subscribe (BLACKLIST_CHANNEL)
+                # Subscribe before loading so a revocation landing in between is seen by one or the other.
+                now = time.time ()
+                entries = await cacheRedis.zrangebyscore (BLACKLIST_ACCESS_KEY, now, "+inf", withscores=True)
+                for tokenId, expiresAt in entries:
+                    cls._revoked[tokenId] = float (expiresAt)
+                cls._synced = True
+                async for message in pubsub.listen ():
+                    tokenId, _, expiresAt = str (message.get ("data", "")).rpartition (":")
+                    if tokenId:
+                        cls.markRevoked (tokenId, float (expiresAt or 0))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning (f"Token revocation sync lost: {e}")
+            finally:
+                cls._synced = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose ()
+                    except Exception:
+                        pass
+            await asyncio.sleep (cls.RECONNECT_DELAY)
+
+    @classmethod
+    def markRevoked (cls, tokenId: str, expiresAt: float) -> None:
+        """
+        Args:
+            cls
+            tokenId (str)
+            expiresAt (float)
+        Returns:
+            None
+        """
+        cls._revoked[tokenId] = expiresAt
+        if len (cls._revoked) % cls.PRUNE_EVERY == 0:
+            now = time.time ()
+            cls._revoked = {key: value for key, value in cls._revoked.items () if value > now}
+
+    @classmethod
+    def cached (cls, token: str) -> Optional[Dict[str, object]]:
+        """
+        Args:
+            cls
+            token (str)
+        Returns:
+            Optional[Dict[str, object]]
+        """
+        entry = cls._verified.get (token)
+        if entry is None:
+            return None
+        if entry[0] <= time.time ():
+            cls._verified.pop (token, None)
+            return None
+        cls._verified.move_to_end (token)
+        return entry[1]
+
+    @classmethod
+    def store (cls, token: str, payload: Dict[str, object]) -> None:
+        """
+        Args:
+            cls
+            token (str)
+            payload (Dict[str, object])
+        Returns:
+            None
+        """
+        size = cls.config ().auth_token_cache_size
+        if size <= 0 or "exp" not in payload:
+            return
+        cls._verified[token] = (float (payload["exp"]), payload)
+        cls._verified.move_to_end (token)
+        while len (cls._verified) > size:
+            cls._verified.popitem (last=False)
+
+    @classmethod
+    async def isRevoked (cls, token: str, payload: Dict[str, object]) -> bool:
+        """
+        Args:
+            cls
+            token (str)
+            payload (Dict[str, object])
+        Returns:
+            bool
+        """
+        # Only synced access tokens carrying a jti are answered locally, everything else still asks Redis.
+        if cls._synced and payload.get ("type") == "access" and payload.get ("jti"):
+            expiresAt = cls._revoked.get (str (payload["jti"]))
+            return expiresAt is not None and expiresAt > time.time ()
+        return await AppAuth.isTokenBlacklisted (token, payload)
+
+    @classmethod
+    async def verify (cls, token: str, tokenType: str = "access") -> Optional[Dict[str, object]]:
+        """
+        Args:
+            cls
+            token (str)
+            tokenType (str)
+        Returns:
+            Optional[Dict[str, object]]
+        """
+        cls.bindLoop ()
+        payload = cls.cached (token) if tokenType == "access" else None
+        if payload is None:
+            payload = AppAuth.verifyToken (token, tokenType)
+            if payload is None:
+                return None
+            if tokenType == "access":
+                cls.store (token, payload)
+
+        if await cls.isRevoked (token, payload):
+            cls._verified.pop (token, None)
+            return None
+        return payload
+
+    @classmethod
+    async def revoke (cls, token: str) -> bool:
+        """
+        Args:
+            cls
+            token (str)
+        Returns:
+            bool
+        """
+        revoked = await AppAuth.blacklistToken (token)
+        cls._verified.pop (token, None)
+        payload = AppAuth.decodeToken (token)
+        if payload and payload.get ("jti") and "exp" in payload:
+            # Seen locally right away, the pub/sub echo of the same revocation arrives later.
+            cls.markRevoked (str (payload["jti"]), float (payload["exp"]))
+        return revoked
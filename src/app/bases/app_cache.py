@@ -1,6 +1,5 @@
 from typing import Optional
 from fastapi import FastAPI
-from fastapi_limiter import FastAPILimiter
 import redis.asyncio as cache_redis
 from src.app.configs.cache_config import CacheConfig
 
@@ -26,5 +25,4 @@ class AppCache:
             cacheConfig = CacheConfig.config ()
             redisUri = cacheConfig.redis_uri ()
             cls._engine = cache_redis.from_url (redisUri, encoding="utf-8", decode_responses=True)
-            await FastAPILimiter.init (cls._engine)
         return cls._engine
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar ("T")
+
+class AppCacheLocal (Generic[T]):
+    """
+    AppCacheLocal (Generic)
+
+    Attributes:
+        maxSize (int)
+        ttl (float)
+        _entries (OrderedDict[Hashable, Tuple[float, T]])
+        _lock (threading.Lock)
+    """
+    def __init__ (self, maxSize: int = 1024, ttl: float = 5.0) -> None:
+        """
+        Args:
+            maxSize (int)
+            ttl (float)
+        Returns:
+            None
+        """
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict ()
+        self._lock = threading.Lock ()
+
+    def get (self, key: Hashable) -> Optional[T]:
+        """
+        Args:
+            key (Hashable)
+        Returns:
+            Optional[T]
+        """
+        with self._lock:
+            entry = self._entries.get (key)
+            if entry is None:
+                return None
+            expiresAt, value = entry
+            if expiresAt <= time.monotonic ():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end (key)
+            return value
+
+    def set (self, key: Hashable, value: T, ttl: Optional[float] = None) -> None:
+        """
+        Args:
+            key (Hashable)
+            value (T)
+            ttl (Optional[float])
+        Returns:
+            None
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxSize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic () + ttl, value)
+            self._entries.move_to_end (key)
+            while len (self._entries) > self.maxSize:
+                self._entries.popitem (last=False)
+
+    def delete (self, key: Hashable) -> None:
+        """
+        Args:
+            key (Hashable)
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.pop (key, None)
+
+    def clear (self) -> None:
+        """
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear ()
+
+    def __len__ (self) -> int:
+        """
+        Returns:
+            int
+        """
+        with self._lock:
+            return len (self._entries)
@@ -11,6 +11,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from rq import Queue
 import aiosmtplib
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from src.app.bases.app_cache import AppCache
 from src.app.bases.app_disk import AppDisk
 from src.app.bases.app_event import getEventEmitter, AppEventEmitter
 from src.app.bases.app_i18n import AppI18n
@@ -158,9 +159,9 @@ class AppContext:
             Optional[cache_redis.Redis]
         """
         app = cls.getApp ()
-        if app and hasattr (app.state, "cacheRedis"):
+        if app and getattr (app.state, "cacheRedis", None) is not None:
             return app.state.cacheRedis
-        return None
+        return AppCache._engine
 
     @classmethod
     def databasePostgresql (cls) -> Engine:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Annotated, Generator, Optional
+import asyncio
+from typing import Annotated, AsyncGenerator, Dict, Generator, Optional
 from fastapi import FastAPI, Depends
 from sqlalchemy import Engine, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import create_engine, Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from urllib.parse import urlparse
+from src.app.bases.app_database_pool import AppDatabaseAsyncQueuePool, AppDatabaseQueuePool
+from src.app.bases.app_database_unit_of_work import AppDatabaseUnitOfWork
 from src.app.configs.database_config import DatabaseConfig
 
 class AppDatabase:
@@ -14,11 +19,15 @@ class AppDatabase:
 
     Attributes:
         _database_postgresql (None)
+        _database_postgresql_async (None)
+        _database_postgresql_async_loop (None)
         _database_mongonosql (None)
         database_mongonosql_session (None)
         database_postgresql_session (Depends (databasePostgresqlSession))
     """
     _database_postgresql = None
+    _database_postgresql_async: Optional[AsyncEngine] = None
+    _database_postgresql_async_loop: Optional[asyncio.AbstractEventLoop] = None
     _database_mongonosql: Optional[AsyncIOMotorClient] = None
 
     @classmethod
@@ -45,6 +54,88 @@ class AppDatabase:
 
             yield session
 
+    @classmethod
+    async def databasePostgresqlAsyncSession (cls) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Args:
+            cls
+        Returns:
+            AsyncGenerator[AsyncSession, None]
+        """
+        async with cls.databasePostgresqlAsyncSessionMake () as session:
+
+            yield session
+
+    @classmethod
+    def databasePostgresqlAsyncSessionMake (cls) -> AsyncSession:
+        """
+        Args:
+            cls
+        Returns:
+            AsyncSession
+        """
+        return AsyncSession (
+            cls.databasePostgresqlAsync (),
+            expire_on_commit=False
+        )
+
+    @classmethod
+    def databasePostgresqlAsyncSessionScoped (cls) -> AsyncSession:
+        """
+        Args:
+            cls
+        Returns:
+            AsyncSession
+        """
+        unitOfWork = AppDatabaseUnitOfWork.current ()
+        if unitOfWork is None:
+            return cls.databasePostgresqlAsyncSessionMake ()
+        return unitOfWork.acquire (cls.databasePostgresqlAsyncSessionMake)
+
+    @classmethod
+    async def databasePostgresqlCommit (cls, session: AsyncSession) -> None:
+        """
+        Args:
+            cls
+            session (AsyncSession)
+        Returns:
+            None
+        """
+        unitOfWork = AppDatabaseUnitOfWork.current ()
+        if unitOfWork is not None and unitOfWork.owns (session):
+            await session.flush ()
+        else:
+            await session.commit ()
+
+    @classmethod
+    async def databasePostgresqlRollback (cls, session: AsyncSession) -> None:
+        """
+        Args:
+            cls
+            session (AsyncSession)
+        Returns:
+            None
+        """
+        unitOfWork = AppDatabaseUnitOfWork.current ()
+        if unitOfWork is not None and unitOfWork.owns (session):
+            await unitOfWork.rollback ()
+        else:
+            await session.rollback ()
+
+    @classmethod
+    async def databasePostgresqlRelease (cls, session: AsyncSession) -> None:
+        """
+        Args:
+            cls
+            session (AsyncSession)
+        Returns:
+            None
+        """
+        unitOfWork = AppDatabaseUnitOfWork.current ()
+        if unitOfWork is not None and unitOfWork.owns (session):
+            return
+        await session.close ()
+
     @classmethod
     async def databasePostgresqlInit (cls, app: FastAPI) -> Annotated[Session, Depends]:
         """
@@ -54,10 +145,23 @@ class AppDatabase:
         Returns:
             Annotated[Session, Depends]
         """
-        with cls.databasePostgresql ().connect () as connection:
-            connection.execute (text ("SELECT 1"))
+        async with cls.databasePostgresqlAsync ().connect () as connection:
+            await connection.execute (text ("SELECT 1"))
         return cls.database_postgresql_session
 
+    @classmethod
+    async def databasePostgresqlClose (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        if cls._database_postgresql_async is not None:
+            await cls._database_postgresql_async.dispose ()
+            cls._database_postgresql_async = None
+            cls._database_postgresql_async_loop = None
+
     @classmethod
     def databasePostgresql (cls) -> Engine:
         """
@@ -68,9 +172,76 @@ class AppDatabase:
         """
         if cls._database_postgresql is None:
             databaseConfig = DatabaseConfig.config ()
-            cls._database_postgresql = create_engine (databaseConfig.postgre_uri (), echo=True)
+            cls._database_postgresql = create_engine (
+                databaseConfig.postgre_uri (),
+                poolclass=AppDatabaseQueuePool,
+                connect_args=databaseConfig.postgre_connect_args (),
+                **databaseConfig.postgre_engine_options ()
+            )
         return cls._database_postgresql
 
+    @classmethod
+    def databasePostgresqlAsync (cls) -> AsyncEngine:
+        """
+        Args:
+            cls
+        Returns:
+            AsyncEngine
+        """
+        try:
+            loop = asyncio.get_running_loop ()
+        except RuntimeError:
+            loop = None
+
+        # Asyncpg connections are bound to the loop that opened them, and queue workers run each job in a fresh loop.
+        if cls._database_postgresql_async is None or cls._database_postgresql_async_loop is not loop:
+            if cls._database_postgresql_async is not None:
+                cls.databasePostgresqlAsyncDiscard (cls._database_postgresql_async, cls._database_postgresql_async_loop)
+            databaseConfig = DatabaseConfig.config ()
+            cls._database_postgresql_async = create_async_engine (
+                databaseConfig.postgre_async_uri (),
+                poolclass=AppDatabaseAsyncQueuePool,
+                connect_args=databaseConfig.postgre_async_connect_args (),
+                **databaseConfig.postgre_engine_options ()
+            )
+            cls._database_postgresql_async_loop = loop
+        return cls._database_postgresql_async
+
+    @staticmethod
+    def databasePostgresqlAsyncDiscard (engine: AsyncEngine, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Args:
+            engine (AsyncEngine)
+            loop (Optional[asyncio.AbstractEventLoop])
+        Returns:
+            None
+        """
+        # Pooled connections can only be closed on the loop that opened them, so a live loop disposes its own engine.
+        if loop is not None and not loop.is_closed () and loop.is_running ():
+            asyncio.run_coroutine_threadsafe (engine.dispose (), loop)
+            return
+        # A closed loop already tore down its transports, dropping the pool releases the connections without touching them.
+        engine.sync_engine.dispose (close=False)
+
+    @classmethod
+    def databasePostgresqlPoolStats (cls) -> Dict[str, Dict[str, object]]:
+        """
+        Args:
+            cls
+        Returns:
+            Dict[str, Dict[str, object]]
+        """
+        stats = {}
+        if cls._database_postgresql_async is not None:
+            pool = cls._database_postgresql_async.sync_engine.pool
+            if isinstance (pool, AppDatabaseAsyncQueuePool):
+                stats["async"] = pool.stats ()
+        if cls._database_postgresql is not None:
+            pool = cls._database_postgresql.pool
+            if isinstance (pool, AppDatabaseQueuePool):
+                stats["sync"] = pool.stats ()
+        return stats
+
     @classmethod
     def databaseMongonosqlDatabase (cls, databaseName: Optional[str] = None) -> AsyncIOMotorDatabase:
         """
@@ -0,0 +1,166 @@
+from typing import Callable, Dict, List, Tuple
+import json
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+class Explain (Executable, ClauseElement):
+    """
+    Explain (Executable, ClauseElement)
+
+    Attributes:
+        statement (Executable)
+        analyze (bool)
+    """
+    inherit_cache = False
+
+    def __init__ (self, statement: Executable, analyze: bool = False) -> None:
+        """
+        Args:
+            statement (Executable)
+            analyze (bool)
+        Returns:
+            None
+        """
+        self.statement = statement
+        self.analyze = analyze
+
+@compiles (Explain, "postgresql")
+def compileExplain (element: Explain, compiler: object, **kw: object) -> str:
+    """
+    Args:
+        element (Explain)
+        compiler (object)
+        **kw (object)
+    Returns:
+        str
+    """
+    options = "ANALYZE, BUFFERS, " if element.analyze else ""
+    return f"EXPLAIN ({options}FORMAT JSON) " + compiler.process (element.statement, **kw)
+
+class AppDatabaseExplain:
+    """
+    AppDatabaseExplain
+
+    Attributes:
+        _shapes (Dict[str, Tuple[Callable[..., Executable], Tuple[object, ...]]])
+    """
+    _shapes: Dict[str, Tuple[Callable[..., Executable], Tuple[object, ...]]] = {}
+
+    SEQUENTIAL_NODES = ("Seq Scan", "Parallel Seq Scan")
+
+    @classmethod
+    def register (cls, name: str, factory: Callable[..., Executable], sampleArgs: Tuple[object, ...] = ()) -> None:
+        """
+        Args:
+            cls
+            name (str)
+            factory (Callable[..., Executable])
+            sampleArgs (Tuple[object, ...])
+        Returns:
+            None
+        """
+        cls._shapes[name] = (factory, sampleArgs)
+
+    @classmethod
+    def shapes (cls) -> Dict[str, Executable]:
+        """
+        Args:
+            cls
+        Returns:
+            Dict[str, Executable]
+        """
+        return {name: factory (*sampleArgs) for name, (factory, sampleArgs) in sorted (cls._shapes.items ())}
+
+    @staticmethod
+    def explain (connection: Connection, statement: Executable, analyze: bool = False, preferIndexes: bool = True) -> Dict[str, object]:
+        """
+        Args:
+            connection (Connection)
+            statement (Executable)
+            analyze (bool)
+            preferIndexes (bool)
+        Returns:
+            Dict[str, object]
+        """
+        transaction = connection.begin ()
+        try:
+            if preferIndexes:
+                # Small tables are always cheaper to scan, disabling seq scans asks whether an index could serve the shape at all.
+                connection.execute (text ("SET LOCAL enable_seqscan = off"))
+            result = connection.execute (Explain (statement, analyze)).scalar ()
+        finally:
+            # ANALYZE executes the statement, the rollback keeps mutating shapes side-effect free.
+            transaction.rollback ()
+        return AppDatabaseExplain.planOf (result)
+
+    @staticmethod
+    def planOf (result: object) -> Dict[str, object]:
+        """
+        Args:
+            result (object)
+        Returns:
+            Dict[str, object]
+        """
+        # psycopg2 decodes the json column, asyncpg hands it over as text.
+        if isinstance (result, str):
+            result = json.loads (result)
+        return result[0]["Plan"]
+
+    @staticmethod
+    def nodes (plan: Dict[str, object]) -> List[Dict[str, object]]:
+        """
+        Args:
+            plan (Dict[str, object])
+        Returns:
+            List[Dict[str, object]]
+        """
+        found = [plan]
+        for child in plan.get ("Plans", []):
+            found.extend (AppDatabaseExplain.nodes (child))
+        return found
+
+    @staticmethod
+    def sequentialScans (plan: Dict[str, object]) -> List[str]:
+        """
+        Args:
+            plan (Dict[str, object])
+        Returns:
+            List[str]
+        """
+        return [
+            str (node.get ("Relation Name"))
+            for node in AppDatabaseExplain.nodes (plan)
+            if node.get ("Node Type") in AppDatabaseExplain.SEQUENTIAL_NODES
+        ]
+
+    @staticmethod
+    def indexes (plan: Dict[str, object]) -> List[str]:
+        """
+        Args:
+            plan (Dict[str, object])
+        Returns:
+            List[str]
+        """
+        return [str (node["Index Name"]) for node in AppDatabaseExplain.nodes (plan) if node.get ("Index Name")]
+
+def QueryShape (name: str, *sampleArgs: object) -> Callable[[Callable[..., Executable]], Callable[..., Executable]]:
+    """
+    Args:
+        name (str)
+        *sampleArgs (object)
+    Returns:
+        Callable[[Callable[..., Executable]], Callable[..., Executable]]
+    """
+    def decorator (func: Callable[..., Executable]) -> Callable[..., Executable]:
+        """
+        Args:
+            func (Callable[..., Executable])
+        Returns:
+            Callable[..., Executable]
+        """
+        AppDatabaseExplain.register (name, func, sampleArgs)
+        return func
+    return decorator
@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+class AppDatabasePoolMetric:
+    """
+    AppDatabasePoolMetric
+
+    Attributes:
+        _metric_lock (threading.Lock)
+        _metric_checkouts (int)
+        _metric_timeouts (int)
+        _metric_wait_total (float)
+        _metric_wait_max (float)
+        _metric_wait_last (float)
+    """
+    def __init__ (self, *args, **kwargs) -> None:
+        """
+        Args:
+            args
+            kwargs
+        Returns:
+            None
+        """
+        super ().__init__ (*args, **kwargs)
+        self._metric_lock = threading.Lock ()
+        self._metric_checkouts = 0
+        self._metric_timeouts = 0
+        self._metric_wait_total = 0.0
+        self._metric_wait_max = 0.0
+        self._metric_wait_last = 0.0
+
+    def _do_get (self):
+        """
+        Args:
+            self
+        Returns:
+            ConnectionPoolEntry
+        """
+        started = time.perf_counter ()
+        try:
+            connection = super ()._do_get ()
+        except PoolTimeoutError:
+            with self._metric_lock:
+                self._metric_timeouts += 1
+            raise
+        waited = time.perf_counter () - started
+        with self._metric_lock:
+            self._metric_checkouts += 1
+            self._metric_wait_total += waited
+            self._metric_wait_last = waited
+            if waited > self._metric_wait_max:
+                self._metric_wait_max = waited
+        return connection
+
+    def recreate (self):
+        """
+        Args:
+            self
+        Returns:
+            Pool
+        """
+        pool = super ().recreate ()
+        if isinstance (pool, AppDatabasePoolMetric):
+            with self._metric_lock:
+                pool._metric_checkouts = self._metric_checkouts
+                pool._metric_timeouts = self._metric_timeouts
+                pool._metric_wait_total = self._metric_wait_total
+                pool._metric_wait_max = self._metric_wait_max
+                pool._metric_wait_last = self._metric_wait_last
+        return pool
+
+    def stats (self) -> Dict[str, object]:
+        """
+        Args:
+            self
+        Returns:
+            Dict[str, object]
+        """
+        with self._metric_lock:
+            checkouts = self._metric_checkouts
+            timeouts = self._metric_timeouts
+            waitTotal = self._metric_wait_total
+            waitMax = self._metric_wait_max
+            waitLast = self._metric_wait_last
+
+        size = self.size ()
+        checkedOut = self.checkedout ()
+        overflow = max (self.overflow (), 0)
+        maxOverflow = self._max_overflow
+
+        return {
+            "size": size,
+            "checked_in": self.checkedin (),
+            "checked_out": checkedOut,
+            "overflow": overflow,
+            "max_overflow": maxOverflow,
+            "exhausted": maxOverflow >= 0 and checkedOut >= size + maxOverflow,
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms_last": round (waitLast * 1000, 3),
+            "wait_ms_max": round (waitMax * 1000, 3),
+            "wait_ms_avg": round ((waitTotal / checkouts) * 1000, 3) if checkouts else 0.0,
+        }
+
+class AppDatabaseQueuePool (AppDatabasePoolMetric, QueuePool):
+    """
+    AppDatabaseQueuePool (AppDatabasePoolMetric, QueuePool)
+    """
+
+class AppDatabaseAsyncQueuePool (AppDatabasePoolMetric, AsyncAdaptedQueuePool):
+    """
+    AppDatabaseAsyncQueuePool (AppDatabasePoolMetric, AsyncAdaptedQueuePool)
+    """
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Awaitable, Callable, List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger (__name__)
+
+def currentTask () -> Optional[asyncio.Task]:
+    """
+    Returns:
+        Optional[asyncio.Task]
+    """
+    try:
+        return asyncio.current_task ()
+    except RuntimeError:
+        return None
+
+class AppDatabaseUnitOfWork:
+    """
+    AppDatabaseUnitOfWork
+
+    Attributes:
+        owner (Optional[asyncio.Task])
+        session (Optional[AsyncSession])
+        active (bool)
+        rollbackOnly (bool)
+        callbacks (List[Callable[[], Awaitable[None]]])
+    """
+    def __init__ (self) -> None:
+        """
+        Returns:
+            None
+        """
+        self.owner = currentTask ()
+        self.session: Optional[AsyncSession] = None
+        self.active = True
+        self.rollbackOnly = False
+        self.callbacks: List[Callable[[], Awaitable[None]]] = []
+
+    @staticmethod
+    def current () -> Optional["AppDatabaseUnitOfWork"]:
+        """
+        Returns:
+            Optional[AppDatabaseUnitOfWork]
+        """
+        unitOfWork = _app_database_unit_of_work.get ()
+        if unitOfWork is None or not unitOfWork.active:
+            return None
+
+        # Tasks spawned from a request copy its context, but an AsyncSession must never be shared across tasks.
+        if unitOfWork.owner is not currentTask ():
+            return None
+        return unitOfWork
+
+    def acquire (self, sessionMaker: Callable[[], AsyncSession]) -> AsyncSession:
+        """
+        Args:
+            sessionMaker (Callable[[], AsyncSession])
+        Returns:
+            AsyncSession
+        """
+        if self.session is None:
+            self.session = sessionMaker ()
+        return self.session
+
+    def owns (self, session: AsyncSession) -> bool:
+        """
+        Args:
+            session (AsyncSession)
+        Returns:
+            bool
+        """
+        return self.session is not None and self.session is session
+
+    def afterCommit (self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Args:
+            callback (Callable[[], Awaitable[None]])
+        Returns:
+            None
+        """
+        self.callbacks.append (callback)
+
+    async def commit (self) -> bool:
+        """
+        Returns:
+            bool
+        """
+        if self.rollbackOnly:
+            await self.rollback ()
+            return False
+        if self.session is not None:
+            await self.session.commit ()
+        return True
+
+    async def rollback (self) -> None:
+        """
+        Returns:
+            None
+        """
+        self.rollbackOnly = True
+        self.callbacks = []
+        if self.session is not None:
+            await self.session.rollback ()
+
+    async def runAfterCommit (self) -> None:
+        """
+        Returns:
+            None
+        """
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            # The transaction is already committed, one failing side effect must not take the others down with it.
+            try:
+                await callback ()
+            except Exception as e:
+                logger.warning (f"After commit callback error: {e}")
+
+    async def close (self) -> None:
+        """
+        Returns:
+            None
+        """
+        self.active = False
+        if self.session is not None:
+            session = self.session
+            self.session = None
+            await session.close ()
+
+_app_database_unit_of_work: ContextVar[Optional[AppDatabaseUnitOfWork]] = ContextVar ("app_database_unit_of_work", default=None)
+
+async def afterCommit (callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Args:
+        callback (Callable[[], Awaitable[None]])
+    Returns:
+        None
+    """
+    # Inside a request the writes are only flushed, side effects wait for the commit and are dropped with a rollback.
+    unitOfWork = _app_database_unit_of_work.get ()
+    if unitOfWork is not None and unitOfWork.active:
+        unitOfWork.afterCommit (callback)
+        return
+    await callback ()
+
+class AppDatabaseUnitOfWorkMiddleware:
+    """
+    AppDatabaseUnitOfWorkMiddleware
+
+    Attributes:
+        app (ASGIApp)
+    """
+    def __init__ (self, app: ASGIApp) -> None:
+        """
+        Args:
+            app (ASGIApp)
+        Returns:
+            None
+        """
+        self.app = app
+
+    async def __call__ (self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Args:
+            scope (Scope)
+            receive (Receive)
+            send (Send)
+        Returns:
+            None
+        """
+        if scope["type"] != "http":
+            await self.app (scope, receive, send)
+            return
+
+        unitOfWork = AppDatabaseUnitOfWork ()
+        token = _app_database_unit_of_work.set (unitOfWork)
+
+        async def sendMessage (message: Message) -> None:
+            """
+            Args:
+                message (Message)
+            Returns:
+                None
+            """
+            if message["type"] == "http.response.start" and unitOfWork.active:
+                # Settle the transaction before the client sees a status, background tasks then get their own sessions.
+                committed = False
+                try:
+                    if message["status"] < 400:
+                        committed = await unitOfWork.commit ()
+                    else:
+                        await unitOfWork.rollback ()
+                finally:
+                    await unitOfWork.close ()
+                # Still ahead of the status, so a client's next request already sees invalidated caches and counters.
+                if committed:
+                    await unitOfWork.runAfterCommit ()
+            await send (message)
+
+        try:
+            await self.app (scope, receive, sendMessage)
+        except Exception:
+            if unitOfWork.active:
+                await unitOfWork.rollback ()
+            raise
+        finally:
+            await unitOfWork.close ()
+            _app_database_unit_of_work.reset (token)
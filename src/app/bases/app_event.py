@@ -1,6 +1,7 @@
 from collections import defaultdict
 from typing import Dict, List, Callable, Optional
 import asyncio
+from src.app.bases.app_database_unit_of_work import afterCommit
 
 class AppEventEmitter:
     """
@@ -47,6 +48,28 @@ class AppEventEmitter:
             self._listeners[event].remove (handler)
 
     async def emit (self, event: str, *args: object, **kwargs: object) -> None:
+        """
+        Args:
+            event (str)
+            *args (object)
+            **kwargs (object)
+        Returns:
+            None
+        """
+        if event not in self._listeners:
+            return
+
+        # Listeners run on their own sessions and caches, so they only get to see a request's writes once it commits.
+        async def dispatch () -> None:
+            """
+            Returns:
+                None
+            """
+            await self.dispatch (event, *args, **kwargs)
+
+        await afterCommit (dispatch)
+
+    async def dispatch (self, event: str, *args: object, **kwargs: object) -> None:
         """
         Args:
             event (str)
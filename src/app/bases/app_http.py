@@ -2,6 +2,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
+from src.app.bases.app_database_unit_of_work import AppDatabaseUnitOfWorkMiddleware
+from src.app.bases.app_rate_limiter import AppRateLimitMiddleware
 from src.app.configs.app_config import AppConfig
 
 class AppHttp:
@@ -33,9 +35,33 @@ class AppHttp:
         Returns:
             None
         """
+        cls.bootUnitOfWork (app)
+        cls.bootRateLimit (app)
         cls.bootCors (app)
         cls.bootCompression (app)
 
+    @classmethod
+    def bootUnitOfWork (cls, app: FastAPI) -> None:
+        """
+        Args:
+            cls
+            app (FastAPI)
+        Returns:
+            None
+        """
+        app.add_middleware (AppDatabaseUnitOfWorkMiddleware)
+
+    @classmethod
+    def bootRateLimit (cls, app: FastAPI) -> None:
+        """
+        Args:
+            cls
+            app (FastAPI)
+        Returns:
+            None
+        """
+        app.add_middleware (AppRateLimitMiddleware)
+
     @classmethod
     def bootCors (cls, app: FastAPI) -> None:
         """
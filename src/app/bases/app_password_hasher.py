@@ -0,0 +1,228 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+from fastapi import HTTPException, status
+from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_i18n import AppI18n
+from src.app.configs.auth_config import AuthConfig
+
+T = TypeVar ("T")
+
+PASSWORD_HASHER_OPERATIONS = ("hash", "verify")
+
+class AppPasswordHasher:
+    """
+    AppPasswordHasher
+
+    Attributes:
+        _executor (Optional[ThreadPoolExecutor])
+        _lock (threading.Lock)
+        _pending (int)
+        _rejected (int)
+        _metrics (Dict[str, Dict[str, float]])
+    """
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock: threading.Lock = threading.Lock ()
+    _pending: int = 0
+    _rejected: int = 0
+    _metrics: Dict[str, Dict[str, float]] = {
+        operation: {"count": 0, "wait_total": 0.0, "wait_max": 0.0, "duration_total": 0.0, "duration_max": 0.0, "duration_last": 0.0}
+        for operation in PASSWORD_HASHER_OPERATIONS
+    }
+
+    @classmethod
+    def config (cls) -> AuthConfig:
+        """
+        Args:
+            cls
+        Returns:
+            AuthConfig
+        """
+        return AuthConfig.config ()
+
+    @classmethod
+    def workers (cls) -> int:
+        """
+        Args:
+            cls
+        Returns:
+            int
+        """
+        return max (1, cls.config ().auth_hash_workers or os.cpu_count () or 1)
+
+    @classmethod
+    def capacity (cls) -> int:
+        """
+        Args:
+            cls
+        Returns:
+            int
+        """
+        return cls.workers () + max (0, cls.config ().auth_hash_queue_limit)
+
+    @classmethod
+    def executor (cls) -> ThreadPoolExecutor:
+        """
+        Args:
+            cls
+        Returns:
+            ThreadPoolExecutor
+        """
+        # bcrypt and argon2 release the GIL while they work, so threads hash in parallel without the spawn cost of a process pool.
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor (max_workers=cls.workers (), thread_name_prefix="password-hasher")
+        return cls._executor
+
+    @classmethod
+    def admit (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        capacity = cls.capacity ()
+        with cls._lock:
+            if cls._pending >= capacity:
+                cls._rejected += 1
+                rejected = True
+            else:
+                cls._pending += 1
+                rejected = False
+        if rejected:
+            i18n = AppI18n.i18n ()
+            raise HTTPException (
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=i18n.t ("_app.error.service_overloaded"),
+                headers={"Retry-After": "1"},
+            )
+
+    @classmethod
+    def release (cls, future: Future) -> None:
+        """
+        Args:
+            cls
+            future (Future)
+        Returns:
+            None
+        """
+        with cls._lock:
+            cls._pending -= 1
+
+    @classmethod
+    def record (cls, operation: str, waited: float, duration: float) -> None:
+        """
+        Args:
+            cls
+            operation (str)
+            waited (float)
+            duration (float)
+        Returns:
+            None
+        """
+        with cls._lock:
+            metric = cls._metrics[operation]
+            metric["count"] += 1
+            metric["wait_total"] += waited
+            metric["duration_total"] += duration
+            metric["duration_last"] = duration
+            if waited > metric["wait_max"]:
+                metric["wait_max"] = waited
+            if duration > metric["duration_max"]:
+                metric["duration_max"] = duration
+
+    @classmethod
+    async def run (cls, operation: str, func: Callable[..., T], *args: object) -> T:
+        """
+        Args:
+            cls
+            operation (str)
+            func (Callable[..., T])
+            *args (object)
+        Returns:
+            T
+        """
+        cls.admit ()
+        submitted = time.perf_counter ()
+
+        def timed () -> T:
+            """
+            Returns:
+                T
+            """
+            started = time.perf_counter ()
+            try:
+                return func (*args)
+            finally:
+                cls.record (operation, started - submitted, time.perf_counter () - started)
+
+        try:
+            future = cls.executor ().submit (timed)
+        except BaseException:
+            cls.release (None)
+            raise
+        # The slot frees when the work finishes or is cancelled in the queue, not when a cancelled caller stops waiting.
+        future.add_done_callback (cls.release)
+        return await asyncio.wrap_future (future)
+
+    @classmethod
+    async def hash (cls, password: str) -> str:
+        """
+        Args:
+            cls
+            password (str)
+        Returns:
+            str
+        """
+        return await cls.run ("hash", AppAuth.hashPassword, password)
+
+    @classmethod
+    async def verify (cls, plainPassword: str, hashedPassword: str) -> bool:
+        """
+        Args:
+            cls
+            plainPassword (str)
+            hashedPassword (str)
+        Returns:
+            bool
+        """
+        return await cls.run ("verify", AppAuth.verifyPassword, plainPassword, hashedPassword)
+
+    @classmethod
+    def stats (cls) -> Dict[str, object]:
+        """
+        Args:
+            cls
+        Returns:
+            Dict[str, object]
+        """
+        workers = cls.workers ()
+        with cls._lock:
+            pending = cls._pending
+            rejected = cls._rejected
+            metrics = {operation: dict (metric) for operation, metric in cls._metrics.items ()}
+
+        stats: Dict[str, object] = {
+            "algorithm": cls.config ().auth_hash_algorithm,
+            "workers": workers,
+            "capacity": cls.capacity (),
+            "running": min (pending, workers),
+            "queued": max (0, pending - workers),
+            "rejected": rejected,
+        }
+        for operation, metric in metrics.items ():
+            count = metric["count"]
+            stats[operation] = {
+                "count": int (count),
+                "wait_ms_max": round (metric["wait_max"] * 1000, 3),
+                "wait_ms_avg": round ((metric["wait_total"] / count) * 1000, 3) if count else 0.0,
+                "duration_ms_last": round (metric["duration_last"] * 1000, 3),
+                "duration_ms_max": round (metric["duration_max"] * 1000, 3),
+                "duration_ms_avg": round ((metric["duration_total"] / count) * 1000, 3) if count else 0.0,
+            }
+        return stats
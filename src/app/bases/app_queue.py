@@ -1,11 +1,18 @@
-from typing import Dict, Optional, Callable
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Callable
+import hashlib
+import logging
 from typing_extensions import Self
 import redis
-from rq import Queue
+from rq import Queue, get_current_job
 from rq.job import Job
 from src.app.configs.app_config import AppConfig
 from src.app.configs.queue_config import QueueConfig
 
+logger = logging.getLogger (__name__)
+
+_app_queue_current_job: ContextVar[Optional[Job]] = ContextVar ("app_queue_current_job", default=None)
+
 class AppQueue:
     """
     AppQueue
@@ -20,6 +27,7 @@ class AppQueue:
     DEFAULT_JOB_TIMEOUT = 3600
     DEFAULT_RESULT_TTL = 86400
     DEFAULT_FAILURE_TTL = 604800
+    DEDUP_KEY_PREFIX = "queue:dedup"
 
     @classmethod
     def connection (cls) -> redis.Redis:
@@ -88,6 +96,111 @@ class AppQueue:
             )
         raise ValueError (f"No handler found for queue '{queueName}' and job '{jobName}'")
 
+    @classmethod
+    def enqueueMany (
+        cls,
+        queueName: str,
+        jobName: str,
+        jobs: Iterable[Dict[str, object]],
+        job_timeout: Optional[int] = None,
+        result_ttl: Optional[int] = None,
+        failure_ttl: Optional[int] = None,
+        ttl: Optional[int] = None,
+        dedup_ttl: Optional[int] = None
+    ) -> List[Job]:
+        """
+        Args:
+            queueName (str)
+            jobName (str)
+            jobs (Iterable[Dict[str, object]])
+            job_timeout (Optional[int])
+            result_ttl (Optional[int])
+            failure_ttl (Optional[int])
+            ttl (Optional[int])
+            dedup_ttl (Optional[int])
+        Returns:
+            List[Job]
+        """
+        queue = cls.getQueue (queueName)
+        from src.app.bases.app_queue_processor import AppQueueProcessor
+        handler = AppQueueProcessor.getHandler (queueName, jobName)
+        if not handler:
+            raise ValueError (f"No handler found for queue '{queueName}' and job '{jobName}'")
+
+        timeout = job_timeout if job_timeout is not None else cls.DEFAULT_JOB_TIMEOUT
+        rttl = result_ttl if result_ttl is not None else cls.DEFAULT_RESULT_TTL
+        fttl = failure_ttl if failure_ttl is not None else cls.DEFAULT_FAILURE_TTL
+        dttl = dedup_ttl if dedup_ttl is not None else (ttl or timeout)
+
+        # Each item may carry "args", "kwargs", "meta" and a "dedupKey".
+        items = list (jobs)
+        dedupKeys = [cls.dedupKey (queueName, jobName, item.get ("dedupKey")) if item.get ("dedupKey") else None for item in items]
+        claimedKeys: List[str] = []
+
+        if any (dedupKeys):
+            # Claim every dedup key in one round-trip, SET NX only succeeds for keys no earlier batch holds.
+            claimed: Dict[str, bool] = {}
+            with cls.connection ().pipeline (transaction=False) as pipeline:
+                pending = list (dict.fromkeys (key for key in dedupKeys if key))
+                for key in pending:
+                    pipeline.set (key, 1, nx=True, ex=dttl)
+                for key, result in zip (pending, pipeline.execute ()):
+                    claimed[key] = bool (result)
+            claimedKeys = [key for key in pending if claimed[key]]
+            selected = []
+            for item, key in zip (items, dedupKeys):
+                if key is None:
+                    selected.append (item)
+                elif claimed.get (key):
+                    claimed[key] = False
+                    selected.append (item)
+            items = selected
+
+        if not items:
+            return []
+
+        jobDatas = [
+            Queue.prepare_data (
+                handler,
+                args=tuple (item.get ("args") or ()),
+                kwargs=dict (item.get ("kwargs") or {}),
+                timeout=timeout,
+                result_ttl=rttl,
+                ttl=ttl,
+                failure_ttl=fttl,
+                meta=item.get ("meta"),
+            )
+            for item in items
+        ]
+
+        try:
+            with cls.connection ().pipeline () as pipeline:
+                enqueued = queue.enqueue_many (jobDatas, pipeline=pipeline)
+                pipeline.execute ()
+        except Exception:
+            # None of these jobs exists, release their keys or a retry would be dropped as a duplicate until they expire.
+            if claimedKeys:
+                try:
+                    cls.connection ().delete (*claimedKeys)
+                except Exception as e:
+                    logger.warning (f"Queue dedup release error: {e}")
+            raise
+        return enqueued
+
+    @classmethod
+    def dedupKey (cls, queueName: str, jobName: str, key: object) -> str:
+        """
+        Args:
+            cls
+            queueName (str)
+            jobName (str)
+            key (object)
+        Returns:
+            str
+        """
+        digest = hashlib.sha1 (str (key).encode ("utf-8")).hexdigest ()
+        return f"{cls.DEDUP_KEY_PREFIX}:{queueName}:{jobName}:{digest}"
+
     @classmethod
     def getJob (cls, jobId: str) -> Optional[Job]:
         """
@@ -116,6 +229,46 @@ class AppQueue:
             return job.get_status ()
         return None
 
+    @classmethod
+    def getJobMeta (cls, jobId: str) -> Dict[str, object]:
+        """
+        Args:
+            cls
+            jobId (str)
+        Returns:
+            Dict[str, object]
+        """
+        job = cls.getJob (jobId)
+        if job:
+            return job.get_meta (refresh=False) or {}
+        return {}
+
+    @classmethod
+    def currentJob (cls) -> Optional[Job]:
+        """
+        Args:
+            cls
+        Returns:
+            Optional[Job]
+        """
+        # The async worker runs many jobs in one thread, so rq's thread-local job stack cannot tell them apart.
+        return _app_queue_current_job.get () or get_current_job ()
+
+    @classmethod
+    def setJobProgress (cls, progress: Dict[str, object]) -> None:
+        """
+        Args:
+            cls
+            progress (Dict[str, object])
+        Returns:
+            None
+        """
+        job = cls.currentJob ()
+        if job is None:
+            return
+        job.meta["progress"] = progress
+        job.save_meta ()
+
     @classmethod
     def queue (cls, queueName: str = "default") -> Self:
         """
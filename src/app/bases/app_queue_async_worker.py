@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import signal
+import sys
+import traceback
+from typing import Dict, List, Optional, Tuple
+from rq import Queue, Worker
+from rq.exceptions import DequeueTimeout
+from rq.job import Job
+from rq.timeouts import JobTimeoutException
+from rq.utils import utcnow
+from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_queue import _app_queue_current_job
+from src.app.bases.app_webpush import AppWebpush
+
+logger = logging.getLogger (__name__)
+
+class AppQueueAsyncWorker (Worker):
+    """
+    AppQueueAsyncWorker (Worker)
+
+    Attributes:
+        concurrency (int)
+        prefetch (int)
+        pollTimeout (int)
+        _draining (bool)
+        _running (Dict[str, Job])
+    """
+    def __init__ (
+        self,
+        queues: List[Queue],
+        concurrency: int = 10,
+        prefetch: Optional[int] = None,
+        pollTimeout: int = 1,
+        **kwargs: object
+    ) -> None:
+        """
+        Args:
+            queues (List[Queue])
+            concurrency (int)
+            prefetch (Optional[int])
+            pollTimeout (int)
+            **kwargs (object)
+        Returns:
+            None
+        """
+        super ().__init__ (queues, **kwargs)
+        self.concurrency = max (1, concurrency)
+        self.prefetch = max (1, prefetch if prefetch is not None else self.concurrency)
+        self.pollTimeout = max (1, pollTimeout)
+        self._draining = False
+        self._running: Dict[str, Job] = {}
+
+    def work (self, burst: bool = False, logging_level: str = "INFO", max_jobs: Optional[int] = None, **kwargs: object) -> bool:
+        """
+        Args:
+            burst (bool)
+            logging_level (str)
+            max_jobs (Optional[int])
+            **kwargs (object)
+        Returns:
+            bool
+        """
+        self.bootstrap (logging_level)
+        try:
+            return asyncio.run (self.workAsync (burst, max_jobs))
+        finally:
+            self.teardown ()
+
+    def drain (self) -> None:
+        """
+        Returns:
+            None
+        """
+        if not self._draining:
+            self.log.info ("Worker %s: draining, waiting for running jobs to finish", self.key)
+        self._draining = True
+        self._stop_requested = True
+
+    async def workAsync (self, burst: bool = False, maxJobs: Optional[int] = None) -> bool:
+        """
+        Args:
+            burst (bool)
+            maxJobs (Optional[int])
+        Returns:
+            bool
+        """
+        loop = asyncio.get_running_loop ()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler (sig, self.drain)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        buffer: asyncio.Queue[Optional[Tuple[Job, Queue]]] = asyncio.Queue (maxsize=self.prefetch)
+        consumers = [asyncio.create_task (self.consume (buffer)) for _ in range (self.concurrency)]
+        heartbeats = asyncio.create_task (self.heartbeatForever ())
+        dispatched = 0
+
+        try:
+            while not self._draining:
+                if maxJobs is not None and dispatched >= maxJobs:
+                    self.log.info ("Worker %s: dispatched %d jobs, quitting", self.key, dispatched)
+                    break
+
+                await asyncio.to_thread (self.heartbeat)
+                if self.should_run_maintenance_tasks:
+                    await asyncio.to_thread (self.run_maintenance_tasks)
+
+                # Dequeue only once a buffer slot is free, so at most prefetch jobs wait locally while the others stay in Redis.
+                while buffer.full () and not self._draining:
+                    await asyncio.sleep (0.05)
+                if self._draining:
+                    break
+
+                result = await asyncio.to_thread (self.dequeueJob, None if burst else self.pollTimeout)
+                if result is None:
+                    if burst:
+                        self.log.info ("Worker %s: done, quitting", self.key)
+                        break
+                    continue
+
+                await buffer.put (result)
+                dispatched += 1
+        finally:
+            # Buffered jobs are already off the Redis list, so they run before the sentinels stop the consumers.
+            for _ in consumers:
+                await buffer.put (None)
+            await asyncio.gather (*consumers, return_exceptions=True)
+            heartbeats.cancel ()
+            await asyncio.gather (heartbeats, return_exceptions=True)
+            await AppWebpush.close ()
+            await AppDatabase.databasePostgresqlClose ()
+
+        return dispatched > 0
+
+    async def heartbeatForever (self) -> None:
+        """
+        Returns:
+            None
+        """
+        # The dispatch loop can sit on a full buffer or a blocking dequeue, so liveness is kept on its own schedule.
+        while True:
+            await asyncio.sleep (max (1, self.job_monitoring_interval))
+            try:
+                await asyncio.to_thread (self.maintainHeartbeats)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning (f"Async worker heartbeat error: {e}")
+
+    def maintainHeartbeats (self) -> None:
+        """
+        Returns:
+            None
+        """
+        jobs = list (self._running.values ())
+        now = utcnow ()
+        with self.connection.pipeline () as pipeline:
+            self.heartbeat (self.job_monitoring_interval + 60, pipeline=pipeline)
+            for job in jobs:
+                # Without a fresh score the started job registry cleanup takes a long job for an abandoned one.
+                ttl = self.job_monitoring_interval + 60
+                if job.timeout and job.timeout > 0 and job.started_at is not None:
+                    remaining = job.timeout - int ((now - job.started_at).total_seconds ())
+                    ttl = max (0, min (remaining, self.job_monitoring_interval)) + 60
+                job.heartbeat (now, ttl, pipeline=pipeline, xx=True)
+            results = pipeline.execute ()
+
+        # A job hash recreated by the heartbeat belongs to a job already deleted, as in rq's own maintain_heartbeats.
+        for index, job in enumerate (jobs):
+            if results[2 + 2 * index] == 1:
+                self.connection.delete (job.key)
+
+    def dequeueJob (self, timeout: Optional[int]) -> Optional[Tuple[Job, Queue]]:
+        """
+        Args:
+            timeout (Optional[int])
+        Returns:
+            Optional[Tuple[Job, Queue]]
+        """
+        try:
+            result = self.queue_class.dequeue_any (
+                self._ordered_queues,
+                timeout,
+                connection=self.connection,
+                job_class=self.job_class,
+                serializer=self.serializer,
+                death_penalty_class=self.death_penalty_class,
+            )
+        except DequeueTimeout:
+            return None
+        if not result:
+            return None
+
+        job, queue = result
+        job.redis_server_version = self.get_redis_server_version ()
+        self.log.info ("%s: %s", queue.name, job.id)
+        return job, queue
+
+    async def consume (self, buffer: "asyncio.Queue[Optional[Tuple[Job, Queue]]]") -> None:
+        """
+        Args:
+            buffer (asyncio.Queue[Optional[Tuple[Job, Queue]]])
+        Returns:
+            None
+        """
+        while True:
+            item = await buffer.get ()
+            if item is None:
+                return
+            job, queue = item
+            try:
+                await self.performJobAsync (job, queue)
+            except Exception as e:
+                logger.error (f"Async worker bookkeeping error for job {job.id}: {e}", exc_info=True)
+
+    async def performJobAsync (self, job: Job, queue: Queue) -> bool:
+        """
+        Args:
+            job (Job)
+            queue (Queue)
+        Returns:
+            bool
+        """
+        startedJobRegistry = queue.started_job_registry
+        await asyncio.to_thread (self.prepare_job_execution, job, len (self.queues) == 1)
+
+        token = _app_queue_current_job.set (job)
+        self._running[job.id] = job
+        try:
+            job.started_at = utcnow ()
+            timeout = job.timeout or self.queue_class.DEFAULT_TIMEOUT
+            try:
+                rv = await asyncio.wait_for (self.executeJob (job), timeout=timeout if timeout > 0 else None)
+            except asyncio.TimeoutError:
+                raise JobTimeoutException (f"Task exceeded maximum timeout value ({timeout} seconds)")
+            job.ended_at = utcnow ()
+            job._result = rv
+
+            await asyncio.to_thread (self.handle_job_success, job=job, queue=queue, started_job_registry=startedJobRegistry)
+        except Exception:
+            job.ended_at = utcnow ()
+            excInfo = sys.exc_info ()
+            excString = "".join (traceback.format_exception (*excInfo))
+            await asyncio.to_thread (
+                self.handle_job_failure,
+                job=job,
+                queue=queue,
+                started_job_registry=startedJobRegistry,
+                exc_string=excString,
+            )
+            self.handle_exception (job, *excInfo)
+            return False
+        finally:
+            self._running.pop (job.id, None)
+            _app_queue_current_job.reset (token)
+
+        self.log.info ("%s: Job OK (%s)", job.origin, job.id)
+        return True
+
+    async def executeJob (self, job: Job) -> object:
+        """
+        Args:
+            job (Job)
+        Returns:
+            object
+        """
+        if asyncio.iscoroutinefunction (job.func):
+            return await job.func (*job.args, **job.kwargs)
+
+        # Blocking handlers run on a thread; the context copy keeps AppQueue.currentJob pointing at this job.
+        result = await asyncio.to_thread (job.func, *job.args, **job.kwargs)
+        if asyncio.iscoroutine (result):
+            return await result
+        return result
@@ -77,15 +77,19 @@ class AppQueueProcessor:
     def startWorker (
         queueName: str,
         *queueNames: str,
-        max_jobs: Optional[int] = None,
-        default_worker_ttl: Optional[int] = None
+        default_worker_ttl: Optional[int] = None,
+        async_mode: bool = False,
+        concurrency: int = 10,
+        prefetch: Optional[int] = None
     ) -> Worker:
         """
         Args:
             queueName (str)
             *queueNames (str)
-            max_jobs (Optional[int])
             default_worker_ttl (Optional[int])
+            async_mode (bool)
+            concurrency (int)
+            prefetch (Optional[int])
         Returns:
             Worker
         """
@@ -96,11 +100,12 @@ class AppQueueProcessor:
             "connection": AppQueue.connection (),
         }
 
-        if max_jobs is not None:
-            worker_kwargs["max_jobs"] = max_jobs
-
         if default_worker_ttl is not None:
             worker_kwargs["default_worker_ttl"] = default_worker_ttl
 
+        if async_mode:
+            from src.app.bases.app_queue_async_worker import AppQueueAsyncWorker
+            return AppQueueAsyncWorker (queues, concurrency=concurrency, prefetch=prefetch, **worker_kwargs)
+
         worker = Worker (queues, **worker_kwargs)
         return worker
@@ -0,0 +1,425 @@
+import asyncio
+import logging
+import math
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.app.bases.app_context import AppContext
+from src.app.configs.rate_limit_config import RateLimitConfig
+
+logger = logging.getLogger (__name__)
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit"
+RATE_LIMIT_ALGORITHMS = ("gcra", "sliding")
+RATE_LIMIT_PRUNE_INTERVAL = 1.0
+
+_app_rate_limit_decision: ContextVar[Optional[Dict[str, "AppRateLimitDecision"]]] = ContextVar ("app_rate_limit_decision", default=None)
+
+# Advances the shared theoretical arrival time by what one process admitted since its last sync and returns it.
+RATE_LIMIT_GCRA_SCRIPT = """
+local now = tonumber (ARGV[1])
+local tat = tonumber (redis.call ("GET", KEYS[1]) or "0")
+if tat < now then
+    tat = now
+end
+tat = tat + tonumber (ARGV[2])
+redis.call ("SET", KEYS[1], tostring (tat), "PX", ARGV[3])
+return tostring (tat)
+"""
+
+class AppRateLimitDecision:
+    """
+    AppRateLimitDecision
+
+    Attributes:
+        allowed (bool)
+        limit (int)
+        remaining (int)
+        reset (float)
+        retryAfter (float)
+        period (int)
+    """
+    __slots__ = ("allowed", "limit", "remaining", "reset", "retryAfter", "period")
+
+    def __init__ (self, allowed: bool, limit: int, remaining: int, reset: float, retryAfter: float, period: int) -> None:
+        """
+        Args:
+            allowed (bool)
+            limit (int)
+            remaining (int)
+            reset (float)
+            retryAfter (float)
+            period (int)
+        Returns:
+            None
+        """
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.retryAfter = retryAfter
+        self.period = period
+
+    def headers (self) -> Dict[str, str]:
+        """
+        Returns:
+            Dict[str, str]
+        """
+        headers = {
+            "RateLimit-Limit": str (self.limit),
+            "RateLimit-Remaining": str (self.remaining),
+            "RateLimit-Reset": str (math.ceil (self.reset)),
+            "RateLimit-Policy": f"{self.limit};w={self.period}",
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str (max (1, math.ceil (self.retryAfter)))
+        return headers
+
+class AppRateLimitBucket:
+    """
+    AppRateLimitBucket
+
+    Attributes:
+        key (str)
+        limit (int)
+        period (int)
+        algorithm (str)
+        touchedAt (float)
+        tat (float)
+        window (int)
+        current (int)
+        previous (int)
+        pending (Dict[int, int])
+    """
+    def __init__ (self, key: str, limit: int, period: int, algorithm: str) -> None:
+        """
+        Args:
+            key (str)
+            limit (int)
+            period (int)
+            algorithm (str)
+        Returns:
+            None
+        """
+        self.key = key
+        self.limit = max (1, limit)
+        self.period = max (1, period)
+        self.algorithm = algorithm
+        self.touchedAt = 0.0
+        self.tat = 0.0
+        self.window = 0
+        self.current = 0
+        self.previous = 0
+        # Admissions not yet pushed to Redis, per window for the sliding counter and under 0 for GCRA.
+        self.pending: Dict[int, int] = {}
+
+    def hit (self, now: float) -> AppRateLimitDecision:
+        """
+        Args:
+            now (float)
+        Returns:
+            AppRateLimitDecision
+        """
+        self.touchedAt = now
+        if self.algorithm == "sliding":
+            return self.hitSliding (now)
+        return self.hitGcra (now)
+
+    def hitGcra (self, now: float) -> AppRateLimitDecision:
+        """
+        Args:
+            now (float)
+        Returns:
+            AppRateLimitDecision
+        """
+        interval = self.period / self.limit
+        # Each admission pushes the theoretical arrival time one emission interval ahead, a burst may run a full period ahead.
+        tat = max (self.tat, now) + interval
+        allowAt = tat - self.period
+        if allowAt > now:
+            return AppRateLimitDecision (False, self.limit, 0, max (self.tat, now) - now, allowAt - now, self.period)
+
+        self.tat = tat
+        self.pending[0] = self.pending.get (0, 0) + 1
+        remaining = int ((self.period - (tat - now)) // interval)
+        return AppRateLimitDecision (True, self.limit, max (0, remaining), tat - now, 0.0, self.period)
+
+    def roll (self, window: int) -> None:
+        """
+        Args:
+            window (int)
+        Returns:
+            None
+        """
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
+        # Windows before the previous one no longer weigh in, without Redis nothing else would drop them.
+        self.pending = {pendingWindow: count for pendingWindow, count in self.pending.items () if pendingWindow >= window - 1}
+
+    def hitSliding (self, now: float) -> AppRateLimitDecision:
+        """
+        Args:
+            now (float)
+        Returns:
+            AppRateLimitDecision
+        """
+        window = int (now // self.period)
+        self.roll (window)
+        elapsed = (now % self.period) / self.period
+        previous = self.previous + self.pending.get (window - 1, 0)
+        current = self.current + self.pending.get (window, 0)
+        # The previous window weighs in by how much of it still overlaps the trailing period.
+        estimate = previous * (1 - elapsed) + current
+        reset = self.period - (now % self.period)
+
+        if estimate + 1 > self.limit:
+            if previous > 0 and current + 1 <= self.limit:
+                retryAfter = ((1 - (self.limit - 1 - current) / previous) - elapsed) * self.period
+            else:
+                retryAfter = reset
+            return AppRateLimitDecision (False, self.limit, 0, reset, max (retryAfter, 0.001), self.period)
+
+        self.pending[window] = self.pending.get (window, 0) + 1
+        return AppRateLimitDecision (True, self.limit, max (0, int (self.limit - estimate - 1)), reset, 0.0, self.period)
+
+class AppRateLimiter:
+    """
+    AppRateLimiter
+
+    Attributes:
+        _buckets (Dict[str, AppRateLimitBucket])
+        _dirty (Dict[str, AppRateLimitBucket])
+        _syncer (Optional[asyncio.Task])
+        _loop (Optional[asyncio.AbstractEventLoop])
+        _prunedAt (float)
+    """
+    _buckets: Dict[str, AppRateLimitBucket] = {}
+    _dirty: Dict[str, AppRateLimitBucket] = {}
+    _syncer: Optional[asyncio.Task] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _prunedAt: float = 0.0
+
+    @classmethod
+    def config (cls) -> RateLimitConfig:
+        """
+        Args:
+            cls
+        Returns:
+            RateLimitConfig
+        """
+        return RateLimitConfig.config ()
+
+    @classmethod
+    def bindLoop (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        # The sync task belongs to one event loop, a new loop keeps the buckets and starts its own task.
+        loop = asyncio.get_running_loop ()
+        if cls._loop is not loop:
+            cls._loop = loop
+            cls._syncer = None
+        if cls._syncer is None and AppContext.cacheRedis () is not None:
+            cls._syncer = loop.create_task (cls.syncForever ())
+
+    @classmethod
+    def hit (cls, key: str, limit: int, period: int, algorithm: Optional[str] = None) -> AppRateLimitDecision:
+        """
+        Args:
+            cls
+            key (str)
+            limit (int)
+            period (int)
+            algorithm (Optional[str])
+        Returns:
+            AppRateLimitDecision
+        """
+        algorithm = algorithm or cls.config ().rate_limit_algorithm
+        if algorithm not in RATE_LIMIT_ALGORITHMS:
+            raise ValueError (f"Unknown rate limit algorithm: {algorithm}")
+
+        now = time.time ()
+        if now - cls._prunedAt >= RATE_LIMIT_PRUNE_INTERVAL:
+            cls.prune (now)
+
+        bucketKey = f"{algorithm}:{limit}:{period}:{key}"
+        bucket = cls._buckets.get (bucketKey)
+        if bucket is None:
+            bucket = AppRateLimitBucket (bucketKey, limit, period, algorithm)
+            cls._buckets[bucketKey] = bucket
+        decision = bucket.hit (now)
+        # Without a sync task nothing would ever drain the dirty set, so only track what Redis will receive.
+        if cls._syncer is not None:
+            cls._dirty[bucketKey] = bucket
+        return decision
+
+    @classmethod
+    def prune (cls, now: float) -> None:
+        """
+        Args:
+            cls
+            now (float)
+        Returns:
+            None
+        """
+        cls._prunedAt = now
+        # Buckets idle for two periods hold nothing Redis does not, dropping them bounds memory with or without Redis.
+        for bucketKey, bucket in list (cls._buckets.items ()):
+            if bucketKey not in cls._dirty and now - bucket.touchedAt > 2 * bucket.period:
+                del cls._buckets[bucketKey]
+
+    @classmethod
+    async def syncForever (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        while True:
+            await asyncio.sleep (max (0.05, cls.config ().rate_limit_sync_interval))
+            try:
+                await cls.sync ()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning (f"Rate limit sync error: {e}")
+
+    @classmethod
+    async def sync (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        now = time.time ()
+        cacheRedis = AppContext.cacheRedis ()
+        if cacheRedis is None or not cls._dirty:
+            cls._dirty = {}
+            return
+
+        # Snapshot and clear before the round trip, admissions made while it is in flight stay pending for the next one.
+        batch: List[Tuple[AppRateLimitBucket, Dict[int, int], int]] = []
+        for bucket in cls._dirty.values ():
+            batch.append ((bucket, bucket.pending, bucket.window))
+            bucket.pending = {}
+        cls._dirty = {}
+
+        pipeline = cacheRedis.pipeline (transaction=False)
+        for bucket, pending, window in batch:
+            redisKey = f"{RATE_LIMIT_KEY_PREFIX}:{bucket.key}"
+            if bucket.algorithm == "gcra":
+                increment = pending.get (0, 0) * (bucket.period / bucket.limit)
+                pipeline.eval (RATE_LIMIT_GCRA_SCRIPT, 1, redisKey, now, increment, bucket.period * 1000)
+            else:
+                for pendingWindow, count in pending.items ():
+                    pipeline.incrby (f"{redisKey}:{pendingWindow}", count)
+                    pipeline.expire (f"{redisKey}:{pendingWindow}", bucket.period * 2)
+                pipeline.get (f"{redisKey}:{window}")
+                pipeline.get (f"{redisKey}:{window - 1}")
+
+        try:
+            results = await pipeline.execute ()
+        except Exception:
+            # Nothing reached Redis, fold the snapshot back so the next sync pushes it again.
+            for bucket, pending, window in batch:
+                for pendingWindow, count in pending.items ():
+                    bucket.pending[pendingWindow] = bucket.pending.get (pendingWindow, 0) + count
+                cls._dirty[bucket.key] = bucket
+            raise
+
+        index = 0
+        for bucket, pending, window in batch:
+            if bucket.algorithm == "gcra":
+                sharedTat = float (results[index])
+                index += 1
+                # Local admissions made during the round trip are not in the shared value yet.
+                bucket.tat = sharedTat + bucket.pending.get (0, 0) * (bucket.period / bucket.limit)
+            else:
+                index += 2 * len (pending)
+                current, previous = results[index], results[index + 1]
+                index += 2
+                if bucket.window == window:
+                    bucket.current = int (current or 0)
+                    bucket.previous = int (previous or 0)
+                elif bucket.window == window + 1:
+                    bucket.previous = int (current or 0)
+
+    @classmethod
+    def remember (cls, decision: AppRateLimitDecision) -> None:
+        """
+        Args:
+            cls
+            decision (AppRateLimitDecision)
+        Returns:
+            None
+        """
+        holder = _app_rate_limit_decision.get ()
+        if holder is None:
+            return
+        # With several limits on one route the tightest one is what the client should see.
+        previous = holder.get ("decision")
+        if previous is None or decision.remaining < previous.remaining:
+            holder["decision"] = decision
+
+class AppRateLimitMiddleware:
+    """
+    AppRateLimitMiddleware
+
+    Attributes:
+        app (ASGIApp)
+    """
+    def __init__ (self, app: ASGIApp) -> None:
+        """
+        Args:
+            app (ASGIApp)
+        Returns:
+            None
+        """
+        self.app = app
+
+    async def __call__ (self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Args:
+            scope (Scope)
+            receive (Receive)
+            send (Send)
+        Returns:
+            None
+        """
+        if scope["type"] != "http":
+            await self.app (scope, receive, send)
+            return
+
+        holder: Dict[str, AppRateLimitDecision] = {}
+        token = _app_rate_limit_decision.set (holder)
+
+        async def sendMessage (message: Message) -> None:
+            """
+            Args:
+                message (Message)
+            Returns:
+                None
+            """
+            # Added on the way out so endpoints returning their own Response, cached ones included, carry them too.
+            decision = holder.get ("decision")
+            if message["type"] == "http.response.start" and decision is not None:
+                headers = MutableHeaders (scope=message)
+                for name, value in decision.headers ().items ():
+                    if name not in headers:
+                        headers[name] = value
+            await send (message)
+
+        try:
+            await self.app (scope, receive, sendMessage)
+        finally:
+            _app_rate_limit_decision.reset (token)
@@ -1,3 +1,6 @@
+import asyncio
+from typing import Iterable
+
 def userRoom (userId: str) -> str:
     """
     Args:
@@ -23,3 +26,23 @@ async def emitToUser (userId: str, event: str, payload: dict) -> None:
 
     socketioServer = getSocketIOServer ()
     await socketioServer.emit (event, payload, room=userRoom (userId))
+
+async def emitToUsers (userIds: Iterable[str], event: str, payload: dict, batchSize: int = 500) -> None:
+    """
+    Args:
+        userIds (Iterable[str])
+        event (str)
+        payload (dict)
+        batchSize (int)
+    Returns:
+        None
+    """
+    from src.app.routes.app_ws_router import getSocketIOServer
+
+    socketioServer = getSocketIOServer ()
+    rooms = [userRoom (userId) for userId in userIds if userId]
+    for index in range (0, len (rooms), batchSize):
+        await asyncio.gather (*[
+            socketioServer.emit (event, payload, room=room)
+            for room in rooms[index:index + batchSize]
+        ], return_exceptions=True)
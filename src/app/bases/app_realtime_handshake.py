@@ -0,0 +1,89 @@
+import time
+from typing import Dict
+from src.app.configs.auth_config import AuthConfig
+
+REALTIME_HANDSHAKE_OUTCOMES = ("accepted", "denied", "failed")
+
+class AppRealtimeHandshake:
+    """
+    AppRealtimeHandshake
+
+    Attributes:
+        _inFlight (int)
+        _throttled (int)
+        _metrics (Dict[str, Dict[str, float]])
+    """
+    _inFlight: int = 0
+    _throttled: int = 0
+    _metrics: Dict[str, Dict[str, float]] = {
+        outcome: {"count": 0, "duration_total": 0.0, "duration_max": 0.0, "duration_last": 0.0}
+        for outcome in REALTIME_HANDSHAKE_OUTCOMES
+    }
+
+    @classmethod
+    def capacity (cls) -> int:
+        """
+        Args:
+            cls
+        Returns:
+            int
+        """
+        return AuthConfig.config ().auth_ws_handshake_limit
+
+    @classmethod
+    def admit (cls) -> bool:
+        """
+        Args:
+            cls
+        Returns:
+            bool
+        """
+        # Handshakes all run on the event loop, so the counter needs no lock, only a cap so a reconnect storm queues at the client.
+        capacity = cls.capacity ()
+        if capacity > 0 and cls._inFlight >= capacity:
+            cls._throttled += 1
+            return False
+        cls._inFlight += 1
+        return True
+
+    @classmethod
+    def release (cls, outcome: str, started: float) -> None:
+        """
+        Args:
+            cls
+            outcome (str)
+            started (float)
+        Returns:
+            None
+        """
+        cls._inFlight -= 1
+        duration = time.perf_counter () - started
+        metric = cls._metrics[outcome]
+        metric["count"] += 1
+        metric["duration_total"] += duration
+        metric["duration_last"] = duration
+        if duration > metric["duration_max"]:
+            metric["duration_max"] = duration
+
+    @classmethod
+    def stats (cls) -> Dict[str, object]:
+        """
+        Args:
+            cls
+        Returns:
+            Dict[str, object]
+        """
+        stats: Dict[str, object] = {
+            "capacity": cls.capacity (),
+            "in_flight": cls._inFlight,
+            "throttled": cls._throttled,
+        }
+        for outcome, metric in cls._metrics.items ():
+            count = metric["count"]
+            stats[outcome] = {
+                "count": int (count),
+                "duration_ms_last": round (metric["duration_last"] * 1000, 3),
+                "duration_ms_max": round (metric["duration_max"] * 1000, 3),
+                "duration_ms_avg": round ((metric["duration_total"] / count) * 1000, 3) if count else 0.0,
+            }
+        return stats
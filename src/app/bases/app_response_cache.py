@@ -0,0 +1,334 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from ulid import ULID
+from src.app.bases.app_context import AppContext
+from src.app.bases.app_database_unit_of_work import afterCommit
+from src.app.configs.cache_config import CacheConfig
+
+logger = logging.getLogger (__name__)
+
+RESPONSE_KEY_PREFIX = "response"
+RESPONSE_TAG_KEY_PREFIX = f"{RESPONSE_KEY_PREFIX}:tag"
+RESPONSE_LOCK_KEY_PREFIX = f"{RESPONSE_KEY_PREFIX}:lock"
+RESPONSE_REQUEST_PARAM = "_response_cache_request"
+RESPONSE_SCOPES = ("user", "private", "public")
+
+# Only the holder that still owns the token may release the lock, a slow producer must not drop a successor's lock.
+RESPONSE_UNLOCK_SCRIPT = """
+if redis.call ("GET", KEYS[1]) == ARGV[1] then
+    return redis.call ("DEL", KEYS[1])
+end
+return 0
+"""
+
+_inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+class AppResponseCache:
+    """
+    AppResponseCache
+    """
+    @staticmethod
+    def config () -> CacheConfig:
+        """
+        Returns:
+            CacheConfig
+        """
+        return CacheConfig.config ()
+
+    @staticmethod
+    def etag (body: str) -> str:
+        """
+        Args:
+            body (str)
+        Returns:
+            str
+        """
+        return '"' + hashlib.sha1 (body.encode ("utf-8")).hexdigest () + '"'
+
+    @staticmethod
+    def encode (value: object) -> str:
+        """
+        Args:
+            value (object)
+        Returns:
+            str
+        """
+        return json.dumps (jsonable_encoder (value), ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+    @staticmethod
+    def tagKey (tag: str) -> str:
+        """
+        Args:
+            tag (str)
+        Returns:
+            str
+        """
+        return f"{RESPONSE_TAG_KEY_PREFIX}:{tag}"
+
+    @staticmethod
+    async def key (namespace: str, scopeId: str, fingerprint: str, tags: Sequence[str]) -> str:
+        """
+        Args:
+            namespace (str)
+            scopeId (str)
+            fingerprint (str)
+            tags (Sequence[str])
+        Returns:
+            str
+        """
+        # Tags are versioned instead of indexed, invalidation bumps a counter and the old entries age out on their TTL.
+        versions: List[Optional[str]] = []
+        if tags:
+            versions = await AppContext.cacheRedis ().mget ([AppResponseCache.tagKey (tag) for tag in tags])
+        stamp = "|".join (f"{tag}={version or 0}" for tag, version in zip (tags, versions))
+        digest = hashlib.sha1 (f"{fingerprint}|{stamp}".encode ("utf-8")).hexdigest ()
+        return f"{RESPONSE_KEY_PREFIX}:{namespace}:{scopeId}:{digest}"
+
+    @staticmethod
+    async def remember (
+        namespace: str,
+        scopeId: str,
+        fingerprint: str,
+        tags: Sequence[str],
+        ttl: int,
+        producer: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Args:
+            namespace (str)
+            scopeId (str)
+            fingerprint (str)
+            tags (Sequence[str])
+            ttl (int)
+            producer (Callable[[], Awaitable[str]])
+        Returns:
+            str
+        """
+        cache = AppContext.cacheRedis ()
+        if cache is None or ttl <= 0 or not AppResponseCache.config ().response_cache_enabled:
+            return await producer ()
+
+        try:
+            key = await AppResponseCache.key (namespace, scopeId, fingerprint, tags)
+            cached = await cache.get (key)
+        except Exception as e:
+            logger.warning (f"Response cache read error: {e}")
+            return await producer ()
+        if cached is not None:
+            return cached
+
+        # Concurrent misses inside this process share one producer call.
+        inflight = _inflight.get (key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield (inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled ():
+                    raise
+            # The request that owned the producer went away, this one produces for itself.
+            return await producer ()
+
+        future: "asyncio.Future[str]" = asyncio.get_running_loop ().create_future ()
+        _inflight[key] = future
+        try:
+            body = await AppResponseCache.fill (key, ttl, producer)
+            future.set_result (body)
+            return body
+        except asyncio.CancelledError:
+            future.cancel ()
+            raise
+        except Exception as e:
+            future.set_exception (e)
+            # Waiters re-raise it; mark it retrieved so a lone miss does not log an unretrieved exception.
+            future.exception ()
+            raise
+        finally:
+            _inflight.pop (key, None)
+
+    @staticmethod
+    async def fill (key: str, ttl: int, producer: Callable[[], Awaitable[str]]) -> str:
+        """
+        Args:
+            key (str)
+            ttl (int)
+            producer (Callable[[], Awaitable[str]])
+        Returns:
+            str
+        """
+        cache = AppContext.cacheRedis ()
+        lockTimeout = AppResponseCache.config ().response_cache_lock_timeout
+        lockKey = f"{RESPONSE_LOCK_KEY_PREFIX}:{key}"
+        token = str (ULID ())
+
+        acquired = False
+        try:
+            acquired = bool (await cache.set (lockKey, token, nx=True, px=int (lockTimeout * 1000)))
+            if not acquired:
+                # Another process is producing the same entry, wait for it rather than stampede the database.
+                deadline = time.monotonic () + lockTimeout
+                delay = 0.025
+                while time.monotonic () < deadline:
+                    await asyncio.sleep (delay)
+                    cached = await cache.get (key)
+                    if cached is not None:
+                        return cached
+                    delay = min (delay * 2, 0.2)
+        except Exception as e:
+            logger.warning (f"Response cache lock error: {e}")
+
+        try:
+            body = await producer ()
+            try:
+                await cache.set (key, body, ex=ttl)
+            except Exception as e:
+                logger.warning (f"Response cache write error: {e}")
+            return body
+        finally:
+            if acquired:
+                try:
+                    await cache.eval (RESPONSE_UNLOCK_SCRIPT, 1, lockKey, token)
+                except Exception as e:
+                    logger.warning (f"Response cache unlock error: {e}")
+
+    @staticmethod
+    async def invalidate (*tags: str) -> None:
+        """
+        Args:
+            *tags (str)
+        Returns:
+            None
+        """
+        if not tags:
+            return
+
+        # Bumped after commit, otherwise a read landing before it would cache the old body under the new version.
+        async def bump () -> None:
+            """
+            Returns:
+                None
+            """
+            cache = AppContext.cacheRedis ()
+            if cache is None:
+                return
+            try:
+                pipeline = cache.pipeline (transaction=False)
+                for tag in tags:
+                    pipeline.incr (AppResponseCache.tagKey (tag))
+                await pipeline.execute ()
+            except Exception as e:
+                logger.warning (f"Response cache invalidate error: {e}")
+
+        await afterCommit (bump)
+
+    @staticmethod
+    def notModified (request: Request, etag: str) -> bool:
+        """
+        Args:
+            request (Request)
+            etag (str)
+        Returns:
+            bool
+        """
+        header = request.headers.get ("if-none-match")
+        if not header:
+            return False
+        candidates = [candidate.strip () for candidate in header.split (",")]
+        # If-None-Match uses the weak comparison, so W/ prefixes added by proxies still match.
+        return "*" in candidates or etag in [candidate.removeprefix ("W/") for candidate in candidates]
+
+    @staticmethod
+    def respond (request: Request, body: str, scope: str, ttl: int) -> Response:
+        """
+        Args:
+            request (Request)
+            body (str)
+            scope (str)
+            ttl (int)
+        Returns:
+            Response
+        """
+        etag = AppResponseCache.etag (body)
+        headers = {"ETag": etag}
+        # A private body may be shared server side, but only an authenticated client may keep it.
+        if scope != "public":
+            headers["Cache-Control"] = "private, no-cache"
+            headers["Vary"] = "Authorization"
+        else:
+            headers["Cache-Control"] = f"public, max-age={ttl}"
+
+        if AppResponseCache.notModified (request, etag):
+            return Response (status_code=304, headers=headers)
+        return Response (content=body, media_type="application/json", headers=headers)
+
+def cacheResponse (
+    ttl: Optional[int] = None,
+    scope: str = "user",
+    tags: Sequence[str] = (),
+    namespace: Optional[str] = None
+) -> Callable[[Callable[..., Awaitable[object]]], Callable[..., Awaitable[Response]]]:
+    """
+    Args:
+        ttl (Optional[int])
+        scope (str)
+        tags (Sequence[str])
+        namespace (Optional[str])
+    Returns:
+        Callable[[Callable[..., Awaitable[object]]], Callable[..., Awaitable[Response]]]
+    """
+    if scope not in RESPONSE_SCOPES:
+        raise ValueError (f"Unknown response cache scope: {scope}")
+
+    def decorator (endpoint: Callable[..., Awaitable[object]]) -> Callable[..., Awaitable[Response]]:
+        """
+        Args:
+            endpoint (Callable[..., Awaitable[object]])
+        Returns:
+            Callable[..., Awaitable[Response]]
+        """
+        signature = inspect.signature (endpoint)
+        if scope == "user" and "current_user" not in signature.parameters:
+            raise ValueError (f"{endpoint.__name__} needs a current_user parameter for a user scoped response cache")
+
+        cacheNamespace = namespace or f"{endpoint.__module__}.{endpoint.__name__}"
+
+        @functools.wraps (endpoint)
+        async def wrapper (*args: object, **kwargs: object) -> Response:
+            """
+            Args:
+                *args (object)
+                **kwargs (object)
+            Returns:
+                Response
+            """
+            request: Request = kwargs.pop (RESPONSE_REQUEST_PARAM)
+            scopeId = str (kwargs["current_user"].id) if scope == "user" else scope
+            resolvedTags = [tag.format (user=scopeId, **request.path_params) for tag in tags]
+            fingerprint = f"{request.url.path}?{sorted (request.query_params.multi_items ())}"
+            cacheTtl = ttl if ttl is not None else AppResponseCache.config ().response_cache_ttl
+
+            async def produce () -> str:
+                """
+                Returns:
+                    str
+                """
+                return AppResponseCache.encode (await endpoint (*args, **kwargs))
+
+            body = await AppResponseCache.remember (cacheNamespace, scopeId, fingerprint, resolvedTags, cacheTtl, produce)
+            return AppResponseCache.respond (request, body, scope, cacheTtl)
+
+        # FastAPI reads the signature to resolve dependencies, the request rides along as an extra keyword-only parameter.
+        wrapper.__signature__ = signature.replace (parameters=[
+            *signature.parameters.values (),
+            inspect.Parameter (RESPONSE_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
+        return wrapper
+
+    return decorator
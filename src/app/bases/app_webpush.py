@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import httpx
+from py_vapid import Vapid, Vapid01
+from pywebpush import WebPusher
+from src.app.configs.webpush_config import WebpushConfig
+
+logger = logging.getLogger (__name__)
+
+class AppWebpush:
+    """
+    AppWebpush
+
+    Attributes:
+        _vapid (Optional[Vapid01])
+        _vapid_headers (Dict[str, Tuple[float, Dict[str, str]]])
+        _clients (Dict[str, httpx.AsyncClient])
+        _semaphore (Optional[asyncio.Semaphore])
+        _loop (Optional[asyncio.AbstractEventLoop])
+    """
+    _vapid: Optional[Vapid01] = None
+    _vapid_headers: Dict[str, Tuple[float, Dict[str, str]]] = {}
+    _clients: Dict[str, httpx.AsyncClient] = {}
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    VAPID_EXPIRATION = 12 * 60 * 60
+    VAPID_RENEW_BEFORE = 60 * 60
+    GONE_STATUSES = (404, 410)
+
+    @classmethod
+    def config (cls) -> WebpushConfig:
+        """
+        Args:
+            cls
+        Returns:
+            WebpushConfig
+        """
+        return WebpushConfig.config ()
+
+    @classmethod
+    def bindLoop (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        # Pooled clients and the semaphore belong to one event loop, queue jobs outside the async worker each get a fresh loop.
+        loop = asyncio.get_running_loop ()
+        if cls._loop is loop:
+            return
+        cls._loop = loop
+        cls._clients = {}
+        cls._semaphore = asyncio.Semaphore (max (1, cls.config ().webpush_concurrency))
+
+    @classmethod
+    def vapid (cls) -> Vapid01:
+        """
+        Args:
+            cls
+        Returns:
+            Vapid01
+        """
+        if cls._vapid is None:
+            privateKey = cls.config ().vapid_private_key
+            if os.path.isfile (privateKey):
+                cls._vapid = Vapid.from_file (private_key_file=privateKey)
+            else:
+                cls._vapid = Vapid.from_string (private_key=privateKey)
+        return cls._vapid
+
+    @classmethod
+    def vapidHeaders (cls, audience: str, subject: str) -> Dict[str, str]:
+        """
+        Args:
+            cls
+            audience (str)
+            subject (str)
+        Returns:
+            Dict[str, str]
+        """
+        now = time.time ()
+        cached = cls._vapid_headers.get (audience)
+        if cached is not None and cached[0] - cls.VAPID_RENEW_BEFORE > now:
+            return cached[1]
+
+        expiresAt = int (now) + cls.VAPID_EXPIRATION
+        headers = cls.vapid ().sign ({"aud": audience, "sub": subject, "exp": expiresAt})
+        cls._vapid_headers[audience] = (expiresAt, headers)
+        return headers
+
+    @classmethod
+    def client (cls, origin: str) -> httpx.AsyncClient:
+        """
+        Args:
+            cls
+            origin (str)
+        Returns:
+            httpx.AsyncClient
+        """
+        client = cls._clients.get (origin)
+        if client is None:
+            config = cls.config ()
+            client = httpx.AsyncClient (
+                timeout=config.webpush_timeout,
+                limits=httpx.Limits (
+                    max_connections=config.webpush_pool_size_per_host,
+                    max_keepalive_connections=config.webpush_pool_size_per_host,
+                ),
+            )
+            cls._clients[origin] = client
+        return client
+
+    @staticmethod
+    def encrypt (subscriptionInfo: Dict[str, object], data: bytes, contentEncoding: str) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Args:
+            subscriptionInfo (Dict[str, object])
+            data (bytes)
+            contentEncoding (str)
+        Returns:
+            Tuple[bytes, Dict[str, str]]
+        """
+        encoded = WebPusher (subscriptionInfo).encode (data, contentEncoding)
+        headers = {"content-encoding": contentEncoding}
+        if "crypto_key" in encoded:
+            headers["crypto-key"] = "dh=" + encoded["crypto_key"].decode ("utf8")
+        if "salt" in encoded:
+            headers["encryption"] = "salt=" + encoded["salt"].decode ("utf8")
+        return encoded["body"], headers
+
+    @classmethod
+    async def send (
+        cls,
+        subscriptionInfo: Dict[str, object],
+        data: bytes,
+        subject: str,
+        contentEncoding: str = "aes128gcm"
+    ) -> Optional[int]:
+        """
+        Args:
+            cls
+            subscriptionInfo (Dict[str, object])
+            data (bytes)
+            subject (str)
+            contentEncoding (str)
+        Returns:
+            Optional[int]
+        """
+        cls.bindLoop ()
+        endpoint = str (subscriptionInfo.get ("endpoint"))
+        url = urlparse (endpoint)
+        origin = f"{url.scheme}://{url.netloc}"
+
+        async with cls._semaphore:
+            try:
+                # ECDH and AES-GCM are CPU work, keep them off the event loop.
+                body, headers = await asyncio.to_thread (cls.encrypt, subscriptionInfo, data, contentEncoding)
+                headers.update (cls.vapidHeaders (origin, subject))
+                headers["ttl"] = str (cls.config ().webpush_ttl)
+                response = await cls.client (origin).post (endpoint, content=body, headers=headers)
+            except Exception as error:
+                logger.warning ("Web push failed for %s: %s", origin, error)
+                return None
+
+        if response.status_code > 202 and response.status_code not in cls.GONE_STATUSES:
+            logger.warning ("Web push failed for %s: %s %s", origin, response.status_code, response.text)
+        return response.status_code
+
+    @classmethod
+    async def sendMany (cls, messages: List[Tuple[Dict[str, object], bytes, str]], subject: str) -> List[Optional[int]]:
+        """
+        Args:
+            cls
+            messages (List[Tuple[Dict[str, object], bytes, str]])
+            subject (str)
+        Returns:
+            List[Optional[int]]
+        """
+        return list (await asyncio.gather (*[
+            cls.send (subscriptionInfo, data, subject, contentEncoding)
+            for subscriptionInfo, data, contentEncoding in messages
+        ]))
+
+    @classmethod
+    async def close (cls) -> None:
+        """
+        Args:
+            cls
+        Returns:
+            None
+        """
+        clients = list (cls._clients.values ())
+        cls._clients = {}
+        for client in clients:
+            try:
+                await client.aclose ()
+            except Exception:
+                pass
@@ -11,6 +11,22 @@ class AuthConfig (AppConfig):
         jwt_refresh_token_expire_days (int)
         jwt_issuer (str)
         jwt_audience (str)
+        auth_principal_ttl (int)
+        auth_principal_local_ttl (int)
+        auth_principal_local_size (int)
+        auth_acl_ttl (int)
+        auth_acl_local_ttl (int)
+        auth_hash_process_workers (int)
+        auth_hash_workers (int)
+        auth_hash_queue_limit (int)
+        auth_hash_algorithm (str)
+        auth_hash_bcrypt_rounds (int)
+        auth_hash_argon2_time_cost (int)
+        auth_hash_argon2_memory_cost (int)
+        auth_hash_argon2_parallelism (int)
+        auth_token_cache_size (int)
+        auth_token_revocation_sync (bool)
+        auth_ws_handshake_limit (int)
     """
     jwt_secret: str = ""
     jwt_algorithm: str = "HS256"
@@ -19,6 +35,22 @@ class AuthConfig (AppConfig):
     jwt_session_refresh_token_expire_days: int = 1
     jwt_issuer: str = ""
     jwt_audience: str = ""
+    auth_principal_ttl: int = 60
+    auth_principal_local_ttl: int = 5
+    auth_principal_local_size: int = 10000
+    auth_acl_ttl: int = 3600
+    auth_acl_local_ttl: int = 5
+    auth_hash_process_workers: int = 0
+    auth_hash_workers: int = 0
+    auth_hash_queue_limit: int = 32
+    auth_hash_algorithm: str = "bcrypt"
+    auth_hash_bcrypt_rounds: int = 12
+    auth_hash_argon2_time_cost: int = 3
+    auth_hash_argon2_memory_cost: int = 65536
+    auth_hash_argon2_parallelism: int = 4
+    auth_token_cache_size: int = 10000
+    auth_token_revocation_sync: bool = True
+    auth_ws_handshake_limit: int = 256
 
     def jwtSecret (self) -> str:
         """
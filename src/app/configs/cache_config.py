@@ -10,12 +10,20 @@ class CacheConfig (AppConfig):
         memory_redis_username (str)
         memory_redis_password (str)
         memory_redis_database (int)
+        notification_unread_ttl (int)
+        response_cache_enabled (bool)
+        response_cache_ttl (int)
+        response_cache_lock_timeout (float)
     """
     memory_redis_host: str = ""
     memory_redis_port: int = 0
     memory_redis_username: str = ""
     memory_redis_password: str = ""
     memory_redis_database: int = 0
+    notification_unread_ttl: int = 86400
+    response_cache_enabled: bool = True
+    response_cache_ttl: int = 60
+    response_cache_lock_timeout: float = 5.0
 
     def redis_uri (self) -> str:
         """
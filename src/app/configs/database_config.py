@@ -1,3 +1,4 @@
+from typing import Dict
 from src.app.bases.app_config import AppConfig
 
 class DatabaseConfig (AppConfig):
@@ -6,10 +7,28 @@ class DatabaseConfig (AppConfig):
 
     Attributes:
         database_postgre_uri (str)
+        database_postgre_pool_size (int)
+        database_postgre_pool_max_overflow (int)
+        database_postgre_pool_timeout (int)
+        database_postgre_pool_recycle (int)
+        database_postgre_pool_pre_ping (bool)
+        database_postgre_statement_timeout (int)
+        database_postgre_echo (bool)
         database_mongo_uri (str)
+        database_count_strategy (str)
+        database_count_ttl (int)
     """
     database_postgre_uri: str = ""
+    database_postgre_pool_size: int = 5
+    database_postgre_pool_max_overflow: int = 10
+    database_postgre_pool_timeout: int = 30
+    database_postgre_pool_recycle: int = 1800
+    database_postgre_pool_pre_ping: bool = True
+    database_postgre_statement_timeout: int = 0
+    database_postgre_echo: bool = False
     database_mongo_uri: str = ""
+    database_count_strategy: str = "exact"
+    database_count_ttl: int = 60
 
     def postgre_uri (self) -> str:
         """
@@ -22,6 +41,60 @@ class DatabaseConfig (AppConfig):
             raise ValueError ("DATABASE_POSTGRE_URI is required")
         return self.database_postgre_uri
 
+    def postgre_async_uri (self) -> str:
+        """
+        Args:
+            self
+        Returns:
+            str
+        """
+        scheme, separator, rest = self.postgre_uri ().partition ("://")
+        if scheme.split ("+")[0] not in ("postgres", "postgresql"):
+            raise ValueError ("DATABASE_POSTGRE_URI must be a postgresql uri")
+        return f"postgresql+asyncpg{separator}{rest}"
+
+    def postgre_engine_options (self) -> Dict[str, object]:
+        """
+        Args:
+            self
+        Returns:
+            Dict[str, object]
+        """
+        if self.database_postgre_pool_size < 1:
+            raise ValueError ("DATABASE_POSTGRE_POOL_SIZE must be greater than 0")
+        if self.database_postgre_statement_timeout < 0:
+            raise ValueError ("DATABASE_POSTGRE_STATEMENT_TIMEOUT must not be negative")
+        return {
+            "echo": self.database_postgre_echo,
+            "pool_size": self.database_postgre_pool_size,
+            "max_overflow": self.database_postgre_pool_max_overflow,
+            "pool_timeout": self.database_postgre_pool_timeout,
+            "pool_recycle": self.database_postgre_pool_recycle,
+            "pool_pre_ping": self.database_postgre_pool_pre_ping,
+        }
+
+    def postgre_connect_args (self) -> Dict[str, object]:
+        """
+        Args:
+            self
+        Returns:
+            Dict[str, object]
+        """
+        if not self.database_postgre_statement_timeout:
+            return {}
+        return {"options": f"-c statement_timeout={self.database_postgre_statement_timeout}"}
+
+    def postgre_async_connect_args (self) -> Dict[str, object]:
+        """
+        Args:
+            self
+        Returns:
+            Dict[str, object]
+        """
+        if not self.database_postgre_statement_timeout:
+            return {}
+        return {"server_settings": {"statement_timeout": str (self.database_postgre_statement_timeout)}}
+
     def mongo_uri (self) -> str:
         """
         Args:
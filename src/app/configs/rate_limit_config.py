@@ -0,0 +1,15 @@
+from typing import Optional
+from src.app.bases.app_config import AppConfig
+
+class RateLimitConfig (AppConfig):
+    """
+    RateLimitConfig (AppConfig)
+
+    Attributes:
+        rate_limit_enabled (Optional[bool])
+        rate_limit_algorithm (str)
+        rate_limit_sync_interval (float)
+    """
+    rate_limit_enabled: Optional[bool] = None
+    rate_limit_algorithm: str = "gcra"
+    rate_limit_sync_interval: float = 0.5
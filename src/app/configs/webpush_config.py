@@ -11,6 +11,10 @@ class WebpushConfig (AppConfig):
         webpush_db_table (str)
         webpush_automatic_padding (bool)
         webpush_notification_queue (str)
+        webpush_concurrency (int)
+        webpush_pool_size_per_host (int)
+        webpush_timeout (float)
+        webpush_ttl (int)
     """
     vapid_subject: str = ""
     vapid_public_key: str = ""
@@ -18,3 +22,7 @@ class WebpushConfig (AppConfig):
     webpush_db_table: str = "push_subscriptions"
     webpush_automatic_padding: bool = True
     webpush_notification_queue: str = "notifications"
+    webpush_concurrency: int = 50
+    webpush_pool_size_per_host: int = 20
+    webpush_timeout: float = 10.0
+    webpush_ttl: int = 0
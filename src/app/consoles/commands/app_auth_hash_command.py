@@ -0,0 +1,77 @@
+import statistics
+import sys
+import time
+import traceback
+from typing import Dict, Optional
+import click
+from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_console import Command
+from src.app.configs.auth_config import AuthConfig
+from src.app.helpers.password_helper import PASSWORD_HASHERS, passwordHasher
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+def benchmarkHash (algorithm: str, params: Dict[str, int], samples: int) -> float:
+    """
+    Args:
+        algorithm (str)
+        params (Dict[str, int])
+        samples (int)
+    Returns:
+        float
+    """
+    hasher = passwordHasher (algorithm, params)
+    hashed = hasher.hash (BENCHMARK_PASSWORD)
+    timings = []
+    for _ in range (samples):
+        # Login cost is a verify, so that is what gets timed.
+        started = time.perf_counter ()
+        hasher.verify (BENCHMARK_PASSWORD, hashed)
+        timings.append ((time.perf_counter () - started) * 1000)
+    return statistics.median (timings)
+
+@Command (name="auth:hash:benchmark", help="Pick the password hash cost that meets a target latency on this host")
+@click.option ("--algorithm", "-a", type=click.Choice (list (PASSWORD_HASHERS)), default=None, help="Hash algorithm (default: AUTH_HASH_ALGORITHM)")
+@click.option ("--target-ms", type=float, default=250.0, help="Target verify latency in milliseconds (default: 250)")
+@click.option ("--samples", type=int, default=3, help="Verifies timed per cost, the median is used (default: 3)")
+def authHashBenchmarkCommand (algorithm: Optional[str], target_ms: float, samples: int) -> None:
+    """
+    Args:
+        algorithm (Optional[str])
+        target_ms (float)
+        samples (int)
+    Returns:
+        None
+    """
+    try:
+        config = AuthConfig.config ()
+        algorithm = algorithm or config.auth_hash_algorithm
+        params = AppAuth.hashParams (algorithm)
+        # bcrypt tunes its rounds, argon2id tunes its passes and keeps the configured memory and lanes.
+        costKey, costRange = ("rounds", range (4, 32)) if algorithm == "bcrypt" else ("timeCost", range (1, 65))
+        envKey = "AUTH_HASH_BCRYPT_ROUNDS" if algorithm == "bcrypt" else "AUTH_HASH_ARGON2_TIME_COST"
+
+        click.echo (f"Benchmarking {algorithm} against a {target_ms:g}ms target ({samples} sample(s) per cost)...")
+        chosen = None
+        for cost in costRange:
+            elapsed = benchmarkHash (algorithm, {**params, costKey: cost}, max (1, samples))
+            fits = elapsed <= target_ms
+            click.echo (click.style (f"  {costKey}={cost:<3} {elapsed:9.1f}ms", fg="green" if fits else "yellow"))
+            if not fits:
+                break
+            chosen = cost
+
+        if chosen is None:
+            click.echo (click.style (f"Even the lowest {costKey} exceeds {target_ms:g}ms on this host.", fg="red"))
+            sys.exit (1)
+
+        current = params[costKey]
+        click.echo (click.style (f"Recommended: {envKey}={chosen}", fg="green") + f" (current {current})")
+        if chosen != current:
+            click.echo ("Existing hashes are upgraded on each user's next successful login.")
+    except SystemExit:
+        raise
+    except Exception as e:
+        traceback.print_exc ()
+        click.echo (click.style (f"Error: {str (e)}", fg="red"))
+        sys.exit (1)
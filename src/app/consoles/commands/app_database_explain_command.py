@@ -0,0 +1,54 @@
+from typing import Optional
+import click
+import sys
+import traceback
+from src.app.bases.app_console import Command
+from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_explain import AppDatabaseExplain
+from src.app.utils.app_module_scanner import AppModuleScanner
+
+@Command (name="db:explain", help="Explain repository query shapes and flag sequential scans")
+@click.option ("--shape", "-s", type=str, default=None, help="Only explain shapes starting with this name")
+@click.option ("--analyze", is_flag=True, default=False, help="Run EXPLAIN ANALYZE (executes inside a rolled back transaction)")
+@click.option ("--natural", is_flag=True, default=False, help="Keep sequential scans enabled and show the planner's natural choice")
+def databaseExplainCommand (shape: Optional[str], analyze: bool, natural: bool) -> None:
+    """
+    Args:
+        shape (Optional[str])
+        analyze (bool)
+        natural (bool)
+    Returns:
+        None
+    """
+    try:
+        AppModuleScanner.scanModules ("repositories")
+        shapes = {name: statement for name, statement in AppDatabaseExplain.shapes ().items () if not shape or name.startswith (shape)}
+        if not shapes:
+            click.echo (click.style ("No query shape registered.", fg="yellow"))
+            return
+
+        flagged = 0
+        with AppDatabase.databasePostgresql ().connect () as connection:
+            for name, statement in shapes.items ():
+                plan = AppDatabaseExplain.explain (connection, statement, analyze=analyze, preferIndexes=not natural)
+                scans = AppDatabaseExplain.sequentialScans (plan)
+                indexes = ", ".join (AppDatabaseExplain.indexes (plan)) or "-"
+                cost = plan.get ("Total Cost")
+                timing = f" {plan.get ('Actual Total Time')}ms" if analyze else ""
+
+                if scans:
+                    flagged += 1
+                    click.echo (click.style (f"SEQ  {name}", fg="red") + f"  cost={cost}{timing}  seq_scan={', '.join (scans)}")
+                else:
+                    click.echo (click.style (f"OK   {name}", fg="green") + f"  cost={cost}{timing}  index={indexes}")
+
+        if flagged:
+            click.echo (click.style (f"{flagged} of {len (shapes)} query shape(s) fall back to a sequential scan.", fg="red"))
+            sys.exit (1)
+        click.echo (click.style (f"All {len (shapes)} query shape(s) are served by an index.", fg="green"))
+    except SystemExit:
+        raise
+    except Exception as e:
+        traceback.print_exc ()
+        click.echo (click.style (f"Error: {str (e)}", fg="red"))
+        sys.exit (1)
@@ -8,12 +8,27 @@ from src.app.constants.queue_constants import ALL_QUEUES
 
 @Command (name="queue:work", help="Start queue worker for processing background jobs")
 @click.argument ("queues", nargs=-1)
-@click.option ("--max-jobs", type=int, default=None, help="Maximum concurrent jobs per worker")
+@click.option ("--max-jobs", type=int, default=None, help="Maximum jobs to process before the worker quits")
 @click.option ("--worker-ttl", type=int, default=None, help="Worker TTL in seconds (default: 420)")
-def queueWorkCommand (queues: tuple[str, ...], max_jobs: Optional[int], worker_ttl: Optional[int]) -> None:
+@click.option ("--async", "async_mode", is_flag=True, default=False, help="Run coroutine jobs concurrently in one asyncio process instead of forking per job")
+@click.option ("--concurrency", type=int, default=10, help="Concurrent jobs in async mode (default: 10)")
+@click.option ("--prefetch", type=int, default=None, help="Jobs fetched ahead of free slots in async mode (default: concurrency)")
+def queueWorkCommand (
+    queues: tuple[str, ...],
+    max_jobs: Optional[int],
+    worker_ttl: Optional[int],
+    async_mode: bool,
+    concurrency: int,
+    prefetch: Optional[int]
+) -> None:
     """
     Args:
         queues (tuple[str, ...])
+        max_jobs (Optional[int])
+        worker_ttl (Optional[int])
+        async_mode (bool)
+        concurrency (int)
+        prefetch (Optional[int])
     Returns:
         None
     """
@@ -28,13 +43,21 @@ def queueWorkCommand (queues: tuple[str, ...], max_jobs: Optional[int], worker_t
         click.echo (f"Starting worker for queues: {', '.join (queue_list)}")
 
         if max_jobs:
-            click.echo (f"Max concurrent jobs: {max_jobs}")
+            click.echo (f"Max jobs: {max_jobs}")
         if worker_ttl:
             click.echo (f"Worker TTL: {worker_ttl}s")
+        if async_mode:
+            click.echo (f"Async mode: concurrency {concurrency}, prefetch {prefetch or concurrency}")
 
-        worker = AppQueueProcessor.startWorker (*queue_list, max_jobs=max_jobs, default_worker_ttl=worker_ttl)
-        click.echo ("Worker started. Press Ctrl+C to stop.")
-        worker.work ()
+        worker = AppQueueProcessor.startWorker (
+            *queue_list,
+            default_worker_ttl=worker_ttl,
+            async_mode=async_mode,
+            concurrency=concurrency,
+            prefetch=prefetch
+        )
+        click.echo ("Worker started. Press Ctrl+C to stop." if not async_mode else "Worker started. Send SIGTERM or Ctrl+C to drain and stop.")
+        worker.work (max_jobs=max_jobs)
 
     except KeyboardInterrupt:
         click.echo ("\nWorker stopped by user.")
@@ -12,4 +12,4 @@ PRIORITY_QUEUES = { "high": HIGH_PRIORITY_QUEUE, "normal": NORMAL_PRIORITY_QUEUE
 Customizeable variables
 """
 
-ALL_QUEUES = []
+ALL_QUEUES = [HIGH_PRIORITY_QUEUE, NORMAL_PRIORITY_QUEUE, LOW_PRIORITY_QUEUE]
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+
+class AppPasswordHasherContract (ABC):
+    """
+    AppPasswordHasherContract (ABC)
+
+    Attributes:
+        name (str)
+    """
+    name: str = ""
+
+    @abstractmethod
+    def identify (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        pass
+
+    @abstractmethod
+    def hash (self, password: str) -> str:
+        """
+        Args:
+            password (str)
+        Returns:
+            str
+        """
+        pass
+
+    @abstractmethod
+    def verify (self, password: str, hashed: str) -> bool:
+        """
+        Args:
+            password (str)
+            hashed (str)
+        Returns:
+            bool
+        """
+        pass
+
+    @abstractmethod
+    def needsRehash (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        pass
@@ -0,0 +1,43 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+"""create_notifications_users_partial_indexes
+
+Revision ID: a78856ae7742
+Revises: 978856ae7741
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+revision: str = 'a78856ae7742'
+down_revision: Union[str, None] = '978856ae7741'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('notifications_user_id_id_active_index', 'notifications', ['user_id', 'id'], 'deleted_at IS NULL'),
+    ('notifications_user_id_created_at_active_index', 'notifications', ['user_id', 'created_at'], 'deleted_at IS NULL'),
+    ('notifications_user_id_unread_index', 'notifications', ['user_id'], 'deleted_at IS NULL AND read_at IS NULL'),
+    ('notifications_created_at_active_index', 'notifications', ['created_at'], 'deleted_at IS NULL'),
+    ('users_id_active_index', 'users', ['id'], 'deleted_at IS NULL'),
+    ('users_created_at_active_index', 'users', ['created_at'], 'deleted_at IS NULL'),
+]
+
+def upgrade () -> None:
+    with op.get_context ().autocommit_block ():
+        for name, table, columns, where in INDEXES:
+            op.create_index (
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text (where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+def downgrade () -> None:
+    with op.get_context ().autocommit_block ():
+        for name, table, columns, where in reversed (INDEXES):
+            op.drop_index (name, table_name=table, postgresql_concurrently=True, if_exists=True)
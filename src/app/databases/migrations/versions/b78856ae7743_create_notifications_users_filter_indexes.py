@@ -0,0 +1,42 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+"""create_notifications_users_filter_indexes
+
+Revision ID: b78856ae7743
+Revises: a78856ae7742
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+revision: str = 'b78856ae7743'
+down_revision: Union[str, None] = 'a78856ae7742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('notifications_user_id_type_active_index', 'notifications', ['user_id', 'type'], {'type': 'varchar_pattern_ops'}, 'deleted_at IS NULL'),
+    ('notifications_type_active_index', 'notifications', ['type'], {'type': 'varchar_pattern_ops'}, 'deleted_at IS NULL'),
+    ('users_email_pattern_active_index', 'users', ['email'], {'email': 'varchar_pattern_ops'}, 'deleted_at IS NULL'),
+    ('users_name_pattern_active_index', 'users', ['name'], {'name': 'varchar_pattern_ops'}, 'deleted_at IS NULL'),
+]
+
+def upgrade () -> None:
+    with op.get_context ().autocommit_block ():
+        for name, table, columns, ops, where in INDEXES:
+            op.create_index (
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_ops=ops,
+                postgresql_where=sa.text (where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+def downgrade () -> None:
+    with op.get_context ().autocommit_block ():
+        for name, table, columns, ops, where in reversed (INDEXES):
+            op.drop_index (name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,90 @@
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+"""create_users_notifications_search_indexes
+
+Revision ID: c78856ae7744
+Revises: b78856ae7743
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+revision: str = 'c78856ae7744'
+down_revision: Union[str, None] = 'b78856ae7743'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# {row} is empty for the backfill and NEW. inside the trigger, the columns listed are the ones that change the vector.
+SEARCH_VECTORS = [
+    ('users', ['name', 'email'], "to_tsvector ('simple'::regconfig, coalesce ({row}name, '') || ' ' || coalesce ({row}email, ''))"),
+    ('notifications', ['data'], "jsonb_to_tsvector ('simple'::regconfig, {row}data::jsonb, '[\"string\"]'::jsonb)"),
+]
+
+BACKFILL_BATCH_SIZE = 5000
+
+INDEXES = [
+    ('users_name_trigram_active_index', 'users', ['name'], {'name': 'gin_trgm_ops'}),
+    ('users_email_trigram_active_index', 'users', ['email'], {'email': 'gin_trgm_ops'}),
+    ('users_search_vector_active_index', 'users', ['search_vector'], {}),
+    ('notifications_search_vector_active_index', 'notifications', ['search_vector'], {}),
+]
+
+def backfill (table: str, expression: str) -> None:
+    connection = op.get_bind ()
+    last = ''
+    while True:
+        # Short batches by primary key, each committed on its own, keep row locks brief while writes continue.
+        ids = connection.execute (
+            sa.text (
+                f"UPDATE {table} SET search_vector = {expression.format (row='')} "
+                f"WHERE id IN (SELECT id FROM {table} WHERE id > :last ORDER BY id LIMIT :size) RETURNING id"
+            ),
+            {'last': last, 'size': BACKFILL_BATCH_SIZE},
+        ).scalars ().all ()
+        if not ids:
+            break
+        last = max (ids)
+
+def upgrade () -> None:
+    op.execute ("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # A STORED generated column rewrites the whole table under ACCESS EXCLUSIVE, a plain nullable column is a catalog change.
+    for table, columns, expression in SEARCH_VECTORS:
+        op.add_column (table, sa.Column ('search_vector', postgresql.TSVECTOR (), nullable=True))
+        op.execute (
+            f"CREATE OR REPLACE FUNCTION {table}_search_vector_update () RETURNS trigger AS $$ "
+            f"BEGIN NEW.search_vector := {expression.format (row='NEW.')}; RETURN NEW; END "
+            f"$$ LANGUAGE plpgsql"
+        )
+        op.execute (
+            f"CREATE TRIGGER {table}_search_vector_trigger BEFORE INSERT OR UPDATE OF {', '.join (columns)} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update ()"
+        )
+
+    with op.get_context ().autocommit_block ():
+        for table, columns, expression in SEARCH_VECTORS:
+            backfill (table, expression)
+
+        for name, table, columns, ops in INDEXES:
+            op.create_index (
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops=ops,
+                postgresql_where=sa.text ('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+def downgrade () -> None:
+    with op.get_context ().autocommit_block ():
+        for name, table, columns, ops in reversed (INDEXES):
+            op.drop_index (name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table, columns, expression in reversed (SEARCH_VECTORS):
+        op.execute (f"DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}")
+        op.execute (f"DROP FUNCTION IF EXISTS {table}_search_vector_update ()")
+        op.drop_column (table, 'search_vector')
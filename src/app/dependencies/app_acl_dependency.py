@@ -0,0 +1,29 @@
+from fastapi import Depends, HTTPException, status
+from src.app.bases.app_i18n import AppI18n
+from src.app.dependencies.app_auth_api_dependency import get_current_user
+from src.v1.api.user.databases.models.user_model import User
+from src.v1.api.user.repositories.user_acl_repository import UserAclRepository
+
+def requirePermission (permission: str):
+    """
+    Args:
+        permission (str)
+    Returns:
+        Depends
+    """
+    async def _checkPermission (current_user: User = Depends (get_current_user)) -> User:
+        """
+        Args:
+            current_user (User)
+        Returns:
+            User
+        """
+        if not await UserAclRepository.hasPermission (current_user.id, permission):
+            i18n = AppI18n.i18n ()
+            raise HTTPException (
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=i18n.t ("_v1_user.auth.forbidden")
+            )
+        return current_user
+
+    return Depends (_checkPermission)
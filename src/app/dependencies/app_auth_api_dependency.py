@@ -1,24 +1,20 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlmodel import Session
-from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_auth_token import AppAuthToken
 from src.app.bases.app_i18n import AppI18n
 from src.app.bases.app_security import security
-from src.app.dependencies.app_database_dependency import get_db
 from src.v1.api.user.databases.models.user_model import User
-from src.v1.api.user.repositories.user_auth_repository import UserAuthRepository
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
 
 async def get_current_user (
     request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends (security),
-    db: Session = Depends (get_db)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends (security)
 ) -> User:
     """
     Args:
         request (Request)
         credentials (Optional[HTTPAuthorizationCredentials])
-        db (Session)
     Returns:
         User
     """
@@ -39,14 +35,7 @@ async def get_current_user (
             detail=i18n.t ("_v1_user.auth.missing_token")
         )
 
-    isBlacklisted = await AppAuth.isTokenBlacklisted (token)
-    if isBlacklisted:
-        raise HTTPException (
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=i18n.t ("_v1_user.auth.invalid_token")
-        )
-    
-    payload = AppAuth.decodeToken (token)
+    payload = await AppAuthToken.verify (token)
     if not payload:
         raise HTTPException (
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,9 +49,7 @@ async def get_current_user (
             detail=i18n.t ("_v1_user.auth.invalid_token")
         )
 
-    from sqlmodel import select
-    statement = select (User).where (User.id == userId, User.deleted_at == None)
-    result = db.exec (statement).first ()
+    result = await UserPrincipalRepository.findById (userId)
     
     if not result:
         raise HTTPException (
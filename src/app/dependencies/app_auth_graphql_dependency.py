@@ -1,9 +1,8 @@
 from typing import Optional
 from strawberry.types import Info
-from sqlmodel import Session, select
-from src.app.bases.app_auth import AppAuth
-from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_auth_token import AppAuthToken
 from src.v1.api.user.databases.models.user_model import User
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
 from src.v1.api.user.services.user_auth_service import UserAuthService
 
 async def get_current_user_graphql (info: Info) -> Optional[User]:
@@ -21,11 +20,7 @@ async def get_current_user_graphql (info: Info) -> Optional[User]:
     if not token:
         return None
 
-    isBlacklisted = await AppAuth.isTokenBlacklisted (token)
-    if isBlacklisted:
-        return None
-
-    payload = AppAuth.decodeToken (token)
+    payload = await AppAuthToken.verify (token)
     if not payload:
         return None
 
@@ -33,11 +28,4 @@ async def get_current_user_graphql (info: Info) -> Optional[User]:
     if not userId:
         return None
 
-    engine = AppDatabase.databasePostgresql ()
-    session = Session (engine)
-    try:
-        statement = select (User).where (User.id == userId, User.deleted_at == None)
-        result = session.exec (statement).first ()
-        return result
-    finally:
-        session.close ()
+    return await UserPrincipalRepository.findById (userId)
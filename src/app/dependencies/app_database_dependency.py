@@ -1,13 +1,15 @@
-from typing import Generator
+from typing import AsyncGenerator
 from fastapi import Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.app.bases.app_database import AppDatabase
 
-def get_db () -> Generator[Session, None, None]:
+async def get_db () -> AsyncGenerator[AsyncSession, None]:
     """
     Returns:
-        Generator[Session, None, None]
+        AsyncGenerator[AsyncSession, None]
     """
-    engine = AppDatabase.databasePostgresql ()
-    with Session (engine) as session:
+    session = AppDatabase.databasePostgresqlAsyncSessionScoped ()
+    try:
         yield session
+    finally:
+        await AppDatabase.databasePostgresqlRelease (session)
@@ -1,6 +1,10 @@
-from fastapi import Depends
-from fastapi_limiter.depends import RateLimiter
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
+from src.app.bases.app_auth_token import AppAuthToken
+from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_rate_limiter import AppRateLimiter, RATE_LIMIT_ALGORITHMS
 from src.app.configs.app_config import AppConfig
+from src.app.configs.rate_limit_config import RateLimitConfig
 
 async def _rateLimitNoop () -> None:
     """
@@ -8,15 +12,67 @@ async def _rateLimitNoop () -> None:
     """
     return None
 
-def rateLimit (*, times: int, seconds: int = 60):
+async def rateLimitIdentity (request: Request, key: str) -> str:
+    """
+    Args:
+        request (Request)
+        key (str)
+    Returns:
+        str
+    """
+    if key == "user":
+        authorization = request.headers.get ("authorization", "")
+        parts = authorization.split (" ")
+        if len (parts) == 2 and parts[0] == "Bearer":
+            # Verified access tokens are served from the local token cache, an invalid one falls back to the address.
+            payload = await AppAuthToken.verify (parts[1])
+            if payload and payload.get ("sub"):
+                return f"user:{payload['sub']}"
+
+    client = request.client.host if request.client else "unknown"
+    return f"ip:{client}"
+
+def rateLimit (*, times: int, seconds: int = 60, key: str = "user", algorithm: Optional[str] = None):
     """
     Args:
         times (int)
         seconds (int)
+        key (str)
+        algorithm (Optional[str])
     Returns:
         Depends
     """
-    if AppConfig.config ().app_env != "production":
+    rateLimitConfig = RateLimitConfig.config ()
+    enabled = rateLimitConfig.rate_limit_enabled
+    if enabled is None:
+        enabled = AppConfig.config ().app_env == "production"
+    if not enabled:
         return Depends (_rateLimitNoop)
 
-    return Depends (RateLimiter (times=times, seconds=seconds))
+    if key not in ("user", "ip"):
+        raise ValueError (f"Unknown rate limit key: {key}")
+    if algorithm is not None and algorithm not in RATE_LIMIT_ALGORITHMS:
+        raise ValueError (f"Unknown rate limit algorithm: {algorithm}")
+
+    async def _rateLimit (request: Request) -> None:
+        """
+        Args:
+            request (Request)
+        Returns:
+            None
+        """
+        AppRateLimiter.bindLoop ()
+        route = request.scope.get ("route")
+        path = route.path if route is not None else request.url.path
+        identity = await rateLimitIdentity (request, key)
+
+        decision = AppRateLimiter.hit (f"{request.method}:{path}:{identity}", times, seconds, algorithm)
+        AppRateLimiter.remember (decision)
+        if not decision.allowed:
+            raise HTTPException (
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=AppI18n.i18n ().t ("_app.error.too_many_requests"),
+                headers=decision.headers ()
+            )
+
+    return Depends (_rateLimit)
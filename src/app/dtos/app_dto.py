@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from fastapi import status
 from pydantic import BaseModel, Field
 
@@ -90,3 +90,16 @@ class BatchPayloadType (BaseModel):
         count (int)
     """
     count: int = Field (..., json_schema_extra={"example": 0})
+
+class JobPayloadType (BaseModel):
+    """
+    JobPayloadType (BaseModel)
+
+    Attributes:
+        id (str)
+        status (str)
+        progress (Optional[Dict[str, object]])
+    """
+    id: str = Field (..., json_schema_extra={"example": "string"})
+    status: str = Field (..., json_schema_extra={"example": "queued"})
+    progress: Optional[Dict[str, object]] = Field (None, json_schema_extra={"example": None})
@@ -23,5 +23,6 @@ async def httpExceptionHandler (request: Request, exc: HTTPException) -> JSONRes
     
     return JSONResponse (
         status_code=exc.status_code,
-        content={"detail": detail}
+        content={"detail": detail},
+        headers=getattr (exc, "headers", None)
     )
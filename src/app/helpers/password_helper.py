@@ -0,0 +1,187 @@
+from typing import Callable, Dict, List, Optional
+import bcrypt
+from src.app.contracts.app_password_hasher_contract import AppPasswordHasherContract
+
+class BcryptPasswordHasher (AppPasswordHasherContract):
+    """
+    BcryptPasswordHasher (AppPasswordHasherContract)
+
+    Attributes:
+        name (str)
+        rounds (int)
+    """
+    name = "bcrypt"
+
+    def __init__ (self, rounds: int = 12) -> None:
+        """
+        Args:
+            rounds (int)
+        Returns:
+            None
+        """
+        self.rounds = rounds
+
+    def identify (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        return hashed.startswith (("$2a$", "$2b$", "$2y$"))
+
+    def hash (self, password: str) -> str:
+        """
+        Args:
+            password (str)
+        Returns:
+            str
+        """
+        return bcrypt.hashpw (password.encode ('utf-8'), bcrypt.gensalt (rounds=self.rounds)).decode ('utf-8')
+
+    def verify (self, password: str, hashed: str) -> bool:
+        """
+        Args:
+            password (str)
+            hashed (str)
+        Returns:
+            bool
+        """
+        try:
+            return bcrypt.checkpw (password.encode ('utf-8'), hashed.encode ('utf-8'))
+        except Exception:
+            return False
+
+    def needsRehash (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        # The cost sits in the hash itself ($2b$12$...), so lowering it is honoured as well as raising it.
+        try:
+            return int (hashed.split ("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+class Argon2PasswordHasher (AppPasswordHasherContract):
+    """
+    Argon2PasswordHasher (AppPasswordHasherContract)
+
+    Attributes:
+        name (str)
+        timeCost (int)
+        memoryCost (int)
+        parallelism (int)
+    """
+    name = "argon2id"
+
+    def __init__ (self, timeCost: int = 3, memoryCost: int = 65536, parallelism: int = 4) -> None:
+        """
+        Args:
+            timeCost (int)
+            memoryCost (int)
+            parallelism (int)
+        Returns:
+            None
+        """
+        self.timeCost = timeCost
+        self.memoryCost = memoryCost
+        self.parallelism = parallelism
+        self._hasher = None
+
+    def hasher (self) -> object:
+        """
+        Returns:
+            argon2.PasswordHasher
+        """
+        if self._hasher is None:
+            try:
+                import argon2
+            except ImportError as e:
+                raise RuntimeError ("The argon2id password hasher needs the argon2-cffi package installed") from e
+            self._hasher = argon2.PasswordHasher (
+                time_cost=self.timeCost,
+                memory_cost=self.memoryCost,
+                parallelism=self.parallelism,
+                type=argon2.Type.ID,
+            )
+        return self._hasher
+
+    def identify (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        return hashed.startswith ("$argon2id$")
+
+    def hash (self, password: str) -> str:
+        """
+        Args:
+            password (str)
+        Returns:
+            str
+        """
+        return self.hasher ().hash (password)
+
+    def verify (self, password: str, hashed: str) -> bool:
+        """
+        Args:
+            password (str)
+            hashed (str)
+        Returns:
+            bool
+        """
+        try:
+            return self.hasher ().verify (hashed, password)
+        except RuntimeError:
+            raise
+        except Exception:
+            return False
+
+    def needsRehash (self, hashed: str) -> bool:
+        """
+        Args:
+            hashed (str)
+        Returns:
+            bool
+        """
+        try:
+            return self.hasher ().check_needs_rehash (hashed)
+        except RuntimeError:
+            raise
+        except Exception:
+            return True
+
+PASSWORD_HASHERS: Dict[str, Callable[..., AppPasswordHasherContract]] = {
+    BcryptPasswordHasher.name: BcryptPasswordHasher,
+    Argon2PasswordHasher.name: Argon2PasswordHasher,
+}
+
+def passwordHasher (algorithm: str, params: Optional[Dict[str, int]] = None) -> AppPasswordHasherContract:
+    """
+    Args:
+        algorithm (str)
+        params (Optional[Dict[str, int]])
+    Returns:
+        AppPasswordHasherContract
+    """
+    factory = PASSWORD_HASHERS.get (algorithm)
+    if factory is None:
+        raise ValueError (f"Unknown password hash algorithm: {algorithm}")
+    return factory (**(params or {}))
+
+def passwordHashBatch (passwords: List[str], algorithm: str = BcryptPasswordHasher.name, params: Optional[Dict[str, int]] = None) -> List[str]:
+    """
+    Args:
+        passwords (List[str])
+        algorithm (str)
+        params (Optional[Dict[str, int]])
+    Returns:
+        List[str]
+    """
+    hasher = passwordHasher (algorithm, params)
+    return [hasher.hash (password) for password in passwords]
@@ -1,7 +1,10 @@
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import AsyncIterable, Dict, List, Literal, Optional, Sequence
+import csv
 import io
 import pandas as pd
+import xlsxwriter
 from src.app.bases.app_i18n import AppI18n
 from src.app.configs.disk_config import DiskConfig
 
@@ -63,6 +66,74 @@ class AppExportProcessor:
             "fileUrl": file_url
         }
 
+    @staticmethod
+    async def export_stream (
+        rows: AsyncIterable[Sequence[object]],
+        columns: List[str],
+        filename: str,
+        file_type: Literal["csv", "xlsx", "xls"] = "csv",
+        subfolder: str = "export",
+        sheet_name: str = "Sheet1"
+    ) -> Dict[str, str]:
+        """
+        Args:
+            rows (AsyncIterable[Sequence[object]])
+            columns (List[str])
+            filename (str)
+            file_type (Literal["csv", "xlsx", "xls"])
+            subfolder (str)
+            sheet_name (str)
+        Returns:
+            Dict[str, str]
+        """
+        i18n = AppI18n.i18n ()
+
+        if file_type not in ["csv", "xlsx", "xls"]:
+            raise ValueError (i18n.t ("_app.processor.export.unsupported_type", args={"type": file_type}))
+
+        disk_config = DiskConfig.config ()
+        public_storage_path = Path (disk_config.disk_public_path)
+        export_path = public_storage_path / subfolder
+
+        export_path.mkdir (parents=True, exist_ok=True)
+
+        file_path = export_path / filename
+        total = 0
+
+        try:
+            if file_type == "csv":
+                with open (file_path, "w", newline="", encoding="utf-8") as file:
+                    writer = csv.writer (file)
+                    writer.writerow (columns)
+                    async for row in rows:
+                        writer.writerow ([AppExportProcessor.sanitize_value (value) for value in row])
+                        total += 1
+            else:
+                # constant_memory flushes each row to a temp file once the next one starts, so only one row is held in memory.
+                workbook = xlsxwriter.Workbook (str (file_path), {"constant_memory": True})
+                try:
+                    worksheet = workbook.add_worksheet (sheet_name)
+                    worksheet.write_row (0, 0, columns)
+                    async for row in rows:
+                        total += 1
+                        worksheet.write_row (total, 0, [AppExportProcessor.sanitize_value (value) for value in row])
+                finally:
+                    workbook.close ()
+        except Exception:
+            file_path.unlink (missing_ok=True)
+            raise
+
+        if total == 0:
+            file_path.unlink (missing_ok=True)
+            raise ValueError (i18n.t ("_app.processor.export.no_data"))
+
+        file_url = f"storage/{subfolder}/{filename}"
+
+        return {
+            "filePath": str (file_path),
+            "fileUrl": file_url
+        }
+
     @staticmethod
     def prepare_data (data: List[Dict[str, object]], columns: Optional[List[str]] = None) -> List[Dict[str, object]]:
         """
@@ -96,12 +167,23 @@ class AppExportProcessor:
         for row in data:
             sanitized_row = {}
             for key, value in row.items ():
-                if value is None:
-                    sanitized_row[key] = ""
-                elif isinstance (value, (list, dict)):
-                    sanitized_row[key] = str (value)
-                else:
-                    sanitized_row[key] = value
+                sanitized_row[key] = AppExportProcessor.sanitize_value (value)
             sanitized.append (sanitized_row)
 
         return sanitized
+
+    @staticmethod
+    def sanitize_value (value: object) -> object:
+        """
+        Args:
+            value (object)
+        Returns:
+            object
+        """
+        if value is None:
+            return ""
+        if isinstance (value, (list, dict)):
+            return str (value)
+        if isinstance (value, (datetime, date)):
+            return value.isoformat ()
+        return value
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import io
 import pandas as pd
 from src.app.bases.app_i18n import AppI18n
@@ -15,10 +15,10 @@ class AppImportProcessor:
         pass
 
     @staticmethod
-    def import_file (file_content: bytes, filename: str) -> List[Dict[str, object]]:
+    def import_file (file_content: bytes | Path, filename: str) -> List[Dict[str, object]]:
         """
         Args:
-            file_content (bytes)
+            file_content (bytes | Path)
             filename (str)
         Returns:
             List[Dict[str, object]]
@@ -27,8 +27,11 @@ class AppImportProcessor:
         file_extension = Path (filename).suffix.lower ()
 
         if file_extension == ".csv":
-            content = file_content.decode ("utf-8") if isinstance (file_content, bytes) else file_content
-            df = pd.read_csv (io.StringIO (content))
+            if isinstance (file_content, Path):
+                df = pd.read_csv (file_content, encoding="utf-8")
+            else:
+                content = file_content.decode ("utf-8") if isinstance (file_content, bytes) else file_content
+                df = pd.read_csv (io.StringIO (content))
         elif file_extension in [".xlsx", ".xls"]:
             content = io.BytesIO (file_content) if isinstance (file_content, bytes) else file_content
             df = pd.read_excel (content)
@@ -88,3 +91,16 @@ class AppImportProcessor:
                 valid_rows.append (cleaned_row)
 
         return valid_rows
+
+    @staticmethod
+    def chunk_rows (data: List[Dict[str, object]], size: int) -> Iterator[List[Dict[str, object]]]:
+        """
+        Args:
+            data (List[Dict[str, object]])
+            size (int)
+        Returns:
+            Iterator[List[Dict[str, object]]]
+        """
+        size = max (1, size)
+        for index in range (0, len (data), size):
+            yield data[index:index + size]
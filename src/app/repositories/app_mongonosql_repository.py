@@ -1,7 +1,14 @@
-from typing import TypeVar, Generic, Optional, List, Dict, Callable
-from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorClient
+from datetime import datetime
+from typing import TypeVar, Generic, Optional, List, Dict, Callable, Set, Tuple
+import json
+import re
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase, AsyncIOMotorClient
+from pymongo import TEXT
 from src.app.bases.app_database import AppDatabase
+from src.app.configs.database_config import DatabaseConfig
+from src.app.utils.app_count_cache import cachedCount
 from src.app.repositories.app_repository import (
+    FILTER_IN_LIMIT,
     OffsetPaginationType,
     CursorPaginationType,
     OffsetPagination,
@@ -17,7 +24,20 @@ T = TypeVar ("T")
 class AppMongonosqlRepository (Generic[T]):
     """
     AppMongonosqlRepository (Generic)
+
+    Attributes:
+        filterable (Dict[str, Tuple[str, ...]])
+        orderable (Tuple[str, ...])
+        searchable (Tuple[str, ...])
+        search_language (str)
+        _search_indexed (Set[str])
     """
+    filterable: Dict[str, Tuple[str, ...]] = {}
+    orderable: Tuple[str, ...] = ()
+    searchable: Tuple[str, ...] = ()
+    search_language: str = "none"
+    _search_indexed: Set[str] = set ()
+
     def __init__ (self) -> None:
         """
         Returns:
@@ -31,33 +51,181 @@ class AppMongonosqlRepository (Generic[T]):
         """
         return {"deleted_at": None}
 
-    def order (self, orders: List[Orderization]) -> List[tuple[str, int]]:
+    def order (self, orders: List[Orderization], model: Optional[type] = None) -> List[tuple[str, int]]:
         """
         Args:
             orders (List[Orderization])
+            model (Optional[type])
         Returns:
             List[tuple[str, int]]
         """
         order_by = []
         for order in orders:
+            try:
+                if isinstance (order, dict):
+                    order = Orderization (**order)
+            except ValueError:
+                self.logger.warning (f"Order ignores: {order}")
+                continue
+
+            if order.field not in self.orderable:
+                self.logger.warning (f"Order ignores field: {order.field}")
+                continue
             direction = 1 if order.direction == "asc" else -1
             order_by.append ((order.field, direction))
         return order_by
 
-    def filter (self, filters: List[Filterization]) -> Dict[str, object]:
+    def filter (self, filters: List[Filterization], model: Optional[type] = None) -> Dict[str, object]:
         """
         Args:
             filters (List[Filterization])
+            model (Optional[type])
         Returns:
             Dict[str, object]
         """
         conditions = {}
         for f in filters:
-            field = f.field
-            search = f.search
-            conditions[field] = {"$regex": search, "$options": "i"}
+            try:
+                if isinstance (f, dict):
+                    f = Filterization (**f)
+                condition = self.filter_condition (f)
+            except ValueError as e:
+                self.logger.warning (f"Filter ignores {f}: {e}")
+                continue
+            if condition is None:
+                self.logger.warning (f"Filter ignores field: {f.field}")
+                continue
+
+            if f.field in conditions:
+                conditions.setdefault ("$and", []).append ({f.field: condition})
+            else:
+                conditions[f.field] = condition
         return conditions
 
+    def filter_condition (self, f: Filterization) -> Optional[object]:
+        """
+        Args:
+            f (Filterization)
+        Returns:
+            Optional[object]
+        """
+        operators = self.filterable.get (f.field, ())
+        if not operators:
+            return None
+
+        operator = f.operator or operators[0]
+        if operator not in operators:
+            raise ValueError (f"operator {operator} is not allowed")
+
+        if operator == "eq":
+            return f.search
+
+        if operator == "in":
+            values = [value for value in f.search.split ("|") if value][:FILTER_IN_LIMIT]
+            if not values:
+                raise ValueError ("in needs at least one value")
+            return {"$in": values}
+
+        if operator == "range":
+            lower, separator, upper = f.search.partition ("..")
+            if not separator or not (lower or upper):
+                raise ValueError ("range expects lower..upper")
+            bounds = {}
+            if lower:
+                bounds["$gte"] = self.coerce (lower)
+            if upper:
+                bounds["$lte"] = self.coerce (upper)
+            return bounds
+
+        # An unanchored or case-insensitive regex cannot use an index, so contains narrows to an anchored prefix.
+        if operator == "contains":
+            self.logger.warning (f"Filter {f.field} has no index for contains, falls back to prefix")
+        return {"$regex": "^" + re.escape (f.search)}
+
+    @staticmethod
+    def coerce (value: str) -> object:
+        """
+        Args:
+            value (str)
+        Returns:
+            object
+        """
+        for cast in (int, float, datetime.fromisoformat):
+            try:
+                return cast (value)
+            except ValueError:
+                continue
+        return value
+
+    def search (self, search: Optional[str], model: Optional[type] = None) -> Dict[str, object]:
+        """
+        Args:
+            search (Optional[str])
+            model (Optional[type])
+        Returns:
+            Dict[str, object]
+        """
+        terms = (search or "").strip ()
+        if not terms or not self.searchable:
+            return {}
+        return {
+            "search": {"$text": {"$search": terms}},
+            "rank": {"$meta": "textScore"},
+        }
+
+    async def search_index (self, collection: AsyncIOMotorCollection) -> Optional[str]:
+        """
+        Args:
+            collection (AsyncIOMotorCollection)
+        Returns:
+            Optional[str]
+        """
+        if not self.searchable:
+            return None
+        name = f"{collection.name}_search_text_index"
+        # $text fails without a text index, so the first search on a collection creates it, once per process.
+        if collection.full_name in AppMongonosqlRepository._search_indexed:
+            return name
+        # A collection holds a single text index, so every searchable field shares it.
+        name = await collection.create_index (
+            [(field, TEXT) for field in self.searchable],
+            name=name,
+            default_language=self.search_language,
+        )
+        AppMongonosqlRepository._search_indexed.add (collection.full_name)
+        return name
+
+    async def count_total (
+        self,
+        collection: AsyncIOMotorCollection,
+        filter_query: Dict[str, object],
+        strategy: str
+    ) -> int:
+        """
+        Args:
+            collection (AsyncIOMotorCollection)
+            filter_query (Dict[str, object])
+            strategy (str)
+        Returns:
+            int
+        """
+        async def exact () -> int:
+            """
+            Returns:
+                int
+            """
+            return await collection.count_documents (filter_query)
+
+        if strategy == "cached":
+            fingerprint = json.dumps (filter_query, sort_keys=True, default=str)
+            return await cachedCount (collection.name, fingerprint, DatabaseConfig.config ().database_count_ttl, exact)
+
+        # The collection metadata count only describes the whole collection, filtered totals stay exact.
+        if strategy == "estimate" and not filter_query:
+            return await collection.estimated_document_count ()
+
+        return await exact ()
+
     async def offset_paginate_all (
         self,
         collection_name: str,
@@ -76,16 +244,22 @@ class AppMongonosqlRepository (Generic[T]):
         """
         try:
             collection = database[collection_name]
+            if "search" in query:
+                await self.search_index (collection)
 
-            filter_query = query.get ("filter", {})
+            filter_query = {**query.get ("filter", {}), **query.get ("search", {})}
             sort_query = query.get ("sort", [])
-
-            total = await collection.count_documents (filter_query)
+            projection = None
+            if "search" in query:
+                projection = {"score": query["rank"]}
+                sort_query = [("score", query["rank"])] + list (sort_query)
+            strategy = page.countStrategy or DatabaseConfig.config ().database_count_strategy
 
             skip = (page.currentPage - 1) * page.limitPage
-            limit = page.limitPage
+            # Without a total, one extra document is enough to know whether a next page exists.
+            limit = page.limitPage + 1 if strategy == "none" else page.limitPage
 
-            cursor = collection.find (filter_query)
+            cursor = collection.find (filter_query, projection)
 
             if sort_query:
                 cursor = cursor.sort (sort_query)
@@ -94,6 +268,14 @@ class AppMongonosqlRepository (Generic[T]):
 
             results = await cursor.to_list (length=limit)
 
+            if strategy == "none":
+                has_next_page = len (results) > page.limitPage
+                results = results[:page.limitPage]
+                total = skip + len (results) + (1 if has_next_page else 0)
+            else:
+                total = await self.count_total (collection, filter_query, strategy)
+                total = max (total, skip + len (results))
+
             per_page = page.limitPage
             current_page = page.currentPage
             last_page = (total + per_page - 1) // per_page if total > 0 else 1
@@ -106,6 +288,7 @@ class AppMongonosqlRepository (Generic[T]):
                 previousPage=current_page - 1 if current_page > 1 else None,
                 firstPage=1,
                 lastPage=last_page,
+                countStrategy=strategy,
                 data=results
             )
 
@@ -141,8 +324,11 @@ class AppMongonosqlRepository (Generic[T]):
         """
         try:
             collection = database[collection_name]
+            if "search" in query:
+                await self.search_index (collection)
 
-            filter_query = query.get ("filter", {})
+            # Text scores are not a stable cursor, so cursor pages use search as a filter only.
+            filter_query = {**query.get ("filter", {}), **query.get ("search", {})}
             sort_query = query.get ("sort", [(page.cursorField, 1)])
 
             if page.cursorPage:
@@ -1,8 +1,19 @@
-from typing import TypeVar, Generic, Optional, List, Dict, Callable
-from sqlmodel import Session, select, func
-from sqlalchemy import text
+from datetime import datetime
+from typing import TypeVar, Generic, Optional, List, Dict, Callable, Awaitable, FrozenSet, Tuple, Union
+from inspect import isawaitable
+from fastapi import HTTPException, status
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import and_, literal, literal_column, or_, text, tuple_, update
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_database_explain import AppDatabaseExplain, Explain
+from src.app.configs.database_config import DatabaseConfig
+from src.app.utils.app_count_cache import cachedCount
+from src.app.utils.app_cursor import encodeCursor, decodeCursor
 from src.app.repositories.app_repository import (
+    FILTER_IN_LIMIT,
     OffsetPaginationType,
     CursorPaginationType,
     OffsetPagination,
@@ -18,7 +29,20 @@ T = TypeVar ("T")
 class AppPostgresqlRepository (Generic[T]):
     """
     AppPostgresqlRepository (Generic)
+
+    Attributes:
+        filterable (Dict[str, Tuple[str, ...]])
+        orderable (Tuple[str, ...])
+        searchable (Tuple[str, ...])
+        search_vector (Optional[str])
+        search_config (str)
     """
+    filterable: Dict[str, Tuple[str, ...]] = {}
+    orderable: Tuple[str, ...] = ()
+    searchable: Tuple[str, ...] = ()
+    search_vector: Optional[str] = None
+    search_config: str = "simple"
+
     def __init__ (self) -> None:
         """
         Returns:
@@ -32,56 +56,232 @@ class AppPostgresqlRepository (Generic[T]):
         """
         return {"deleted_at": None}
 
-    def order (self, orders: List[Orderization]) -> Dict[str, object]:
+    def order (self, orders: List[Orderization], model: Optional[type[T]] = None) -> Dict[str, object]:
         """
         Args:
             orders (List[Orderization])
+            model (Optional[type[T]])
         Returns:
             Dict[str, object]
         """
         order_by = []
         for order in orders:
-            direction = text (f"{order.field} {order.direction}")
-            order_by.append (direction)
+            try:
+                if isinstance (order, dict):
+                    order = Orderization (**order)
+            except ValueError:
+                self.logger.warning (f"Order ignores: {order}")
+                continue
+
+            column = self.column (model, order.field) if order.field in self.orderable else None
+            if column is None:
+                self.logger.warning (f"Order ignores field: {order.field}")
+                continue
+            order_by.append (column.asc () if order.direction == "asc" else column.desc ())
         return {"order_by": order_by}
 
-    def filter (self, filters: List[Filterization]) -> Dict[str, object]:
+    def filter (self, filters: List[Filterization], model: Optional[type[T]] = None) -> Dict[str, object]:
         """
         Args:
             filters (List[Filterization])
+            model (Optional[type[T]])
         Returns:
             Dict[str, object]
         """
-        conditions = {}
+        conditions = []
         for f in filters:
-            field = f.field
-            search = f.search
-            conditions[field] = {"contains": search}
-        return conditions
+            try:
+                if isinstance (f, dict):
+                    f = Filterization (**f)
+                condition = self.filter_condition (model, f)
+            except ValueError as e:
+                self.logger.warning (f"Filter ignores {f}: {e}")
+                continue
+            if condition is None:
+                self.logger.warning (f"Filter ignores field: {f.field}")
+                continue
+            conditions.append (condition)
+        return {"conditions": conditions}
+
+    def filter_condition (self, model: Optional[type[T]], f: Filterization) -> Optional[object]:
+        """
+        Args:
+            model (Optional[type[T]])
+            f (Filterization)
+        Returns:
+            Optional[object]
+        """
+        operators = self.filterable.get (f.field, ())
+        column = self.column (model, f.field) if operators else None
+        if column is None:
+            return None
+
+        operator = f.operator or operators[0]
+        if operator not in operators:
+            raise ValueError (f"operator {operator} is not allowed")
+
+        # An unanchored pattern can only be served by a trigram index, without one contains narrows to prefix.
+        if operator == "contains" and f.field not in self.trigram_indexed (model):
+            self.logger.warning (f"Filter {f.field} has no trigram index, contains falls back to prefix")
+            operator = "prefix"
+
+        if operator == "eq":
+            return column == self.coerce (column, f.search)
+
+        if operator == "in":
+            values = [value for value in f.search.split ("|") if value][:FILTER_IN_LIMIT]
+            if not values:
+                raise ValueError ("in needs at least one value")
+            return column.in_ ([self.coerce (column, value) for value in values])
+
+        if operator == "range":
+            lower, separator, upper = f.search.partition ("..")
+            if not separator or not (lower or upper):
+                raise ValueError ("range expects lower..upper")
+            bounds = []
+            if lower:
+                bounds.append (column >= self.coerce (column, lower))
+            if upper:
+                bounds.append (column <= self.coerce (column, upper))
+            return and_ (*bounds)
+
+        # The pattern is bound whole, so the planner sees a constant prefix instead of a concatenation it cannot index.
+        escaped = self.escape_like (f.search)
+        if operator == "prefix":
+            return column.like (f"{escaped}%", escape="\\")
+        return column.ilike (f"%{escaped}%", escape="\\")
+
+    def search (self, search: Optional[str], model: Optional[type[T]] = None) -> Dict[str, object]:
+        """
+        Args:
+            search (Optional[str])
+            model (Optional[type[T]])
+        Returns:
+            Dict[str, object]
+        """
+        terms = (search or "").strip ()
+        if not terms or model is None:
+            return {}
+
+        conditions = []
+        ranks = []
+        if self.search_vector:
+            # The tsvector column is added and kept current by a trigger in the migration, so it is referenced by name instead of loaded with the model.
+            vector = literal_column (f"{model.__tablename__}.{self.search_vector}", TSVECTOR)
+            query = func.websearch_to_tsquery (self.search_config, terms)
+            conditions.append (vector.op ("@@") (query))
+            ranks.append (func.ts_rank_cd (vector, query))
+
+        # Trigram GIN indexes answer unanchored ILIKE, which covers partial words and email fragments the tsvector splits apart.
+        pattern = f"%{self.escape_like (terms)}%"
+        for field in self.searchable:
+            column = self.column (model, field)
+            if column is None:
+                continue
+            conditions.append (column.ilike (pattern, escape="\\"))
+            ranks.append (func.similarity (column, terms))
+
+        if not conditions:
+            return {}
+        return {
+            "search": or_ (*conditions),
+            "rank": ranks[0] if len (ranks) == 1 else func.greatest (*ranks),
+        }
+
+    def column (self, model: Optional[type[T]], field: str) -> Optional[object]:
+        """
+        Args:
+            model (Optional[type[T]])
+            field (str)
+        Returns:
+            Optional[object]
+        """
+        if model is None:
+            return None
+        return model.__table__.columns.get (field)
+
+    @staticmethod
+    def coerce (column: object, value: str) -> object:
+        """
+        Args:
+            column (object)
+            value (str)
+        Returns:
+            object
+        """
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+
+        if python_type is datetime:
+            return datetime.fromisoformat (value)
+        if python_type is bool:
+            return value.lower () in ("1", "true", "yes")
+        if python_type in (int, float):
+            return python_type (value)
+        return value
+
+    @staticmethod
+    def escape_like (value: str) -> str:
+        """
+        Args:
+            value (str)
+        Returns:
+            str
+        """
+        return value.replace ("\\", "\\\\").replace ("%", "\\%").replace ("_", "\\_")
+
+    @staticmethod
+    def trigram_indexed (model: Optional[type[T]]) -> FrozenSet[str]:
+        """
+        Args:
+            model (Optional[type[T]])
+        Returns:
+            FrozenSet[str]
+        """
+        if model is None:
+            return frozenset ()
+
+        fields = set ()
+        for index in model.__table__.indexes:
+            options = index.dialect_options["postgresql"]
+            if options.get ("using") != "gin":
+                continue
+            ops = options.get ("ops") or {}
+            fields.update (column.name for column in index.columns if ops.get (column.name) == "gin_trgm_ops")
+        return frozenset (fields)
 
     async def offset_paginate_all (
         self,
         model: type[T],
         query: Dict[str, object],
         page: OffsetPaginationType,
-        session: Session
+        session: AsyncSession
     ) -> OffsetPagination[T]:
         """
         Args:
             model (type[T])
             query (Dict[str, object])
             page (OffsetPaginationType)
-            session (Session)
+            session (AsyncSession)
         Returns:
             OffsetPagination[T]
         """
         try:
+            strategy = page.countStrategy or DatabaseConfig.config ().database_count_strategy
             statement = select (model)
 
             if "where" in query:
                 for key, value in query["where"].items ():
                     statement = statement.where (getattr (model, key) == value)
 
+            for condition in query.get ("conditions", []):
+                statement = statement.where (condition)
+
+            if "search" in query:
+                statement = statement.where (query["search"]).order_by (query["rank"].desc ())
+
             if "order_by" in query:
                 for order in query["order_by"]:
                     statement = statement.order_by (order)
@@ -91,12 +291,26 @@ class AppPostgresqlRepository (Generic[T]):
                 for key, value in query["where"].items ():
                     count_statement = count_statement.where (getattr (model, key) == value)
 
-            total = session.exec (count_statement).one ()
+            for condition in query.get ("conditions", []):
+                count_statement = count_statement.where (condition)
+
+            if "search" in query:
+                count_statement = count_statement.where (query["search"])
 
             offset = (page.currentPage - 1) * page.limitPage
-            statement = statement.offset (offset).limit (page.limitPage)
+            # Without a total, one extra row is enough to know whether a next page exists.
+            limit = page.limitPage + 1 if strategy == "none" else page.limitPage
+            statement = statement.offset (offset).limit (limit)
 
-            results = session.exec (statement).all ()
+            results = list ((await session.exec (statement)).all ())
+
+            if strategy == "none":
+                has_next_page = len (results) > page.limitPage
+                results = results[:page.limitPage]
+                total = offset + len (results) + (1 if has_next_page else 0)
+            else:
+                total = await self.count_total (model, count_statement, strategy, session)
+                total = max (total, offset + len (results))
 
             per_page = page.limitPage
             current_page = page.currentPage
@@ -110,7 +324,8 @@ class AppPostgresqlRepository (Generic[T]):
                 previousPage=current_page - 1 if current_page > 1 else None,
                 firstPage=1,
                 lastPage=last_page,
-                data=list (results)
+                countStrategy=strategy,
+                data=results
             )
 
         except Exception as e:
@@ -127,54 +342,199 @@ class AppPostgresqlRepository (Generic[T]):
                 data=[]
             )
 
+    async def count_total (
+        self,
+        model: type[T],
+        count_statement: object,
+        strategy: str,
+        session: AsyncSession
+    ) -> int:
+        """
+        Args:
+            model (type[T])
+            count_statement (object)
+            strategy (str)
+            session (AsyncSession)
+        Returns:
+            int
+        """
+        async def exact () -> int:
+            """
+            Returns:
+                int
+            """
+            return (await session.exec (count_statement)).one ()
+
+        if strategy == "cached":
+            compiled = count_statement.compile ()
+            fingerprint = f"{compiled}|{sorted (compiled.params.items (), key=lambda item: item[0])}"
+            return await cachedCount (model.__tablename__, fingerprint, DatabaseConfig.config ().database_count_ttl, exact)
+
+        if strategy == "estimate":
+            estimate = await self.count_estimate (model, count_statement, session)
+            if estimate is not None:
+                return estimate
+
+        return await exact ()
+
+    async def count_estimate (
+        self,
+        model: type[T],
+        count_statement: object,
+        session: AsyncSession
+    ) -> Optional[int]:
+        """
+        Args:
+            model (type[T])
+            count_statement (object)
+            session (AsyncSession)
+        Returns:
+            Optional[int]
+        """
+        connection = await session.connection ()
+        if connection.dialect.name != "postgresql":
+            return None
+
+        if count_statement.whereclause is None:
+            reltuples = (await session.execute (
+                text ("SELECT reltuples FROM pg_class WHERE oid = to_regclass (:table)").bindparams (table=model.__tablename__)
+            )).scalar ()
+            # reltuples is -1 until the table has been vacuumed or analyzed once.
+            return int (reltuples) if reltuples is not None and reltuples >= 0 else None
+
+        plan = AppDatabaseExplain.planOf ((await session.execute (
+            Explain (count_statement.with_only_columns (literal_column ("1")))
+        )).scalar ())
+        return int (plan.get ("Plan Rows", 0))
+
+    def keyset (self, model: type[T], orders: Optional[List[Orderization]], cursorField: str) -> List[Tuple[str, str]]:
+        """
+        Args:
+            model (type[T])
+            orders (Optional[List[Orderization]])
+            cursorField (str)
+        Returns:
+            List[Tuple[str, str]]
+        """
+        columns = model.__table__.columns
+        keyset: List[Tuple[str, str]] = []
+        for order in orders or []:
+            if isinstance (order, dict):
+                order = Orderization (**order)
+            column = columns.get (order.field) if order.field in self.orderable else None
+            # Nullable columns have no total order under row comparison, only NOT NULL columns can be part of a keyset.
+            if column is None or column.nullable:
+                self.logger.warning (f"Cursor pagination ignores order field: {order.field}")
+                continue
+            if order.field not in [field for field, _ in keyset]:
+                keyset.append ((order.field, order.direction))
+
+        if cursorField not in [field for field, _ in keyset]:
+            keyset.append ((cursorField, keyset[-1][1] if keyset else "asc"))
+        return keyset
+
+    def seek (self, model: type[T], keyset: List[Tuple[str, str]], values: List[object], forward: bool) -> object:
+        """
+        Args:
+            model (type[T])
+            keyset (List[Tuple[str, str]])
+            values (List[object])
+            forward (bool)
+        Returns:
+            object
+        """
+        columns = [getattr (model, field) for field, _ in keyset]
+        greater = [(direction == "asc") == forward for _, direction in keyset]
+
+        if all (greater) or not any (greater):
+            # Binds carry the column types, otherwise datetimes reach the driver untyped inside the row value.
+            bounds = tuple_ (*[literal (value, column.type) for column, value in zip (columns, values)])
+            return tuple_ (*columns) > bounds if all (greater) else tuple_ (*columns) < bounds
+
+        # Mixed directions cannot share one row value, so the comparison expands column by column.
+        clauses = []
+        for index, column in enumerate (columns):
+            equals = [columns[previous] == values[previous] for previous in range (index)]
+            compare = column > values[index] if greater[index] else column < values[index]
+            clauses.append (and_ (*equals, compare))
+        return or_ (*clauses)
+
     async def cursor_paginate_all (
         self,
         model: type[T],
         query: Dict[str, object],
         page: CursorPaginationType,
-        session: Session
+        session: AsyncSession,
+        orders: Optional[List[Orderization]] = None
     ) -> CursorPagination[T]:
         """
         Args:
             model (type[T])
             query (Dict[str, object])
             page (CursorPaginationType)
-            session (Session)
+            session (AsyncSession)
+            orders (Optional[List[Orderization]])
         Returns:
             CursorPagination[T]
         """
+        keyset = self.keyset (model, orders, page.cursorField or "id")
+        values = None
+        if page.cursorPage:
+            values = decodeCursor (str (page.cursorPage), keyset)
+            # A malformed or foreign cursor is the client's mistake, answering with an empty page would read as the end of the list.
+            if values is None:
+                i18n = AppI18n.i18n ()
+                raise HTTPException (status_code=status.HTTP_400_BAD_REQUEST, detail=i18n.t ("_app.error.invalid_cursor"))
+
         try:
+            forward = page.direction != "previous"
             statement = select (model)
 
             if "where" in query:
                 for key, value in query["where"].items ():
                     statement = statement.where (getattr (model, key) == value)
 
-            if page.cursorPage:
-                cursor_field = getattr (model, page.cursorField)
-                statement = statement.where (cursor_field > page.cursorPage)
+            for condition in query.get ("conditions", []):
+                statement = statement.where (condition)
 
-            if "order_by" in query:
-                for order in query["order_by"]:
-                    statement = statement.order_by (order)
-            else:
-                statement = statement.order_by (getattr (model, page.cursorField))
+            # A rank is not a stable keyset, so cursor pages keep their order and use search as a filter only.
+            if "search" in query:
+                statement = statement.where (query["search"])
 
-            statement = statement.limit (page.limitPage + 1)
+            if values is not None:
+                statement = statement.where (self.seek (model, keyset, values, forward))
 
-            results = list (session.exec (statement).all ())
+            for field, direction in keyset:
+                column = getattr (model, field)
+                statement = statement.order_by (column.asc () if (direction == "asc") == forward else column.desc ())
 
-            has_next_page = len (results) > page.limitPage
+            statement = statement.limit (page.limitPage + 1)
 
-            if has_next_page:
-                data = results[:-1]
-                next_cursor = getattr (results[-2], page.cursorField) if len (results) > 1 else None
+            results = list ((await session.exec (statement)).all ())
+            has_more = len (results) > page.limitPage
+            data = results[:page.limitPage]
+            if not forward:
+                data.reverse ()
+
+            def cursorOf (item: T) -> str:
+                """
+                Args:
+                    item (T)
+                Returns:
+                    str
+                """
+                return encodeCursor ([getattr (item, field) for field, _ in keyset], keyset)
+
+            if forward:
+                next_cursor = cursorOf (data[-1]) if has_more and data else None
+                previous_cursor = cursorOf (data[0]) if values is not None and data else None
             else:
-                data = results
-                next_cursor = None
+                next_cursor = cursorOf (data[-1]) if data else None
+                previous_cursor = cursorOf (data[0]) if has_more and data else None
 
             return CursorPagination (
                 nextCursorPage=next_cursor,
+                previousCursorPage=previous_cursor,
                 data=data
             )
 
@@ -186,9 +546,82 @@ class AppPostgresqlRepository (Generic[T]):
                 data=[]
             )
 
+    async def update_many (
+        self,
+        model: type[T],
+        conditions: List[object],
+        values: Dict[str, object],
+        returning: object,
+        session: AsyncSession
+    ) -> List[object]:
+        """
+        Args:
+            model (type[T])
+            conditions (List[object])
+            values (Dict[str, object])
+            returning (object)
+            session (AsyncSession)
+        Returns:
+            List[object]
+        """
+        try:
+            statement = (
+                update (model)
+                .where (*conditions)
+                .values (**values)
+                .returning (returning)
+                .execution_options (synchronize_session=False)
+            )
+            rows = (await session.exec (statement)).scalars ().all ()
+            await AppDatabase.databasePostgresqlCommit (session)
+            return list (rows)
+
+        except Exception as e:
+            await AppDatabase.databasePostgresqlRollback (session)
+            self.logger.warning (f"Update many error: {e}")
+            raise e
+
+    async def update_many_grouped (
+        self,
+        model: type[T],
+        conditions: List[object],
+        values: Dict[str, object],
+        groupBy: object,
+        session: AsyncSession
+    ) -> Dict[object, int]:
+        """
+        Args:
+            model (type[T])
+            conditions (List[object])
+            values (Dict[str, object])
+            groupBy (object)
+            session (AsyncSession)
+        Returns:
+            Dict[object, int]
+        """
+        try:
+            # The updated rows are counted in the database, a wide update sends back one row per group instead of one per row.
+            updated = (
+                update (model)
+                .where (*conditions)
+                .values (**values)
+                .returning (groupBy)
+                .cte ("updated")
+            )
+            column = updated.c[groupBy.key]
+            statement = select (column, func.count ()).group_by (column)
+            rows = (await session.exec (statement)).all ()
+            await AppDatabase.databasePostgresqlCommit (session)
+            return {key: count for key, count in rows}
+
+        except Exception as e:
+            await AppDatabase.databasePostgresqlRollback (session)
+            self.logger.warning (f"Update many grouped error: {e}")
+            raise e
+
     async def access_all (
         self,
-        callback: Callable[[], List[T]],
+        callback: Callable[[], Union[List[T], Awaitable[List[T]]]],
     ) -> List[T]:
         """
         Args:
@@ -198,6 +631,8 @@ class AppPostgresqlRepository (Generic[T]):
         """
         try:
             content = callback ()
+            if isawaitable (content):
+                content = await content
             return content
 
         except Exception as e:
@@ -206,7 +641,7 @@ class AppPostgresqlRepository (Generic[T]):
 
     async def access_get (
         self,
-        callback: Callable[[], Optional[T]],
+        callback: Callable[[], Union[Optional[T], Awaitable[Optional[T]]]],
     ) -> Optional[T]:
         """
         Args:
@@ -216,6 +651,8 @@ class AppPostgresqlRepository (Generic[T]):
         """
         try:
             content = callback ()
+            if isawaitable (content):
+                content = await content
             return content
 
         except Exception as e:
@@ -224,22 +661,24 @@ class AppPostgresqlRepository (Generic[T]):
 
     async def mutate (
         self,
-        callback: Callable[[Session], Optional[T]],
-        session: Session
+        callback: Callable[[AsyncSession], Union[Optional[T], Awaitable[Optional[T]]]],
+        session: AsyncSession
     ) -> Optional[T]:
         """
         Args:
             callback (Callable)
-            session (Session)
+            session (AsyncSession)
         Returns:
             Optional[T]
         """
         try:
             content = callback (session)
-            session.commit ()
+            if isawaitable (content):
+                content = await content
+            await AppDatabase.databasePostgresqlCommit (session)
             return content
 
         except Exception as e:
-            session.rollback ()
+            await AppDatabase.databasePostgresqlRollback (session)
             self.logger.warning (f"Mutation error: {e}")
             raise e
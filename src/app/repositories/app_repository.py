@@ -3,6 +3,10 @@ from pydantic import BaseModel, Field
 
 T = TypeVar ("T")
 
+COUNT_STRATEGIES = ("exact", "cached", "estimate", "none")
+FILTER_OPERATORS = ("eq", "prefix", "contains", "range", "in")
+FILTER_IN_LIMIT = 100
+
 class SoftDeletion (BaseModel):
     """
     SoftDeletion (BaseModel)
@@ -19,9 +23,11 @@ class OffsetPaginationType (BaseModel):
     Attributes:
         currentPage (Optional[int])
         limitPage (Optional[int])
+        countStrategy (Optional[str])
     """
     currentPage: Optional[int] = Field (None, ge=1)
     limitPage: Optional[int] = Field (None, ge=1, le=100)
+    countStrategy: Optional[str] = Field (None, pattern="^(exact|cached|estimate|none)$")
 
 class CursorPaginationType (BaseModel):
     """
@@ -31,10 +37,12 @@ class CursorPaginationType (BaseModel):
         cursorField (Optional[str])
         cursorPage (Optional[Union[int, str]])
         limitPage (Optional[int])
+        direction (Optional[str])
     """
     cursorField: Optional[str] = None
     cursorPage: Optional[Union[int, str]] = None
     limitPage: Optional[int] = Field (None, ge=1, le=100)
+    direction: Optional[str] = Field ("next", pattern="^(next|previous)$")
 
 class OffsetPagination (BaseModel, Generic[T]):
     """
@@ -48,6 +56,7 @@ class OffsetPagination (BaseModel, Generic[T]):
         previousPage (Optional[int])
         firstPage (int)
         lastPage (int)
+        countStrategy (str)
         data (List[T])
     """
     totalPage: int
@@ -57,6 +66,7 @@ class OffsetPagination (BaseModel, Generic[T]):
     previousPage: Optional[int] = None
     firstPage: int
     lastPage: int
+    countStrategy: str = "exact"
     data: List[T]
 
 class CursorPagination (BaseModel, Generic[T]):
@@ -65,9 +75,11 @@ class CursorPagination (BaseModel, Generic[T]):
 
     Attributes:
         nextCursorPage (Optional[Union[int, str]])
+        previousCursorPage (Optional[Union[int, str]])
         data (List[T])
     """
     nextCursorPage: Optional[Union[int, str]] = None
+    previousCursorPage: Optional[Union[int, str]] = None
     data: List[T]
 
 class Orderization (BaseModel):
@@ -88,9 +100,11 @@ class Filterization (BaseModel):
     Attributes:
         field (str)
         search (str)
+        operator (Optional[str])
     """
     field: str
     search: str
+    operator: Optional[str] = Field (None, pattern="^(eq|prefix|contains|range|in)$")
 
 class AppRepository (Protocol):
     """
@@ -103,19 +117,21 @@ class AppRepository (Protocol):
         """
         ...
 
-    def order (self, orders: List[Orderization]) -> Dict[str, object]:
+    def order (self, orders: List[Orderization], model: Optional[type] = None) -> Dict[str, object]:
         """
         Args:
             orders (List[Orderization])
+            model (Optional[type])
         Returns:
             Dict[str, object]
         """
         ...
 
-    def filter (self, filters: List[Filterization]) -> Dict[str, object]:
+    def filter (self, filters: List[Filterization], model: Optional[type] = None) -> Dict[str, object]:
         """
         Args:
             filters (List[Filterization])
+            model (Optional[type])
         Returns:
             Dict[str, object]
         """
@@ -1,17 +1,65 @@
+import time
 import socketio
 from typing import Any, Dict, Optional
 from urllib.parse import parse_qs
 from fastapi import FastAPI
-from sqlmodel import Session, select
 from src.app.bases.app_realtime import userRoom
 from src.app.schemas.app_schema import createGraphQLRouter
 from src.app.configs.cache_config import CacheConfig
-from src.app.bases.app_auth import AppAuth
-from src.app.bases.app_database import AppDatabase
-from src.v1.api.user.databases.models.user_model import User
+from src.app.bases.app_auth_token import AppAuthToken
+from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_realtime_handshake import AppRealtimeHandshake
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
 
 _socketio_server: socketio.AsyncServer = None
 
+def handshakeToken (environ: Dict[str, Any], auth: Optional[Dict[str, object]]) -> Optional[str]:
+    """
+    Args:
+        environ (Dict[str, Any])
+        auth (Optional[Dict[str, object]])
+    Returns:
+        Optional[str]
+    """
+    if auth and isinstance (auth, dict):
+        rawToken = auth.get ("token")
+        if isinstance (rawToken, str) and rawToken:
+            return rawToken
+
+    queryString = environ.get ("QUERY_STRING", "")
+    if queryString:
+        parsed = parse_qs (queryString)
+        values = parsed.get ("token") or parsed.get ("access_token")
+        if values:
+            return str (values[0])
+    return None
+
+async def authenticateHandshake (environ: Dict[str, Any], auth: Optional[Dict[str, object]]) -> Optional[str]:
+    """
+    Args:
+        environ (Dict[str, Any])
+        auth (Optional[Dict[str, object]])
+    Returns:
+        Optional[str]
+    """
+    token = handshakeToken (environ, auth)
+    if token is None:
+        return None
+
+    payload = await AppAuthToken.verify (token, "access")
+    if not payload:
+        return None
+
+    userId = payload.get ("sub")
+    if not isinstance (userId, str) or not userId:
+        return None
+
+    # The principal is looked up for the deleted check and for verification, which a token minted at login would freeze.
+    user = await UserPrincipalRepository.findById (userId)
+    if not user or user.email_verified_at is None:
+        return None
+    return userId
+
 def getSocketIOServer () -> socketio.AsyncServer:
     """
     Args:
@@ -39,50 +87,24 @@ def getSocketIOServer () -> socketio.AsyncServer:
             Returns:
                 bool
             """
-            token: Optional[str] = None
-
-            if auth and isinstance (auth, dict):
-                rawToken = auth.get ("token")
-                if isinstance (rawToken, str) and rawToken:
-                    token = rawToken
-
-            if token is None:
-                queryString = environ.get ("QUERY_STRING", "")
-                if queryString:
-                    parsed = parse_qs (queryString)
-                    values = parsed.get ("token") or parsed.get ("access_token")
-                    if values:
-                        token = str (values[0])
-
-            if token is None:
-                return False
-
-            isBlacklisted = await AppAuth.isTokenBlacklisted (token)
-            if isBlacklisted:
-                return False
+            if not AppRealtimeHandshake.admit ():
+                # Refused with data rather than False, so clients can tell overload from bad credentials and back off.
+                raise socketio.exceptions.ConnectionRefusedError (AppI18n.i18n ().t ("_app.error.service_overloaded"), {"retryAfter": 1})
 
-            payload = AppAuth.verifyToken (token, "access")
-            if not payload:
-                return False
-
-            userId = payload.get ("sub")
-            if not isinstance (userId, str) or not userId:
-                return False
-
-            engine = AppDatabase.databasePostgresql ()
-            session = Session (engine)
+            started = time.perf_counter ()
+            outcome = "failed"
             try:
-                statement = select (User).where (User.id == userId, User.deleted_at == None)
-                user = session.exec (statement).first ()
-
-                if not user or user.email_verified_at is None:
+                userId = await authenticateHandshake (environ, auth)
+                if userId is None:
+                    outcome = "denied"
                     return False
-            finally:
-                session.close ()
 
-            await _socketio_server.save_session (sid, {"userId": userId})
-            await _socketio_server.enter_room (sid, userRoom (userId))
-            return True
+                await _socketio_server.save_session (sid, {"userId": userId})
+                await _socketio_server.enter_room (sid, userRoom (userId))
+                outcome = "accepted"
+                return True
+            finally:
+                AppRealtimeHandshake.release (outcome, started)
 
     return _socketio_server
 
@@ -35,7 +35,7 @@ def createSchema () -> Schema:
             if not user:
                 return None
             try:
-                result = await UserAuthService.me (user.id)
+                result = await UserAuthService.meCached (user.id)
                 return UserTransformerDto.fromModel (result) if result else None
             except Exception:
                 return None
@@ -68,7 +68,7 @@ def createSchema () -> Schema:
                 identifierValue=inputs.identifierValue,
                 password=inputs.password
             )
-            result = await UserAuthService.login (dto)
+            result = await UserAuthService.login (dto, info.context.get ("background_tasks"))
             return UserAuthTransformerDto (
                 accessTokenTtl=float (result.accessTokenTtl) if result.accessTokenTtl else None,
                 refreshTokenTtl=float (result.refreshTokenTtl) if result.refreshTokenTtl else None,
@@ -4,6 +4,8 @@ import psutil
 from sqlalchemy import text
 from src.app.bases.app_context import AppContext
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_password_hasher import AppPasswordHasher
+from src.app.bases.app_realtime_handshake import AppRealtimeHandshake
 from src.app.configs.app_config import AppConfig
 
 class HealthStatus (str, Enum):
@@ -125,7 +127,7 @@ class AppHealthService:
             HealthCheckResult
         """
         try:
-            engine = AppDatabase.databasePostgresql ()
+            engine = AppDatabase.databasePostgresqlAsync ()
 
             if engine is None:
                 return HealthCheckResult (
@@ -138,14 +140,15 @@ class AppHealthService:
                     }
                 )
 
-            with engine.connect () as connection:
-                connection.execute (text ("SELECT 1"))
+            async with engine.connect () as connection:
+                await connection.execute (text ("SELECT 1"))
 
             return HealthCheckResult (
                 status=HealthStatus.UP,
                 info={
                     "database": {
                         "status": HealthStatus.UP.value,
+                        "pool": AppDatabase.databasePostgresqlPoolStats (),
                     }
                 }
             )
@@ -156,6 +159,7 @@ class AppHealthService:
                     "database": {
                         "status": HealthStatus.DOWN.value,
                         "error": str (e),
+                        "pool": AppDatabase.databasePostgresqlPoolStats (),
                     }
                 }
             )
@@ -203,6 +207,44 @@ class AppHealthService:
                 }
             )
 
+    @staticmethod
+    def checkPasswordHasher () -> HealthCheckResult:
+        """
+        Args:
+            None
+        Returns:
+            HealthCheckResult
+        """
+        # A saturated pool sheds logins with 503 on its own, it is reported here but never marks the instance down.
+        return HealthCheckResult (
+            status=HealthStatus.UP,
+            info={
+                "password_hasher": {
+                    "status": HealthStatus.UP.value,
+                    **AppPasswordHasher.stats (),
+                }
+            }
+        )
+
+    @staticmethod
+    def checkRealtimeHandshake () -> HealthCheckResult:
+        """
+        Args:
+            None
+        Returns:
+            HealthCheckResult
+        """
+        # Throttled handshakes are retried by the clients, like the hasher this is reported and never marks the instance down.
+        return HealthCheckResult (
+            status=HealthStatus.UP,
+            info={
+                "realtime_handshake": {
+                    "status": HealthStatus.UP.value,
+                    **AppRealtimeHandshake.stats (),
+                }
+            }
+        )
+
     @classmethod
     async def checkAll (cls, memory_threshold: Optional[int] = None) -> Dict[str, object]:
         """
@@ -221,18 +263,24 @@ class AppHealthService:
         rss_check = cls.checkMemoryRss (memory_threshold)
         db_check = await cls.checkDatabase ()
         cache_check = await cls.checkCache ()
+        hasher_check = cls.checkPasswordHasher ()
+        handshake_check = cls.checkRealtimeHandshake ()
 
         all_info = {}
         all_info.update (heap_check.info)
         all_info.update (rss_check.info)
         all_info.update (db_check.info)
         all_info.update (cache_check.info)
+        all_info.update (hasher_check.info)
+        all_info.update (handshake_check.info)
 
         all_statuses = [
             heap_check.status,
             rss_check.status,
             db_check.status,
             cache_check.status,
+            hasher_check.status,
+            handshake_check.status,
         ]
 
         overall_status = HealthStatus.UP if all (s == HealthStatus.UP for s in all_statuses) else HealthStatus.DOWN
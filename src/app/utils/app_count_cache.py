@@ -0,0 +1,36 @@
+from typing import Awaitable, Callable
+import hashlib
+import logging
+from src.app.bases.app_context import AppContext
+
+COUNT_KEY_PREFIX = "pagination:count"
+
+logger = logging.getLogger (__name__)
+
+async def cachedCount (namespace: str, fingerprint: str, ttl: int, counter: Callable[[], Awaitable[int]]) -> int:
+    """
+    Args:
+        namespace (str)
+        fingerprint (str)
+        ttl (int)
+        counter (Callable[[], Awaitable[int]])
+    Returns:
+        int
+    """
+    cache = AppContext.cacheRedis ()
+    key = f"{COUNT_KEY_PREFIX}:{namespace}:{hashlib.sha1 (fingerprint.encode ('utf-8')).hexdigest ()}"
+    if cache is not None:
+        try:
+            cached = await cache.get (key)
+            if cached is not None:
+                return int (cached)
+        except Exception as e:
+            logger.warning (f"Count cache read error: {e}")
+
+    total = await counter ()
+    if cache is not None and ttl > 0:
+        try:
+            await cache.set (key, total, ex=ttl)
+        except Exception as e:
+            logger.warning (f"Count cache write error: {e}")
+    return total
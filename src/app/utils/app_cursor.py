@@ -0,0 +1,58 @@
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+import base64
+import json
+
+def encodeCursor (values: List[object], signature: List[Tuple[str, str]]) -> str:
+    """
+    Args:
+        values (List[object])
+        signature (List[Tuple[str, str]])
+    Returns:
+        str
+    """
+    keys = []
+    for value in values:
+        if isinstance (value, datetime):
+            keys.append ({"dt": value.isoformat ()})
+        elif isinstance (value, date):
+            keys.append ({"d": value.isoformat ()})
+        else:
+            keys.append (value)
+    payload = json.dumps ({"k": keys, "s": [list (item) for item in signature]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode (payload.encode ("utf-8")).decode ("ascii").rstrip ("=")
+
+def decodeCursor (cursor: str, signature: List[Tuple[str, str]]) -> Optional[List[object]]:
+    """
+    Args:
+        cursor (str)
+        signature (List[Tuple[str, str]])
+    Returns:
+        Optional[List[object]]
+    """
+    try:
+        padded = cursor + "=" * (-len (cursor) % 4)
+        payload = json.loads (base64.urlsafe_b64decode (padded.encode ("ascii")))
+    except (ValueError, TypeError):
+        return None
+
+    # A cursor minted under another sort order would seek to a meaningless position.
+    if not isinstance (payload, dict) or payload.get ("s") != [list (item) for item in signature]:
+        return None
+
+    keys = payload.get ("k")
+    if not isinstance (keys, list) or len (keys) != len (signature):
+        return None
+
+    values: List[object] = []
+    try:
+        for key in keys:
+            if isinstance (key, dict) and "dt" in key:
+                values.append (datetime.fromisoformat (key["dt"]))
+            elif isinstance (key, dict) and "d" in key:
+                values.append (date.fromisoformat (key["d"]))
+            else:
+                values.append (key)
+    except (ValueError, TypeError):
+        return None
+    return values
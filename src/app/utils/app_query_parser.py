@@ -1,4 +1,5 @@
 from typing import Optional, List, Dict
+from src.app.repositories.app_repository import FILTER_OPERATORS
 
 def parseOrders (orders: Optional[str]) -> Optional[List[Dict[str, str]]]:
     """
@@ -30,8 +31,15 @@ def parseFilters (filters: Optional[str]) -> Optional[List[Dict[str, str]]]:
 
     parsedFilters: List[Dict[str, str]] = []
     for filter_item in filters.split (","):
-        parts = filter_item.split (":")
-        if len (parts) == 2:
-            parsedFilters.append ({"field": parts[0].strip (), "search": parts[1].strip ()})
+        field, separator, search = filter_item.partition (":")
+        if not separator or not field.strip ():
+            continue
+
+        # field:operator:value, or field:value for the field's default operator; values may contain colons.
+        operator, separator, value = search.partition (":")
+        if separator and operator.strip () in FILTER_OPERATORS:
+            parsedFilters.append ({"field": field.strip (), "operator": operator.strip (), "search": value.strip ()})
+        else:
+            parsedFilters.append ({"field": field.strip (), "search": search.strip ()})
 
     return parsedFilters if parsedFilters else None
@@ -0,0 +1,85 @@
+from typing import Dict, Optional, Set
+import asyncio
+import logging
+from fastapi import BackgroundTasks, HTTPException, status
+from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_queue import AppQueue
+from src.app.bases.app_queue_processor import AppQueueProcessor
+
+logger = logging.getLogger (__name__)
+
+# The loop only holds weak references to tasks, these keep fallback jobs alive until they finish.
+_background_jobs: Set[asyncio.Task] = set ()
+
+async def dispatch (
+    queue_name: str,
+    job_name: str,
+    *args: object,
+    meta: Optional[Dict[str, object]] = None
+) -> str:
+    """
+    Args:
+        queue_name (str)
+        job_name (str)
+        *args (object)
+        meta (Optional[Dict[str, object]])
+    Returns:
+        str
+    """
+    try:
+        job = await asyncio.to_thread (
+            AppQueue.enqueue,
+            queue_name,
+            job_name,
+            *args,
+            meta=meta or {},
+        )
+        return job.id
+    except Exception as e:
+        logger.warning (f"Queue dispatch error for {job_name}: {e}")
+        i18n = AppI18n.i18n ()
+        raise HTTPException (
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=i18n.t ("_app.error.queue_unavailable"),
+            headers={"Retry-After": "5"},
+        )
+
+async def dispatch_or_background (
+    background_tasks: Optional[BackgroundTasks],
+    queue_name: str,
+    job_name: str,
+    *args: object,
+    meta: Optional[Dict[str, object]] = None
+) -> Optional[str]:
+    """
+    Args:
+        background_tasks (Optional[BackgroundTasks])
+        queue_name (str)
+        job_name (str)
+        *args (object)
+        meta (Optional[Dict[str, object]])
+    Returns:
+        Optional[str]
+    """
+    try:
+        job = await asyncio.to_thread (
+            AppQueue.enqueue,
+            queue_name,
+            job_name,
+            *args,
+            meta=meta or {},
+        )
+        return job.id
+    except Exception as e:
+        handler = AppQueueProcessor.getHandler (queue_name, job_name)
+        if handler is None:
+            raise
+        # Without a reachable queue the job still runs, in-process.
+        logger.warning (f"Queue dispatch error for {job_name}, running in background: {e}")
+        if background_tasks is not None:
+            background_tasks.add_task (handler, *args)
+        else:
+            task = asyncio.create_task (handler (*args))
+            _background_jobs.add (task)
+            task.add_done_callback (_background_jobs.discard)
+        return None
@@ -1,5 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 from src.app.bases.app_queue import AppQueue
+from src.app.constants.queue_constants import PRIORITY_QUEUES
 from rq.job import Job
 
 def enqueue_with_priority (
@@ -36,3 +37,44 @@ def enqueue_with_priority (
         result_ttl=result_ttl,
         failure_ttl=failure_ttl
     )
+
+def enqueue_many_with_priority (
+    base_queue: str,
+    job_name: str,
+    jobs: Iterable[Dict[str, object]],
+    priority: str = "normal",
+    job_timeout: Optional[int] = None,
+    result_ttl: Optional[int] = None,
+    failure_ttl: Optional[int] = None,
+    ttl: Optional[int] = None,
+    dedup_ttl: Optional[int] = None
+) -> List[Job]:
+    """
+    Args:
+        base_queue (str)
+        job_name (str)
+        jobs (Iterable[Dict[str, object]])
+        priority (str)
+        job_timeout (Optional[int])
+        result_ttl (Optional[int])
+        failure_ttl (Optional[int])
+        ttl (Optional[int])
+        dedup_ttl (Optional[int])
+    Returns:
+        List[Job]
+    """
+    if priority in PRIORITY_QUEUES:
+        queue_name = PRIORITY_QUEUES[priority]
+    else:
+        queue_name = base_queue
+
+    return AppQueue.enqueueMany (
+        queue_name,
+        job_name,
+        jobs,
+        job_timeout=job_timeout,
+        result_ttl=result_ttl,
+        failure_ttl=failure_ttl,
+        ttl=ttl,
+        dedup_ttl=dedup_ttl
+    )
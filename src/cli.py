@@ -4,7 +4,9 @@ import sys
 sys.path.insert (0, str (Path (__file__).parent.parent))
 
 from src.app.bases.app_console import AppConsole
+from src.app.consoles.commands.app_auth_hash_command import authHashBenchmarkCommand
 from src.app.consoles.commands.app_cache_command import cacheClearCommand
+from src.app.consoles.commands.app_database_explain_command import databaseExplainCommand
 from src.app.consoles.commands.app_migrate_command import migrateUpCommand, migrateDownCommand, migrateStatusCommand
 from src.app.consoles.commands.app_queue_command import queueWorkCommand
 from src.app.consoles.commands.app_queue_failed_command import queueFailedCommand
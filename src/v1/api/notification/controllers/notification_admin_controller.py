@@ -1,15 +1,16 @@
 from typing import Optional
+from src.app.dependencies.app_acl_dependency import requirePermission
 from src.app.dependencies.app_rate_limit import rateLimit
 from fastapi import APIRouter, Depends, Query, status, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 from src.app.bases.app_security import security
 from src.app.dependencies.app_auth_api_dependency import get_current_user
-from src.app.dtos.app_dto import Status, Description
-from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType
+from src.app.dtos.app_dto import BatchPayloadType, Status, Description, JobPayloadType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination, OffsetPaginationType
 from src.app.utils.app_query_parser import parseOrders, parseFilters
 from src.app.utils.app_response_helper import getStandardResponses, getPaginationResponses
 from src.v1.api.notification.dtos.notification_transformer_dto import NotificationTransformerDto
-from src.v1.api.notification.dtos.notification_validator_dto import NotificationIdentifierDto, NotificationCreateValidatorDto, NotificationUpdateValidatorDto
+from src.v1.api.notification.dtos.notification_validator_dto import NotificationIdentifierDto, NotificationAdminBulkValidatorDto, NotificationBroadcastValidatorDto, NotificationCreateValidatorDto, NotificationUpdateValidatorDto
 from src.v1.api.notification.services.notification_admin_service import NotificationAdminService
 from src.v1.api.user.databases.models.user_model import User
 
@@ -18,7 +19,7 @@ notificationAdminRouter = APIRouter (prefix="/api/v1/admin/notifications", tags=
 @notificationAdminRouter.get (
     "/",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.view")],
     response_model=OffsetPagination[NotificationTransformerDto],
     responses=getPaginationResponses (
         item_example={
@@ -38,20 +39,124 @@ notificationAdminRouter = APIRouter (prefix="/api/v1/admin/notifications", tags=
 async def index (
     current_user: User = Depends (get_current_user),
     orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc,type:asc')"),
-    filters: Optional[str] = Query (None, description="Filter by fields (e.g., 'type:info,user_id:123')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, range, in (e.g., 'type:prefix:user.,user_id:in:123|456')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked full-text search over notification data"),
     limitPage: Optional[int] = Query (10, ge=1, le=100),
-    currentPage: Optional[int] = Query (1, ge=1)
+    currentPage: Optional[int] = Query (1, ge=1),
+    countStrategy: Optional[str] = Query (None, pattern="^(exact|cached|estimate|none)$", description="Total count strategy (exact, cached, estimate, none)")
 ) -> OffsetPagination[NotificationTransformerDto]:
     """
     Index
     """
-    page = OffsetPaginationType (currentPage=currentPage or 1, limitPage=limitPage or 10)
-    return await NotificationAdminService.all (current_user.id, parseOrders (orders), parseFilters (filters), page)
+    page = OffsetPaginationType (currentPage=currentPage or 1, limitPage=limitPage or 10, countStrategy=countStrategy)
+    return await NotificationAdminService.all (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
+
+@notificationAdminRouter.get (
+    "/cursor",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.view")],
+    response_model=CursorPagination[NotificationTransformerDto],
+    responses=getStandardResponses (unauthorized=True, forbidden=True)
+)
+async def indexCursor (
+    current_user: User = Depends (get_current_user),
+    orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, range, in (e.g., 'type:prefix:user.,user_id:in:123|456')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked full-text search over notification data"),
+    limitPage: Optional[int] = Query (10, ge=1, le=100),
+    cursorPage: Optional[str] = Query (None, description="Opaque cursor from nextCursorPage or previousCursorPage"),
+    direction: Optional[str] = Query ("next", pattern="^(next|previous)$")
+) -> CursorPagination[NotificationTransformerDto]:
+    """
+    Index Cursor
+    """
+    page = CursorPaginationType (cursorField="id", cursorPage=cursorPage, limitPage=limitPage or 10, direction=direction or "next")
+    return await NotificationAdminService.allCursor (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
+
+@notificationAdminRouter.post (
+    "/broadcast",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=5, seconds=60), Depends (security), requirePermission ("notification.create")],
+    response_model=JobPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def broadcast (
+    data: NotificationBroadcastValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> JobPayloadType:
+    """
+    Broadcast
+    """
+    return await NotificationAdminService.broadcast (current_user.id, data)
+
+@notificationAdminRouter.put (
+    "/bulk/read",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.update")],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def readBulk (
+    data: NotificationAdminBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Read Bulk
+    """
+    return await NotificationAdminService.readMany (current_user.id, data)
+
+@notificationAdminRouter.put (
+    "/bulk/unread",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.update")],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def unreadBulk (
+    data: NotificationAdminBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Unread Bulk
+    """
+    return await NotificationAdminService.unreadMany (current_user.id, data)
+
+@notificationAdminRouter.put (
+    "/bulk/deactivate",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.delete")],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def deleteBulk (
+    data: NotificationAdminBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Deactivate Bulk
+    """
+    return await NotificationAdminService.deleteMany (current_user.id, data)
+
+@notificationAdminRouter.put (
+    "/bulk/activate",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.restore")],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def restoreBulk (
+    data: NotificationAdminBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Activate Bulk
+    """
+    return await NotificationAdminService.restoreMany (current_user.id, data)
 
 @notificationAdminRouter.get (
     "/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.view")],
     response_model=NotificationTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -67,7 +172,7 @@ async def show (
 @notificationAdminRouter.delete (
     "/activate/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.restore")],
     response_model=NotificationTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -83,7 +188,7 @@ async def activate (
 @notificationAdminRouter.delete (
     "/deactivate/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("notification.delete")],
     response_model=NotificationTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -2,14 +2,15 @@ from typing import Optional
 from src.app.dependencies.app_rate_limit import rateLimit
 from fastapi import APIRouter, Depends, Query, status, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
+from src.app.bases.app_response_cache import cacheResponse
 from src.app.bases.app_security import security
 from src.app.dependencies.app_auth_api_dependency import get_current_user
 from src.app.dtos.app_dto import BatchPayloadType, Status, Description
-from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination, OffsetPaginationType
 from src.app.utils.app_query_parser import parseOrders, parseFilters
 from src.app.utils.app_response_helper import getStandardResponses, getPaginationResponses
 from src.v1.api.notification.dtos.notification_transformer_dto import NotificationTransformerDto, NotificationCountTransformerDto, NotificationUnreadTransformerDto
-from src.v1.api.notification.dtos.notification_validator_dto import NotificationIdentifierDto
+from src.v1.api.notification.dtos.notification_validator_dto import NotificationBulkValidatorDto, NotificationIdentifierDto
 from src.v1.api.notification.services.notification_user_service import NotificationUserService
 from src.v1.api.user.databases.models.user_model import User
 
@@ -35,18 +36,44 @@ notificationUserRouter = APIRouter (prefix="/api/v1/notifications", tags=["Notif
         forbidden=True
     )
 )
+@cacheResponse (tags=("notifications:{user}",))
 async def index (
     current_user: User = Depends (get_current_user),
     orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc,type:asc')"),
-    filters: Optional[str] = Query (None, description="Filter by fields (e.g., 'type:info')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, range, in (e.g., 'type:info,created_at:range:2024-01-01..')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked full-text search over notification data"),
     limitPage: Optional[int] = Query (10, ge=1, le=100),
-    currentPage: Optional[int] = Query (1, ge=1)
+    currentPage: Optional[int] = Query (1, ge=1),
+    countStrategy: Optional[str] = Query (None, pattern="^(exact|cached|estimate|none)$", description="Total count strategy (exact, cached, estimate, none)")
 ) -> OffsetPagination[NotificationTransformerDto]:
     """
     Index
     """
-    page = OffsetPaginationType (currentPage=currentPage or 1, limitPage=limitPage or 10)
-    return await NotificationUserService.all (current_user.id, parseOrders (orders), parseFilters (filters), page)
+    page = OffsetPaginationType (currentPage=currentPage or 1, limitPage=limitPage or 10, countStrategy=countStrategy)
+    return await NotificationUserService.all (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
+
+@notificationUserRouter.get (
+    "/cursor",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    response_model=CursorPagination[NotificationTransformerDto],
+    responses=getStandardResponses (unauthorized=True, forbidden=True)
+)
+@cacheResponse (tags=("notifications:{user}",))
+async def indexCursor (
+    current_user: User = Depends (get_current_user),
+    orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, range, in (e.g., 'type:info,created_at:range:2024-01-01..')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked full-text search over notification data"),
+    limitPage: Optional[int] = Query (10, ge=1, le=100),
+    cursorPage: Optional[str] = Query (None, description="Opaque cursor from nextCursorPage or previousCursorPage"),
+    direction: Optional[str] = Query ("next", pattern="^(next|previous)$")
+) -> CursorPagination[NotificationTransformerDto]:
+    """
+    Index Cursor
+    """
+    page = CursorPaginationType (cursorField="id", cursorPage=cursorPage, limitPage=limitPage or 10, direction=direction or "next")
+    return await NotificationUserService.allCursor (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
 
 @notificationUserRouter.get (
     "/count",
@@ -55,6 +82,7 @@ async def index (
     response_model=NotificationCountTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True)
 )
+@cacheResponse (tags=("notifications:{user}",))
 async def count (
     current_user: User = Depends (get_current_user)
 ) -> NotificationCountTransformerDto:
@@ -78,6 +106,70 @@ async def readAll (
     """
     return await NotificationUserService.readAll (current_user.id)
 
+@notificationUserRouter.put (
+    "/bulk/read",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def readBulk (
+    data: NotificationBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Read Bulk
+    """
+    return await NotificationUserService.readMany (current_user.id, data)
+
+@notificationUserRouter.put (
+    "/bulk/unread",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def unreadBulk (
+    data: NotificationBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Unread Bulk
+    """
+    return await NotificationUserService.unreadMany (current_user.id, data)
+
+@notificationUserRouter.put (
+    "/bulk/delete",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def deleteBulk (
+    data: NotificationBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Delete Bulk
+    """
+    return await NotificationUserService.deleteMany (current_user.id, data)
+
+@notificationUserRouter.put (
+    "/bulk/restore",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    response_model=BatchPayloadType,
+    responses=getStandardResponses (unauthorized=True, forbidden=True, unvalidated=True)
+)
+async def restoreBulk (
+    data: NotificationBulkValidatorDto,
+    current_user: User = Depends (get_current_user)
+) -> BatchPayloadType:
+    """
+    Restore Bulk
+    """
+    return await NotificationUserService.restoreMany (current_user.id, data)
+
 @notificationUserRouter.put (
     "/read/{id}",
     status_code=Status.OK,
@@ -101,6 +193,7 @@ async def read (
     response_model=NotificationUnreadTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True)
 )
+@cacheResponse (tags=("notifications:{user}",))
 async def unread (
     current_user: User = Depends (get_current_user)
 ) -> NotificationUnreadTransformerDto:
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Dict
-from sqlalchemy import Text
+from sqlalchemy import Index, Text, text
 from sqlmodel import SQLModel, Field, Relationship, Column, JSON
 from ulid import ULID
 
@@ -19,6 +19,14 @@ class Notification (SQLModel, table=True):
         deleted_at (Optional[datetime])
     """
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index ("notifications_user_id_id_active_index", "user_id", "id", postgresql_where=text ("deleted_at IS NULL")),
+        Index ("notifications_user_id_created_at_active_index", "user_id", "created_at", postgresql_where=text ("deleted_at IS NULL")),
+        Index ("notifications_user_id_unread_index", "user_id", postgresql_where=text ("deleted_at IS NULL AND read_at IS NULL")),
+        Index ("notifications_created_at_active_index", "created_at", postgresql_where=text ("deleted_at IS NULL")),
+        Index ("notifications_user_id_type_active_index", "user_id", "type", postgresql_ops={"type": "varchar_pattern_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+        Index ("notifications_type_active_index", "type", postgresql_ops={"type": "varchar_pattern_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+    )
     id: str = Field (primary_key=True, default_factory=lambda: str (ULID ()))
     user_id: str = Field (foreign_key="users.id", index=True)
     type: str = Field (max_length=255)
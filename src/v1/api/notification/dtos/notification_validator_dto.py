@@ -1,5 +1,7 @@
-from typing import Optional, Dict
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, Dict, List
+from typing_extensions import Self
+from pydantic import BaseModel, Field, model_validator
 
 class NotificationIdentifierDto (BaseModel):
     """
@@ -33,3 +35,54 @@ class NotificationCreateValidatorDto (BaseModel):
     user_id: str = Field (..., json_schema_extra={"example": "01HZGXQZJQK9X5Y7Z8W9V0U1T2"})
     type: str = Field (..., max_length=255, json_schema_extra={"example": "info"})
     data: Dict[str, object] = Field (..., json_schema_extra={"example": {"title": "Welcome", "body": "Welcome to our platform"}})
+
+class NotificationBroadcastValidatorDto (BaseModel):
+    """
+    NotificationBroadcastValidatorDto (BaseModel)
+
+    Attributes:
+        type (str)
+        data (Dict[str, object])
+        user_ids (Optional[List[str]])
+        verified_only (bool)
+    """
+    type: str = Field (..., max_length=255, json_schema_extra={"example": "announcement"})
+    data: Dict[str, object] = Field (..., json_schema_extra={"example": {"title": "Maintenance", "body": "Scheduled maintenance tonight"}})
+    user_ids: Optional[List[str]] = Field (None, min_length=1, json_schema_extra={"example": None})
+    verified_only: bool = Field (False, json_schema_extra={"example": False})
+
+class NotificationBulkValidatorDto (BaseModel):
+    """
+    NotificationBulkValidatorDto (BaseModel)
+
+    Attributes:
+        ids (Optional[List[str]])
+        type (Optional[str])
+        read (Optional[bool])
+        created_before (Optional[datetime])
+    """
+    ids: Optional[List[str]] = Field (None, min_length=1, max_length=1000, json_schema_extra={"example": ["01HZGXQZJQK9X5Y7Z8W9V0U1T2"]})
+    type: Optional[str] = Field (None, max_length=255, json_schema_extra={"example": None})
+    read: Optional[bool] = Field (None, json_schema_extra={"example": None})
+    created_before: Optional[datetime] = Field (None, json_schema_extra={"example": None})
+
+class NotificationAdminBulkValidatorDto (NotificationBulkValidatorDto):
+    """
+    NotificationAdminBulkValidatorDto (NotificationBulkValidatorDto)
+
+    Attributes:
+        user_id (Optional[str])
+    """
+    user_id: Optional[str] = Field (None, json_schema_extra={"example": None})
+
+    @model_validator (mode="after")
+    def validate_criteria (self) -> Self:
+        """
+        Args:
+            self
+        Returns:
+            NotificationAdminBulkValidatorDto
+        """
+        if self.ids is None and self.user_id is None and self.type is None and self.created_before is None:
+            raise ValueError ("_v1_notification.bulk_criteria_required")
+        return self
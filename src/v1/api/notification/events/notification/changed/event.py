@@ -0,0 +1,11 @@
+from typing import List
+from src.app.bases.app_event_base import AppEventBase
+
+class NotificationChangedEvent (AppEventBase):
+    """
+    NotificationChangedEvent (AppEventBase)
+
+    Attributes:
+        userIds (List[str])
+    """
+    userIds: List[str]
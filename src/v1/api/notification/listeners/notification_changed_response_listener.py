@@ -0,0 +1,20 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_response_cache import AppResponseCache
+from src.v1.api.notification.events.notification.changed.event import NotificationChangedEvent
+
+@OnEvent ("v1.notification.created")
+@OnEvent ("v1.notification.read")
+@OnEvent ("v1.notification.unread")
+@OnEvent ("v1.notification.deleted")
+@OnEvent ("v1.notification.restored")
+async def handleNotificationChangedResponse (event: NotificationChangedEvent) -> None:
+    """
+    Args:
+        event (NotificationChangedEvent)
+    Returns:
+        None
+    """
+    try:
+        await AppResponseCache.invalidate (*[f"notifications:{userId}" for userId in event.userIds])
+    except Exception:
+        pass
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from src.app.bases.app_queue import AppQueue, Process, Processor
+from src.app.bases.app_realtime import emitToUsers
+from src.app.constants.queue_constants import LOW_PRIORITY_QUEUE, NORMAL_PRIORITY_QUEUE
+from src.v1.api.notification.repositories.notification_user_repository import NotificationUserRepository
+from src.v1.api.notification.services.notification_webpush_service import NotificationWebpushService
+from src.v1.api.user.repositories.user_admin_repository import UserAdminRepository
+
+logger = logging.getLogger (__name__)
+
+@Processor (LOW_PRIORITY_QUEUE)
+class NotificationBroadcastProcessor:
+    """
+    NotificationBroadcastProcessor
+
+    Attributes:
+        CHUNK_SIZE (int)
+        WEBPUSH_CHUNK_SIZE (int)
+    """
+    CHUNK_SIZE = 1000
+    WEBPUSH_CHUNK_SIZE = 200
+
+    @staticmethod
+    @Process ("notification.broadcast")
+    async def run (type: str, data: Dict[str, object], userIds: Optional[List[str]] = None, verifiedOnly: bool = False) -> int:
+        """
+        Args:
+            type (str)
+            data (Dict[str, object])
+            userIds (Optional[List[str]])
+            verifiedOnly (bool)
+        Returns:
+            int
+        """
+        sentCount = 0
+        async for chunk in UserAdminRepository.streamIds (userIds, verifiedOnly, NotificationBroadcastProcessor.CHUNK_SIZE):
+            rows = await NotificationUserRepository.createMany (chunk, type, data)
+            sentCount += len (rows)
+
+            await emitToUsers (chunk, "v1.notification.created", {"type": type})
+            await NotificationBroadcastProcessor.dispatchWebpush (
+                [(row["user_id"], row["id"]) for row in rows],
+                type,
+                data,
+            )
+
+            AppQueue.setJobProgress ({"sentCount": sentCount})
+
+        return sentCount
+
+    @staticmethod
+    async def dispatchWebpush (targets: List[Tuple[str, str]], type: str, data: Dict[str, object]) -> None:
+        """
+        Args:
+            targets (List[Tuple[str, str]])
+            type (str)
+            data (Dict[str, object])
+        Returns:
+            None
+        """
+        size = NotificationBroadcastProcessor.WEBPUSH_CHUNK_SIZE
+        batches = [targets[index:index + size] for index in range (0, len (targets), size)]
+        try:
+            await asyncio.to_thread (
+                AppQueue.enqueueMany,
+                NORMAL_PRIORITY_QUEUE,
+                "notification.webpush",
+                [{"args": (batch, type, data)} for batch in batches],
+            )
+        except Exception as e:
+            logger.warning (f"Web push enqueue error, sending inline: {e}")
+            for batch in batches:
+                await NotificationWebpushService.dispatchMany (batch, type, data)
@@ -0,0 +1,26 @@
+from typing import Dict, List
+from src.app.bases.app_queue import Process, Processor
+from src.app.constants.queue_constants import NORMAL_PRIORITY_QUEUE
+from src.v1.api.notification.services.notification_webpush_service import NotificationWebpushService
+
+@Processor (NORMAL_PRIORITY_QUEUE)
+class NotificationWebpushProcessor:
+    """
+    NotificationWebpushProcessor
+    """
+    @staticmethod
+    @Process ("notification.webpush")
+    async def run (targets: List[List[str]], type: str, data: Dict[str, object]) -> None:
+        """
+        Args:
+            targets (List[List[str]])
+            type (str)
+            data (Dict[str, object])
+        Returns:
+            None
+        """
+        await NotificationWebpushService.dispatchMany (
+            [(userId, notificationId) for userId, notificationId in targets],
+            type,
+            data,
+        )
@@ -1,16 +1,29 @@
 from datetime import datetime
 from typing import Optional, List, Dict
-from sqlmodel import Session, select, func
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
 from ulid import ULID
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_explain import QueryShape
 from src.app.repositories.app_postgresql_repository import AppPostgresqlRepository
 from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType, CursorPagination, CursorPaginationType, Orderization, Filterization
 from src.v1.api.notification.databases.models.notification_model import Notification
+from src.v1.api.notification.repositories.notification_unread_repository import NotificationUnreadRepository
+from src.v1.api.notification.repositories.notification_user_repository import NotificationUserRepository
 
 class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
     """
     NotificationAdminRepository (AppPostgresqlRepository)
     """
+    filterable = {
+        "user_id": ("eq", "in"),
+        "type": ("eq", "in", "prefix"),
+        "created_at": ("range",),
+    }
+    orderable = ("created_at", "updated_at", "read_at", "type", "id")
+    search_vector = "search_vector"
+
     def __init__ (self) -> None:
         """
         Returns:
@@ -18,20 +31,59 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
         super ().__init__ ()
 
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
+        """
+        Returns:
+            AsyncSession
+        """
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
+
+    @staticmethod
+    @QueryShape ("notification.admin.page", 10)
+    def pageStatement (limit: int) -> Select:
         """
+        Args:
+            limit (int)
         Returns:
-            Session
+            Select
         """
-        engine = AppDatabase.databasePostgresql ()
-        return Session (engine)
+        return select (Notification).where (Notification.deleted_at == None).order_by (Notification.created_at.desc ()).limit (limit)
+
+    @staticmethod
+    @QueryShape ("notification.admin.filter", "type", "eq", "user.registered", 10)
+    def filterStatement (field: str, operator: str, search: str, limit: int) -> Select:
+        """
+        Args:
+            field (str)
+            operator (str)
+            search (str)
+            limit (int)
+        Returns:
+            Select
+        """
+        conditions = NotificationAdminRepository ().filter ([Filterization (field=field, operator=operator, search=search)], Notification)["conditions"]
+        return NotificationAdminRepository.pageStatement (limit).where (*conditions)
+
+    @staticmethod
+    @QueryShape ("notification.admin.search", "invoice", 10)
+    def searchStatement (search: str, limit: int) -> Select:
+        """
+        Args:
+            search (str)
+            limit (int)
+        Returns:
+            Select
+        """
+        query = NotificationAdminRepository ().search (search, Notification)
+        return NotificationAdminRepository.pageStatement (limit).where (query["search"]).order_by (None).order_by (query["rank"].desc ())
 
     async def allOffset (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: OffsetPaginationType = None
+        page: OffsetPaginationType = None,
+        search: Optional[str] = None
     ) -> OffsetPagination[Notification]:
         """
         Args:
@@ -39,6 +91,7 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (OffsetPaginationType)
+            search (Optional[str])
         Returns:
             OffsetPagination[Notification]
         """
@@ -53,10 +106,13 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, Notification))
+
+            if search:
+                query.update (self.search (search, Notification))
 
             if orders:
-                query.update (self.order (orders))
+                query.update (self.order (orders, Notification))
 
             return await self.offset_paginate_all (
                 model=Notification,
@@ -65,14 +121,15 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
                 session=session
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     async def allCursor (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: CursorPaginationType = None
+        page: CursorPaginationType = None,
+        search: Optional[str] = None
     ) -> CursorPagination[Notification]:
         """
         Args:
@@ -80,6 +137,7 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (CursorPaginationType)
+            search (Optional[str])
         Returns:
             CursorPagination[Notification]
         """
@@ -96,19 +154,20 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, Notification))
 
-            if orders:
-                query.update (self.order (orders))
+            if search:
+                query.update (self.search (search, Notification))
 
             return await self.cursor_paginate_all (
                 model=Notification,
                 query=query,
                 page=page,
-                session=session
+                session=session,
+                orders=orders
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def get (userId: str, id: str) -> Optional[Notification]:
@@ -122,10 +181,10 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
         session = NotificationAdminRepository.getSession ()
         try:
             statement = select (Notification).where (Notification.id == id, Notification.deleted_at == None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def create (userId: str, data: Dict[str, object]) -> Notification:
@@ -146,11 +205,13 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
                 updated_at=datetime.utcnow ()
             )
             session.add (notification)
-            session.commit ()
-            session.refresh (notification)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (notification)
+            await NotificationUnreadRepository.forget (notification.user_id)
+            await NotificationUserRepository.changed ("v1.notification.created", [notification.user_id])
             return notification
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def restore (userId: str, id: str) -> Optional[Notification]:
@@ -164,17 +225,19 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
         session = NotificationAdminRepository.getSession ()
         try:
             statement = select (Notification).where (Notification.id == id)
-            notification = session.exec (statement).first ()
+            notification = (await session.exec (statement)).first ()
             if not notification:
                 return None
             notification.deleted_at = None
             notification.updated_at = datetime.utcnow ()
             session.add (notification)
-            session.commit ()
-            session.refresh (notification)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (notification)
+            await NotificationUnreadRepository.forget (notification.user_id)
+            await NotificationUserRepository.changed ("v1.notification.restored", [notification.user_id])
             return notification
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def delete (userId: str, id: str) -> Optional[Notification]:
@@ -188,14 +251,92 @@ class NotificationAdminRepository (AppPostgresqlRepository[Notification]):
         session = NotificationAdminRepository.getSession ()
         try:
             statement = select (Notification).where (Notification.id == id, Notification.deleted_at == None)
-            notification = session.exec (statement).first ()
+            notification = (await session.exec (statement)).first ()
             if not notification:
                 return None
             notification.deleted_at = datetime.utcnow ()
             notification.updated_at = datetime.utcnow ()
             session.add (notification)
-            session.commit ()
-            session.refresh (notification)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (notification)
+            await NotificationUnreadRepository.forget (notification.user_id)
+            await NotificationUserRepository.changed ("v1.notification.deleted", [notification.user_id])
             return notification
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def readMany (
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        return await NotificationUserRepository ().readMany (userId, ids, type, createdBefore)
+
+    @staticmethod
+    async def unreadMany (
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        return await NotificationUserRepository ().unreadMany (userId, ids, type, createdBefore)
+
+    @staticmethod
+    async def deleteMany (
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        read: Optional[bool] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            read (Optional[bool])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        return await NotificationUserRepository ().deleteMany (userId, ids, type, read, createdBefore)
+
+    @staticmethod
+    async def restoreMany (
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        read: Optional[bool] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            read (Optional[bool])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        return await NotificationUserRepository ().restoreMany (userId, ids, type, read, createdBefore)
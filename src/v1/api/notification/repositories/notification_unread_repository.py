@@ -0,0 +1,279 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+import redis
+from sqlmodel import select, func
+from sqlmodel.sql.expression import Select
+from src.app.bases.app_context import AppContext
+from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_unit_of_work import afterCommit
+from src.app.bases.app_database_explain import QueryShape
+from src.app.configs.cache_config import CacheConfig
+from src.v1.api.notification.databases.models.notification_model import Notification
+
+UNREAD_KEY_PREFIX = "notification:unread"
+
+# Counters move only while their key exists, a missing key is rebuilt from the database on the next read.
+UNREAD_INCREMENT_SCRIPT = """
+if redis.call ("EXISTS", KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call ("INCRBY", KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call ("SET", KEYS[1], 0, "KEEPTTL")
+    value = 0
+end
+return value
+"""
+
+logger = logging.getLogger (__name__)
+
+class NotificationUnreadRepository:
+    """
+    NotificationUnreadRepository
+    """
+    @staticmethod
+    def key (userId: str) -> str:
+        """
+        Args:
+            userId (str)
+        Returns:
+            str
+        """
+        return f"{UNREAD_KEY_PREFIX}:{userId}"
+
+    @staticmethod
+    def ttl () -> int:
+        """
+        Returns:
+            int
+        """
+        return CacheConfig.config ().notification_unread_ttl
+
+    @staticmethod
+    @QueryShape ("notification.unread.count", ["01HZGXQZJQK9X5Y7Z8W9V0U1T2"])
+    def countStatement (userIds: List[str]) -> Select:
+        """
+        Args:
+            userIds (List[str])
+        Returns:
+            Select
+        """
+        return (
+            select (Notification.user_id, func.count ())
+            .where (Notification.user_id.in_ (userIds), Notification.deleted_at == None, Notification.read_at == None)
+            .group_by (Notification.user_id)
+        )
+
+    @staticmethod
+    async def countMany (userIds: List[str]) -> Dict[str, int]:
+        """
+        Args:
+            userIds (List[str])
+        Returns:
+            Dict[str, int]
+        """
+        if not userIds:
+            return {}
+
+        session = AppDatabase.databasePostgresqlAsyncSessionScoped ()
+        try:
+            rows = (await session.exec (NotificationUnreadRepository.countStatement (userIds))).all ()
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+        counts = {userId: 0 for userId in userIds}
+        counts.update ({userId: int (count) for userId, count in rows})
+        return counts
+
+    @staticmethod
+    async def get (userId: str) -> int:
+        """
+        Args:
+            userId (str)
+        Returns:
+            int
+        """
+        cache = AppContext.cacheRedis ()
+        key = NotificationUnreadRepository.key (userId)
+        if cache is not None:
+            try:
+                cached = await cache.get (key)
+                if cached is not None:
+                    return max (0, int (cached))
+            except Exception as e:
+                logger.warning (f"Notification unread read error: {e}")
+
+        count = (await NotificationUnreadRepository.countMany ([userId]))[userId]
+        if cache is not None:
+            try:
+                await cache.set (key, count, ex=NotificationUnreadRepository.ttl (), nx=True)
+            except Exception as e:
+                logger.warning (f"Notification unread write error: {e}")
+        return count
+
+    @staticmethod
+    async def incr (userId: str, amount: int = 1) -> None:
+        """
+        Args:
+            userId (str)
+            amount (int)
+        Returns:
+            None
+        """
+        await NotificationUnreadRepository.incrMany ({userId: amount})
+
+    @staticmethod
+    async def decr (userId: str, amount: int = 1) -> None:
+        """
+        Args:
+            userId (str)
+            amount (int)
+        Returns:
+            None
+        """
+        await NotificationUnreadRepository.incrMany ({userId: -amount})
+
+    @staticmethod
+    async def incrMany (amounts: Dict[str, int]) -> None:
+        """
+        Args:
+            amounts (Dict[str, int])
+        Returns:
+            None
+        """
+        amounts = {userId: amount for userId, amount in amounts.items () if userId and amount}
+        if not amounts:
+            return
+
+        # Counters mirror committed rows, inside a request they move once its transaction commits.
+        await afterCommit (lambda: NotificationUnreadRepository.incrManyNow (amounts))
+
+    @staticmethod
+    async def incrManyNow (amounts: Dict[str, int]) -> None:
+        """
+        Args:
+            amounts (Dict[str, int])
+        Returns:
+            None
+        """
+        cache = AppContext.cacheRedis ()
+        if cache is None:
+            # Queue workers have no application cache, they write through a short-lived blocking client instead.
+            try:
+                await asyncio.to_thread (NotificationUnreadRepository.incrManySync, amounts)
+            except Exception as e:
+                logger.warning (f"Notification unread write error: {e}")
+            return
+
+        try:
+            pipeline = cache.pipeline (transaction=False)
+            for userId, amount in amounts.items ():
+                pipeline.eval (UNREAD_INCREMENT_SCRIPT, 1, NotificationUnreadRepository.key (userId), amount)
+            await pipeline.execute ()
+        except Exception as e:
+            logger.warning (f"Notification unread write error: {e}")
+
+    @staticmethod
+    def incrManySync (amounts: Dict[str, int]) -> None:
+        """
+        Args:
+            amounts (Dict[str, int])
+        Returns:
+            None
+        """
+        client = redis.Redis.from_url (CacheConfig.config ().redis_uri ())
+        try:
+            pipeline = client.pipeline (transaction=False)
+            for userId, amount in amounts.items ():
+                pipeline.eval (UNREAD_INCREMENT_SCRIPT, 1, NotificationUnreadRepository.key (userId), amount)
+            pipeline.execute ()
+        finally:
+            client.close ()
+
+    @staticmethod
+    async def reset (userId: str) -> None:
+        """
+        Args:
+            userId (str)
+        Returns:
+            None
+        """
+        async def write () -> None:
+            """
+            Returns:
+                None
+            """
+            cache = AppContext.cacheRedis ()
+            if cache is not None:
+                try:
+                    await cache.set (NotificationUnreadRepository.key (userId), 0, ex=NotificationUnreadRepository.ttl ())
+                except Exception as e:
+                    logger.warning (f"Notification unread write error: {e}")
+
+        await afterCommit (write)
+
+    @staticmethod
+    async def forget (userId: str) -> None:
+        """
+        Args:
+            userId (str)
+        Returns:
+            None
+        """
+        await NotificationUnreadRepository.forgetMany ([userId])
+
+    @staticmethod
+    async def forgetMany (userIds: Iterable[str]) -> None:
+        """
+        Args:
+            userIds (Iterable[str])
+        Returns:
+            None
+        """
+        keys = [NotificationUnreadRepository.key (userId) for userId in userIds]
+        if not keys:
+            return
+
+        async def delete () -> None:
+            """
+            Returns:
+                None
+            """
+            cache = AppContext.cacheRedis ()
+            if cache is not None:
+                try:
+                    await cache.delete (*keys)
+                except Exception as e:
+                    logger.warning (f"Notification unread delete error: {e}")
+
+        await afterCommit (delete)
+
+    @staticmethod
+    async def reconcile (batchSize: int = 500) -> int:
+        """
+        Args:
+            batchSize (int)
+        Returns:
+            int
+        """
+        cache = AppContext.cacheRedis ()
+        if cache is None:
+            return 0
+
+        reconciled = 0
+        prefix = f"{UNREAD_KEY_PREFIX}:"
+        cursor: Optional[int] = None
+        while cursor != 0:
+            cursor, keys = await cache.scan (cursor=cursor or 0, match=f"{prefix}*", count=batchSize)
+            userIds = [key[len (prefix):] for key in keys]
+            if not userIds:
+                continue
+
+            counts = await NotificationUnreadRepository.countMany (userIds)
+            pipeline = cache.pipeline (transaction=False)
+            for userId, count in counts.items ():
+                pipeline.set (NotificationUnreadRepository.key (userId), count, xx=True, keepttl=True)
+            await pipeline.execute ()
+            reconciled += len (counts)
+        return reconciled
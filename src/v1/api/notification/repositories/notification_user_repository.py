@@ -1,16 +1,31 @@
 from datetime import datetime
-from typing import Optional, List, Dict
-from sqlmodel import Session, select, func
+from typing import Optional, Iterable, List, Dict, Tuple
+from sqlalchemy import insert, update
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
 from ulid import ULID
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_explain import QueryShape
+from src.app.bases.app_event import getEventEmitter
 from src.app.repositories.app_postgresql_repository import AppPostgresqlRepository
 from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType, CursorPagination, CursorPaginationType, Orderization, Filterization
 from src.v1.api.notification.databases.models.notification_model import Notification
+from src.v1.api.notification.events.notification.changed.event import NotificationChangedEvent
+from src.v1.api.notification.repositories.notification_unread_repository import NotificationUnreadRepository
 
 class NotificationUserRepository (AppPostgresqlRepository[Notification]):
     """
     NotificationUserRepository (AppPostgresqlRepository)
     """
+    filterable = {
+        "type": ("eq", "in", "prefix"),
+        "read_at": ("range",),
+        "created_at": ("range",),
+    }
+    orderable = ("created_at", "updated_at", "read_at", "type", "id")
+    search_vector = "search_vector"
+
     def __init__ (self) -> None:
         """
         Returns:
@@ -18,20 +33,83 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
         super ().__init__ ()
 
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
+        """
+        Returns:
+            AsyncSession
+        """
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
+
+    @staticmethod
+    async def changed (event: str, userIds: Iterable[str]) -> None:
+        """
+        Args:
+            event (str)
+            userIds (Iterable[str])
+        Returns:
+            None
+        """
+        # Mutations fan out through the emitter from here, the only place that sees every affected user, bulk and job paths included.
+        userIds = sorted (set (userIds))
+        if userIds:
+            await getEventEmitter ().emit (event, NotificationChangedEvent (userIds=userIds))
+
+    @staticmethod
+    @QueryShape ("notification.user.page", "01HZGXQZJQK9X5Y7Z8W9V0U1T2", "created_at", 10)
+    @QueryShape ("notification.user.cursor", "01HZGXQZJQK9X5Y7Z8W9V0U1T2", "id", 10)
+    def pageStatement (userId: str, orderField: str, limit: int) -> Select:
         """
+        Args:
+            userId (str)
+            orderField (str)
+            limit (int)
         Returns:
-            Session
+            Select
         """
-        engine = AppDatabase.databasePostgresql ()
-        return Session (engine)
+        return (
+            select (Notification)
+            .where (Notification.user_id == userId, Notification.deleted_at == None)
+            .order_by (getattr (Notification, orderField).desc () if orderField == "created_at" else getattr (Notification, orderField))
+            .limit (limit)
+        )
+
+    @staticmethod
+    @QueryShape ("notification.user.filter", "01HZGXQZJQK9X5Y7Z8W9V0U1T2", "type", "prefix", "user.", 10)
+    def filterStatement (userId: str, field: str, operator: str, search: str, limit: int) -> Select:
+        """
+        Args:
+            userId (str)
+            field (str)
+            operator (str)
+            search (str)
+            limit (int)
+        Returns:
+            Select
+        """
+        conditions = NotificationUserRepository ().filter ([Filterization (field=field, operator=operator, search=search)], Notification)["conditions"]
+        return NotificationUserRepository.pageStatement (userId, "created_at", limit).where (*conditions)
+
+    @staticmethod
+    @QueryShape ("notification.user.search", "01HZGXQZJQK9X5Y7Z8W9V0U1T2", "invoice", 10)
+    def searchStatement (userId: str, search: str, limit: int) -> Select:
+        """
+        Args:
+            userId (str)
+            search (str)
+            limit (int)
+        Returns:
+            Select
+        """
+        query = NotificationUserRepository ().search (search, Notification)
+        return NotificationUserRepository.pageStatement (userId, "created_at", limit).where (query["search"]).order_by (None).order_by (query["rank"].desc ())
 
     async def allOffset (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: OffsetPaginationType = None
+        page: OffsetPaginationType = None,
+        search: Optional[str] = None
     ) -> OffsetPagination[Notification]:
         """
         Args:
@@ -39,6 +117,7 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (OffsetPaginationType)
+            search (Optional[str])
         Returns:
             OffsetPagination[Notification]
         """
@@ -56,10 +135,13 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, Notification))
+
+            if search:
+                query.update (self.search (search, Notification))
 
             if orders:
-                query.update (self.order (orders))
+                query.update (self.order (orders, Notification))
 
             return await self.offset_paginate_all (
                 model=Notification,
@@ -68,14 +150,15 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
                 session=session
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     async def allCursor (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: CursorPaginationType = None
+        page: CursorPaginationType = None,
+        search: Optional[str] = None
     ) -> CursorPagination[Notification]:
         """
         Args:
@@ -83,6 +166,7 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (CursorPaginationType)
+            search (Optional[str])
         Returns:
             CursorPagination[Notification]
         """
@@ -102,19 +186,20 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, Notification))
 
-            if orders:
-                query.update (self.order (orders))
+            if search:
+                query.update (self.search (search, Notification))
 
             return await self.cursor_paginate_all (
                 model=Notification,
                 query=query,
                 page=page,
-                session=session
+                session=session,
+                orders=orders
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def get (userId: str, id: str) -> Optional[Notification]:
@@ -128,10 +213,10 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
         session = NotificationUserRepository.getSession ()
         try:
             statement = select (Notification).where (Notification.id == id, Notification.user_id == userId, Notification.deleted_at == None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def create (userId: str, data: Dict[str, object]) -> Notification:
@@ -152,34 +237,120 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
                 updated_at=datetime.utcnow ()
             )
             session.add (notification)
-            session.commit ()
-            session.refresh (notification)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (notification)
+            await NotificationUnreadRepository.incr (userId)
+            await NotificationUserRepository.changed ("v1.notification.created", [userId])
             return notification
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
-    async def read (userId: str, id: str) -> Optional[Notification]:
+    async def createMany (userIds: List[str], type: str, data: Dict[str, object]) -> List[Dict[str, str]]:
+        """
+        Args:
+            userIds (List[str])
+            type (str)
+            data (Dict[str, object])
+        Returns:
+            List[Dict[str, str]]
+        """
+        if not userIds:
+            return []
+
+        now = datetime.utcnow ()
+        rows = [
+            {
+                "id": str (ULID ()),
+                "user_id": userId,
+                "type": type,
+                "data": data,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for userId in userIds
+        ]
+
+        session = NotificationUserRepository.getSession ()
+        try:
+            await session.exec (insert (Notification).values (rows))
+            await AppDatabase.databasePostgresqlCommit (session)
+        except Exception:
+            await AppDatabase.databasePostgresqlRollback (session)
+            raise
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+        await NotificationUnreadRepository.incrMany ({userId: 1 for userId in userIds})
+        await NotificationUserRepository.changed ("v1.notification.created", userIds)
+        return [{"id": row["id"], "user_id": row["user_id"]} for row in rows]
+
+    @staticmethod
+    async def transition (userId: str, id: str, condition: object, values: Dict[str, object]) -> Tuple[Optional[Notification], bool]:
         """
         Args:
             userId (str)
             id (str)
+            condition (object)
+            values (Dict[str, object])
         Returns:
-            Optional[Notification]
+            Tuple[Optional[Notification], bool]
         """
         session = NotificationUserRepository.getSession ()
         try:
-            statement = select (Notification).where (Notification.id == id, Notification.user_id == userId, Notification.deleted_at == None)
-            notification = session.exec (statement).first ()
-            if not notification:
-                return None
-            notification.read_at = datetime.utcnow ()
-            session.add (notification)
-            session.commit ()
-            session.refresh (notification)
-            return notification
+            # Guarded on the prior state in one statement, so of two concurrent calls only one sees a row and moves the counter.
+            statement = (
+                update (Notification)
+                .where (Notification.id == id, Notification.user_id == userId, Notification.deleted_at == None, condition)
+                .values (**values)
+                .returning (Notification)
+                .execution_options (synchronize_session=False, populate_existing=True)
+            )
+            notification = (await session.exec (statement)).scalars ().first ()
+            await AppDatabase.databasePostgresqlCommit (session)
+        except Exception:
+            await AppDatabase.databasePostgresqlRollback (session)
+            raise
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+        if notification is not None:
+            return notification, True
+        return await NotificationUserRepository.get (userId, id), False
+
+    @staticmethod
+    async def read (userId: str, id: str) -> Optional[Notification]:
+        """
+        Args:
+            userId (str)
+            id (str)
+        Returns:
+            Optional[Notification]
+        """
+        notification, changed = await NotificationUserRepository.transition (userId, id, Notification.read_at == None, {"read_at": datetime.utcnow ()})
+        if not notification:
+            return None
+        if changed:
+            await NotificationUnreadRepository.decr (userId)
+        await NotificationUserRepository.changed ("v1.notification.read", [userId])
+        return notification
+
+    @staticmethod
+    async def unread (userId: str, id: str) -> Optional[Notification]:
+        """
+        Args:
+            userId (str)
+            id (str)
+        Returns:
+            Optional[Notification]
+        """
+        notification, changed = await NotificationUserRepository.transition (userId, id, Notification.read_at != None, {"read_at": None})
+        if not notification:
+            return None
+        if changed:
+            await NotificationUnreadRepository.incr (userId)
+        await NotificationUserRepository.changed ("v1.notification.unread", [userId])
+        return notification
 
     @staticmethod
     async def readAll (userId: str) -> int:
@@ -189,19 +360,167 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
         Returns:
             int
         """
-        session = NotificationUserRepository.getSession ()
+        count = await NotificationUserRepository ().readMany (userId)
+        await NotificationUnreadRepository.reset (userId)
+        return count
+
+    @staticmethod
+    def bulkConditions (
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        read: Optional[bool] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> List[object]:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            read (Optional[bool])
+            createdBefore (Optional[datetime])
+        Returns:
+            List[object]
+        """
+        conditions = []
+        if userId is not None:
+            conditions.append (Notification.user_id == userId)
+        if ids is not None:
+            conditions.append (Notification.id.in_ (ids))
+        if type is not None:
+            conditions.append (Notification.type == type)
+        if read is True:
+            conditions.append (Notification.read_at != None)
+        elif read is False:
+            conditions.append (Notification.read_at == None)
+        if createdBefore is not None:
+            conditions.append (Notification.created_at <= createdBefore)
+        return conditions
+
+    async def bulkUpdate (self, conditions: List[object], values: Dict[str, object]) -> Dict[str, int]:
+        """
+        Args:
+            conditions (List[object])
+            values (Dict[str, object])
+        Returns:
+            Dict[str, int]
+        """
+        session = self.getSession ()
         try:
-            statement = select (Notification).where (Notification.user_id == userId, Notification.deleted_at == None, Notification.read_at == None)
-            notifications = session.exec (statement).all ()
-            count = 0
-            for notification in notifications:
-                notification.read_at = datetime.utcnow ()
-                session.add (notification)
-                count += 1
-            session.commit ()
-            return count
+            return await self.update_many_grouped (
+                model=Notification,
+                conditions=conditions,
+                values=values,
+                groupBy=Notification.user_id,
+                session=session
+            )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    async def readMany (
+        self,
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        conditions = self.bulkConditions (userId, ids, type, False, createdBefore)
+        counts = await self.bulkUpdate (
+            [*conditions, Notification.deleted_at == None],
+            {"read_at": datetime.utcnow ()}
+        )
+        await NotificationUnreadRepository.incrMany ({key: -count for key, count in counts.items ()})
+        await NotificationUserRepository.changed ("v1.notification.read", counts)
+        return sum (counts.values ())
+
+    async def unreadMany (
+        self,
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        conditions = self.bulkConditions (userId, ids, type, True, createdBefore)
+        counts = await self.bulkUpdate (
+            [*conditions, Notification.deleted_at == None],
+            {"read_at": None}
+        )
+        await NotificationUnreadRepository.incrMany (counts)
+        await NotificationUserRepository.changed ("v1.notification.unread", counts)
+        return sum (counts.values ())
+
+    async def deleteMany (
+        self,
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        read: Optional[bool] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            read (Optional[bool])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        now = datetime.utcnow ()
+        conditions = self.bulkConditions (userId, ids, type, read, createdBefore)
+        counts = await self.bulkUpdate (
+            [*conditions, Notification.deleted_at == None],
+            {"deleted_at": now, "updated_at": now}
+        )
+        await NotificationUnreadRepository.forgetMany (counts)
+        await NotificationUserRepository.changed ("v1.notification.deleted", counts)
+        return sum (counts.values ())
+
+    async def restoreMany (
+        self,
+        userId: Optional[str],
+        ids: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        read: Optional[bool] = None,
+        createdBefore: Optional[datetime] = None
+    ) -> int:
+        """
+        Args:
+            userId (Optional[str])
+            ids (Optional[List[str]])
+            type (Optional[str])
+            read (Optional[bool])
+            createdBefore (Optional[datetime])
+        Returns:
+            int
+        """
+        conditions = self.bulkConditions (userId, ids, type, read, createdBefore)
+        counts = await self.bulkUpdate (
+            [*conditions, Notification.deleted_at != None],
+            {"deleted_at": None, "updated_at": datetime.utcnow ()}
+        )
+        await NotificationUnreadRepository.forgetMany (counts)
+        await NotificationUserRepository.changed ("v1.notification.restored", counts)
+        return sum (counts.values ())
 
     @staticmethod
     async def delete (userId: str, id: str) -> Optional[Notification]:
@@ -212,20 +531,14 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
         Returns:
             Optional[Notification]
         """
-        session = NotificationUserRepository.getSession ()
-        try:
-            statement = select (Notification).where (Notification.id == id, Notification.user_id == userId, Notification.deleted_at == None)
-            notification = session.exec (statement).first ()
-            if not notification:
-                return None
-            notification.deleted_at = datetime.utcnow ()
-            notification.updated_at = datetime.utcnow ()
-            session.add (notification)
-            session.commit ()
-            session.refresh (notification)
-            return notification
-        finally:
-            session.close ()
+        now = datetime.utcnow ()
+        notification, changed = await NotificationUserRepository.transition (userId, id, Notification.deleted_at == None, {"deleted_at": now, "updated_at": now})
+        if not changed:
+            return None
+        if notification.read_at is None:
+            await NotificationUnreadRepository.decr (userId)
+        await NotificationUserRepository.changed ("v1.notification.deleted", [userId])
+        return notification
 
     @staticmethod
     async def count (userId: str) -> int:
@@ -238,7 +551,7 @@ class NotificationUserRepository (AppPostgresqlRepository[Notification]):
         session = NotificationUserRepository.getSession ()
         try:
             statement = select (func.count ()).select_from (Notification).where (Notification.user_id == userId, Notification.deleted_at == None)
-            count = session.exec (statement).one ()
+            count = (await session.exec (statement)).one ()
             return count
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
@@ -1,10 +1,13 @@
 from typing import Optional, List, Dict
 from fastapi import HTTPException, status
 from src.app.bases.app_i18n import AppI18n
-from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType
+from src.app.constants.queue_constants import LOW_PRIORITY_QUEUE
+from src.app.dtos.app_dto import BatchPayloadType, JobPayloadType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination, OffsetPaginationType
+from src.app.utils.app_queue_dispatch import dispatch
 from src.v1.api.notification.databases.models.notification_model import Notification
 from src.v1.api.notification.dtos.notification_transformer_dto import NotificationTransformerDto
-from src.v1.api.notification.dtos.notification_validator_dto import NotificationCreateValidatorDto
+from src.v1.api.notification.dtos.notification_validator_dto import NotificationAdminBulkValidatorDto, NotificationBroadcastValidatorDto, NotificationCreateValidatorDto
 from src.v1.api.notification.repositories.notification_admin_repository import NotificationAdminRepository
 
 class NotificationAdminService:
@@ -17,17 +20,18 @@ class NotificationAdminService:
     repository = NotificationAdminRepository ()
 
     @staticmethod
-    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: OffsetPaginationType = None) -> OffsetPagination[NotificationTransformerDto]:
+    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: OffsetPaginationType = None, search: Optional[str] = None) -> OffsetPagination[NotificationTransformerDto]:
         """
         Args:
             userId (str)
             orders (List[Dict[str, object]])
             filters (List[Dict[str, object]])
             page (OffsetPaginationType)
+            search (Optional[str])
         Returns:
             OffsetPagination[NotificationTransformerDto]
         """
-        result = await NotificationAdminService.repository.allOffset (userId, orders, filters, page)
+        result = await NotificationAdminService.repository.allOffset (userId, orders, filters, page, search)
         data = [NotificationTransformerDto.fromNotification (item) for item in result.data]
         return OffsetPagination (
             totalPage=result.totalPage,
@@ -37,9 +41,29 @@ class NotificationAdminService:
             previousPage=result.previousPage,
             firstPage=result.firstPage,
             lastPage=result.lastPage,
+            countStrategy=result.countStrategy,
             data=data
         )
 
+    @staticmethod
+    async def allCursor (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: CursorPaginationType = None, search: Optional[str] = None) -> CursorPagination[NotificationTransformerDto]:
+        """
+        Args:
+            userId (str)
+            orders (List[Dict[str, object]])
+            filters (List[Dict[str, object]])
+            page (CursorPaginationType)
+            search (Optional[str])
+        Returns:
+            CursorPagination[NotificationTransformerDto]
+        """
+        result = await NotificationAdminService.repository.allCursor (userId, orders, filters, page, search)
+        return CursorPagination (
+            nextCursorPage=result.nextCursorPage,
+            previousCursorPage=result.previousCursorPage,
+            data=[NotificationTransformerDto.fromNotification (item) for item in result.data]
+        )
+
     @staticmethod
     async def get (userId: str, id: str) -> NotificationTransformerDto:
         """
@@ -72,6 +96,27 @@ class NotificationAdminService:
         notification = await NotificationAdminRepository.create (userId, notificationData)
         return NotificationTransformerDto.fromNotification (notification)
 
+    @staticmethod
+    async def broadcast (userId: str, data: NotificationBroadcastValidatorDto) -> JobPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationBroadcastValidatorDto)
+        Returns:
+            JobPayloadType
+        """
+        # A broadcast can reach every user, it is only accepted once it sits durably in the queue.
+        jobId = await dispatch (
+            LOW_PRIORITY_QUEUE,
+            "notification.broadcast",
+            data.type,
+            data.data,
+            data.user_ids,
+            data.verified_only,
+            meta={"userId": userId},
+        )
+        return JobPayloadType (id=jobId, status="queued")
+
     @staticmethod
     async def update (userId: str, id: str, data: Dict[str, object]) -> NotificationTransformerDto:
         """
@@ -117,3 +162,51 @@ class NotificationAdminService:
         if not notification:
             raise HTTPException (status_code=status.HTTP_404_NOT_FOUND, detail=i18n.t ("_v1_notification.notification_not_found"))
         return NotificationTransformerDto.fromNotification (notification)
+
+    @staticmethod
+    async def readMany (userId: str, data: NotificationAdminBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationAdminBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationAdminService.repository.readMany (data.user_id, ids=data.ids, type=data.type, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def unreadMany (userId: str, data: NotificationAdminBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationAdminBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationAdminService.repository.unreadMany (data.user_id, ids=data.ids, type=data.type, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def deleteMany (userId: str, data: NotificationAdminBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationAdminBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationAdminService.repository.deleteMany (data.user_id, ids=data.ids, type=data.type, read=data.read, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def restoreMany (userId: str, data: NotificationAdminBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationAdminBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationAdminService.repository.restoreMany (data.user_id, ids=data.ids, type=data.type, read=data.read, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
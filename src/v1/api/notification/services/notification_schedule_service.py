@@ -0,0 +1,24 @@
+import logging
+from src.app.bases.app_scheduler import Cron
+from src.v1.api.notification.repositories.notification_unread_repository import NotificationUnreadRepository
+
+logger = logging.getLogger (__name__)
+
+class NotificationScheduleService:
+    """
+    NotificationScheduleService
+    """
+
+    @staticmethod
+    @Cron ("*/15 * * * *", id="notification.unread.reconcile")
+    async def handleUnreadReconcile () -> None:
+        """
+        Returns:
+            None
+        """
+        try:
+            reconciled = await NotificationUnreadRepository.reconcile ()
+            logger.info (f"Reconciled {reconciled} unread notification counter(s)")
+
+        except Exception as error:
+            logger.error (f"Unread notification counters not reconciled: {error}")
@@ -1,12 +1,14 @@
 from typing import Optional, List, Dict
 from fastapi import HTTPException, status
+from src.app.bases.app_database_unit_of_work import afterCommit
 from src.app.bases.app_i18n import AppI18n
 from src.app.dtos.app_dto import BatchPayloadType
-from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination, OffsetPaginationType
 from src.app.bases.app_realtime import emitToUser
 from src.v1.api.notification.databases.models.notification_model import Notification
 from src.v1.api.notification.dtos.notification_transformer_dto import NotificationTransformerDto, NotificationCountTransformerDto, NotificationReadTransformerDto, NotificationUnreadTransformerDto
-from src.v1.api.notification.dtos.notification_validator_dto import NotificationCreateValidatorDto
+from src.v1.api.notification.dtos.notification_validator_dto import NotificationBulkValidatorDto, NotificationCreateValidatorDto
+from src.v1.api.notification.repositories.notification_unread_repository import NotificationUnreadRepository
 from src.v1.api.notification.repositories.notification_user_repository import NotificationUserRepository
 from src.v1.api.notification.services.notification_webpush_service import NotificationWebpushService
 
@@ -20,17 +22,18 @@ class NotificationUserService:
     repository = NotificationUserRepository ()
 
     @staticmethod
-    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: OffsetPaginationType = None) -> OffsetPagination[NotificationTransformerDto]:
+    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: OffsetPaginationType = None, search: Optional[str] = None) -> OffsetPagination[NotificationTransformerDto]:
         """
         Args:
             userId (str)
             orders (List[Dict[str, object]])
             filters (List[Dict[str, object]])
             page (OffsetPaginationType)
+            search (Optional[str])
         Returns:
             OffsetPagination[NotificationTransformerDto]
         """
-        result = await NotificationUserService.repository.allOffset (userId, orders, filters, page)
+        result = await NotificationUserService.repository.allOffset (userId, orders, filters, page, search)
         data = [NotificationTransformerDto.fromNotification (item) for item in result.data]
         return OffsetPagination (
             totalPage=result.totalPage,
@@ -40,6 +43,7 @@ class NotificationUserService:
             previousPage=result.previousPage,
             firstPage=result.firstPage,
             lastPage=result.lastPage,
+            countStrategy=result.countStrategy,
             data=data
         )
 
@@ -54,6 +58,25 @@ class NotificationUserService:
         counts = await NotificationUserService.repository.count (userId)
         return NotificationCountTransformerDto (count=counts)
 
+    @staticmethod
+    async def allCursor (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: CursorPaginationType = None, search: Optional[str] = None) -> CursorPagination[NotificationTransformerDto]:
+        """
+        Args:
+            userId (str)
+            orders (List[Dict[str, object]])
+            filters (List[Dict[str, object]])
+            page (CursorPaginationType)
+            search (Optional[str])
+        Returns:
+            CursorPagination[NotificationTransformerDto]
+        """
+        result = await NotificationUserService.repository.allCursor (userId, orders, filters, page, search)
+        return CursorPagination (
+            nextCursorPage=result.nextCursorPage,
+            previousCursorPage=result.previousCursorPage,
+            data=[NotificationTransformerDto.fromNotification (item) for item in result.data]
+        )
+
     @staticmethod
     async def get (userId: str, id: str) -> NotificationTransformerDto:
         """
@@ -88,7 +111,7 @@ class NotificationUserService:
         Returns:
             NotificationUnreadTransformerDto
         """
-        return NotificationUnreadTransformerDto (unread=0)
+        return NotificationUnreadTransformerDto (unread=await NotificationUnreadRepository.get (userId))
 
     @staticmethod
     async def unreadCount (userId: str) -> NotificationUnreadTransformerDto:
@@ -98,7 +121,7 @@ class NotificationUserService:
         Returns:
             NotificationUnreadTransformerDto
         """
-        return NotificationUnreadTransformerDto (unread=0)
+        return NotificationUnreadTransformerDto (unread=await NotificationUnreadRepository.get (userId))
 
     @staticmethod
     async def read (userId: str, id: str) -> NotificationTransformerDto:
@@ -138,7 +161,9 @@ class NotificationUserService:
         Returns:
             Dict[str, int]
         """
-        return await NotificationUserRepository.count (userId)
+        total = await NotificationUserRepository.count (userId)
+        unread = await NotificationUnreadRepository.get (userId)
+        return {"read": max (0, total - unread), "unread": unread}
 
     @staticmethod
     async def notify (userId: str, data: NotificationCreateValidatorDto) -> NotificationTransformerDto:
@@ -156,11 +181,18 @@ class NotificationUserService:
         if not notification:
             raise HTTPException (status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=i18n.t ("_v1_notification.failed_to_create"))
 
-        unreadCounts = await NotificationUserRepository.count (userId)
-        await emitToUser (userId, "v1.notification.created", {
-            "id": notification.id,
-            "unread": unreadCounts.get ("unread", 0),
-        })
+        # Clients refetch on this signal, so it goes out only once the notification is committed and counted.
+        async def announce () -> None:
+            """
+            Returns:
+                None
+            """
+            await emitToUser (userId, "v1.notification.created", {
+                "id": notification.id,
+                "unread": await NotificationUnreadRepository.get (userId),
+            })
+
+        await afterCommit (announce)
 
         await NotificationWebpushService.dispatchAsync (
             userId,
@@ -185,3 +217,51 @@ class NotificationUserService:
         if not notification:
             raise HTTPException (status_code=status.HTTP_404_NOT_FOUND, detail=i18n.t ("_v1_notification.notification_not_found"))
         return NotificationTransformerDto.fromNotification (notification)
+
+    @staticmethod
+    async def readMany (userId: str, data: NotificationBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationUserService.repository.readMany (userId, ids=data.ids, type=data.type, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def unreadMany (userId: str, data: NotificationBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationUserService.repository.unreadMany (userId, ids=data.ids, type=data.type, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def deleteMany (userId: str, data: NotificationBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationUserService.repository.deleteMany (userId, ids=data.ids, type=data.type, read=data.read, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
+
+    @staticmethod
+    async def restoreMany (userId: str, data: NotificationBulkValidatorDto) -> BatchPayloadType:
+        """
+        Args:
+            userId (str)
+            data (NotificationBulkValidatorDto)
+        Returns:
+            BatchPayloadType
+        """
+        count = await NotificationUserService.repository.restoreMany (userId, ids=data.ids, type=data.type, read=data.read, createdBefore=data.created_before)
+        return BatchPayloadType (count=count)
@@ -1,8 +1,9 @@
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional
-from pywebpush import WebPushException, webpush
+from typing import Dict, List, Optional, Tuple
+from src.app.bases.app_database_unit_of_work import afterCommit
+from src.app.bases.app_webpush import AppWebpush
 from src.app.configs.app_config import AppConfig
 from src.app.configs.webpush_config import WebpushConfig
 from src.v1.api.user.databases.models.push_subscription_model import PushSubscription
@@ -10,6 +11,8 @@ from src.v1.api.user.repositories.webpush_subscription_repository import Webpush
 
 logger = logging.getLogger (__name__)
 
+WEBPUSH_CONTENT_ENCODINGS = ("aesgcm", "aes128gcm")
+
 class NotificationWebpushService:
     """
     NotificationWebpushService
@@ -183,8 +186,7 @@ class NotificationWebpushService:
             frontendUrl,
         )
 
-        for subscription in subscriptions:
-            await NotificationWebpushService.sendToSubscription (subscription, payload, config)
+        await NotificationWebpushService.sendToSubscriptions (subscriptions, payload, config)
 
     @staticmethod
     async def dispatchAsync (
@@ -202,48 +204,111 @@ class NotificationWebpushService:
         Returns:
             None
         """
-        asyncio.create_task (
-            NotificationWebpushService.dispatch (userId, notificationId, notificationType, data)
-        )
+        async def schedule () -> None:
+            """
+            Returns:
+                None
+            """
+            asyncio.create_task (
+                NotificationWebpushService.dispatch (userId, notificationId, notificationType, data)
+            )
+
+        await afterCommit (schedule)
 
     @staticmethod
-    async def sendToSubscription (
-        subscription: PushSubscription,
+    async def dispatchMany (
+        targets: List[Tuple[str, str]],
+        notificationType: str,
+        data: Dict[str, object],
+    ) -> None:
+        """
+        Args:
+            targets (List[Tuple[str, str]])
+            notificationType (str)
+            data (Dict[str, object])
+        Returns:
+            None
+        """
+        config = WebpushConfig.config ()
+        if not config.vapid_public_key.strip () or not targets:
+            return
+
+        notificationIds = {userId: notificationId for userId, notificationId in targets}
+        subscriptions = await WebpushSubscriptionRepository.findByUserIds (list (notificationIds.keys ()))
+        if not subscriptions:
+            return
+
+        frontendUrl = AppConfig.config ().frontend_url
+        messages = [
+            (
+                subscription,
+                NotificationWebpushService.buildPayload (
+                    notificationIds[subscription.subscribable_id],
+                    notificationType,
+                    data,
+                    frontendUrl,
+                ),
+            )
+            for subscription in subscriptions
+        ]
+        await NotificationWebpushService.sendMessages (messages, config)
+
+    @staticmethod
+    async def sendToSubscriptions (
+        subscriptions: List[PushSubscription],
         payload: Dict[str, object],
         config: WebpushConfig,
     ) -> None:
         """
         Args:
-            subscription (PushSubscription)
+            subscriptions (List[PushSubscription])
             payload (Dict[str, object])
             config (WebpushConfig)
         Returns:
             None
         """
-        try:
-            await asyncio.to_thread (
-                webpush,
-                subscription_info={
-                    "endpoint": subscription.endpoint,
-                    "keys": {
-                        "p256dh": subscription.public_key or "",
-                        "auth": subscription.auth_token or "",
+        await NotificationWebpushService.sendMessages (
+            [(subscription, payload) for subscription in subscriptions],
+            config,
+        )
+
+    @staticmethod
+    async def sendMessages (
+        messages: List[Tuple[PushSubscription, Dict[str, object]]],
+        config: WebpushConfig,
+    ) -> None:
+        """
+        Args:
+            messages (List[Tuple[PushSubscription, Dict[str, object]]])
+            config (WebpushConfig)
+        Returns:
+            None
+        """
+        statuses = await AppWebpush.sendMany (
+            [
+                (
+                    {
+                        "endpoint": subscription.endpoint,
+                        "keys": {
+                            "p256dh": subscription.public_key or "",
+                            "auth": subscription.auth_token or "",
+                        },
                     },
-                },
-                data=json.dumps (payload),
-                vapid_private_key=config.vapid_private_key,
-                vapid_claims={"sub": config.vapid_subject or AppConfig.config ().frontend_url},
-            )
-        except WebPushException as error:
-            statusCode = getattr (error, "response", None)
-            responseStatus = statusCode.status_code if statusCode is not None else None
-
-            if responseStatus in (404, 410) and subscription.id is not None:
-                await WebpushSubscriptionRepository.deleteById (subscription.id)
-                return
-
-            logger.warning (
-                "Web push failed for subscription %s: %s",
-                subscription.id,
-                error,
-            )
+                    json.dumps (payload).encode ("utf-8"),
+                    subscription.content_encoding if subscription.content_encoding in WEBPUSH_CONTENT_ENCODINGS else "aes128gcm",
+                )
+                for subscription, payload in messages
+            ],
+            config.vapid_subject or AppConfig.config ().frontend_url,
+        )
+
+        goneIds = [
+            subscription.id
+            for (subscription, _), responseStatus in zip (messages, statuses)
+            if responseStatus in AppWebpush.GONE_STATUSES and subscription.id is not None
+        ]
+        if goneIds:
+            try:
+                await WebpushSubscriptionRepository.deleteByIds (goneIds)
+            except Exception as error:
+                logger.warning ("Web push subscription cleanup failed: %s", error)
@@ -1,4 +1,5 @@
 from typing import Optional
+from src.app.dependencies.app_acl_dependency import requirePermission
 from src.app.dependencies.app_rate_limit import rateLimit
 from fastapi import (
     APIRouter,
@@ -17,8 +18,8 @@ from fastapi.security import HTTPAuthorizationCredentials
 from src.app.bases.app_i18n import AppI18n
 from src.app.bases.app_security import security
 from src.app.dependencies.app_auth_api_dependency import get_current_user
-from src.app.dtos.app_dto import Status, Description
-from src.app.repositories.app_repository import OffsetPagination
+from src.app.dtos.app_dto import Status, Description, JobPayloadType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination
 from src.app.utils.app_query_parser import parseOrders, parseFilters
 from src.app.utils.app_response_helper import getStandardResponses, getPaginationResponses
 from src.v1.api.user.databases.models.user_model import User
@@ -37,7 +38,7 @@ userAdminRouter = APIRouter (prefix="/api/v1/admin/users", tags=["UserAdmin"])
 @userAdminRouter.get (
     "/",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.view")],
     response_model=OffsetPagination[UserTransformerDto],
     responses=getPaginationResponses (
         item_example={
@@ -56,20 +57,44 @@ userAdminRouter = APIRouter (prefix="/api/v1/admin/users", tags=["UserAdmin"])
 async def index (
     current_user: User = Depends (get_current_user),
     orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc,name:asc')"),
-    filters: Optional[str] = Query (None, description="Filter by fields (e.g., 'name:john,email:test')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, contains, range, in (e.g., 'name:john,email:prefix:test,created_at:range:2024-01-01..2024-02-01')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked search over name and email"),
     limitPage: Optional[int] = Query (10, ge=1, le=100),
-    currentPage: Optional[int] = Query (1, ge=1)
+    currentPage: Optional[int] = Query (1, ge=1),
+    countStrategy: Optional[str] = Query (None, pattern="^(exact|cached|estimate|none)$", description="Total count strategy (exact, cached, estimate, none)")
 ) -> OffsetPagination[UserTransformerDto]:
     """
     Index
     """
-    page = {"currentPage": currentPage or 1, "limitPage": limitPage or 10}
-    return await UserAdminService.all (current_user.id, parseOrders (orders), parseFilters (filters), page)
+    page = {"currentPage": currentPage or 1, "limitPage": limitPage or 10, "countStrategy": countStrategy}
+    return await UserAdminService.all (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
+
+@userAdminRouter.get (
+    "/cursor",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.view")],
+    response_model=CursorPagination[UserTransformerDto],
+    responses=getStandardResponses (unauthorized=True, forbidden=True)
+)
+async def indexCursor (
+    current_user: User = Depends (get_current_user),
+    orders: Optional[str] = Query (None, description="Order by fields (e.g., 'created_at:desc,name:asc')"),
+    filters: Optional[str] = Query (None, description="Filter by field:value or field:operator:value with eq, prefix, contains, range, in (e.g., 'name:john,email:prefix:test,created_at:range:2024-01-01..2024-02-01')"),
+    search: Optional[str] = Query (None, min_length=2, max_length=100, description="Ranked search over name and email"),
+    limitPage: Optional[int] = Query (10, ge=1, le=100),
+    cursorPage: Optional[str] = Query (None, description="Opaque cursor from nextCursorPage or previousCursorPage"),
+    direction: Optional[str] = Query ("next", pattern="^(next|previous)$")
+) -> CursorPagination[UserTransformerDto]:
+    """
+    Index Cursor
+    """
+    page = CursorPaginationType (cursorField="id", cursorPage=cursorPage, limitPage=limitPage or 10, direction=direction or "next")
+    return await UserAdminService.allCursor (current_user.id, parseOrders (orders), parseFilters (filters), page, search)
 
 @userAdminRouter.delete (
     "/activate/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.restore")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -93,7 +118,7 @@ async def activate (
 @userAdminRouter.delete (
     "/deactivate/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.delete")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -109,7 +134,7 @@ async def deactivate (
 @userAdminRouter.get (
     "/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.view")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
 )
@@ -125,7 +150,7 @@ async def show (
 @userAdminRouter.put (
     "/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.update")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, bad_request=True, not_found=True, unvalidated=True)
 )
@@ -142,7 +167,7 @@ async def update (
 @userAdminRouter.post (
     "/",
     status_code=Status.CREATED,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.create")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, bad_request=True, unvalidated=True)
 )
@@ -158,7 +183,7 @@ async def store (
 @userAdminRouter.put (
     "/verify/{id}",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.update")],
     response_model=UserTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True, bad_request=True, not_found=True)
 )
@@ -174,7 +199,7 @@ async def verify (
 @userAdminRouter.post (
     "/import",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.import")],
     response_model=str,
     summary="Import Users from File",
     description="""
@@ -207,7 +232,8 @@ Bob Wilson,bob@example.com,mypassword789
 **Notes:**
 - Duplicate emails will be skipped
 - Empty rows will be skipped
-- Import is processed asynchronously
+- Import is processed asynchronously on the queue worker
+- The `X-Job-Id` response header identifies the job for `GET /jobs/{jobId}`
 - You will receive a notification when import is complete
     """,
     responses=getStandardResponses (
@@ -223,6 +249,7 @@ Bob Wilson,bob@example.com,mypassword789
 )
 async def import_users (
     background_tasks: BackgroundTasks,
+    response: Response,
     file: UploadFile = File (..., description="Upload CSV, XLSX, or XLS file containing user data with columns: name, email, password"),
     current_user: User = Depends (get_current_user)
 ) -> str:
@@ -233,8 +260,10 @@ async def import_users (
     The file will be processed asynchronously in the background.
     """
     try:
-        fileContent = await file.read ()
-        return await UserAdminService.import_users (background_tasks, current_user.id, fileContent, file.filename)
+        message, jobId = await UserAdminService.import_users (background_tasks, current_user.id, file)
+        if jobId:
+            response.headers["X-Job-Id"] = jobId
+        return message
     except HTTPException:
         raise
     except Exception as e:
@@ -244,7 +273,7 @@ async def import_users (
 @userAdminRouter.post (
     "/export",
     status_code=Status.OK,
-    dependencies=[rateLimit (times=10, seconds=60), Depends (security)],
+    dependencies=[rateLimit (times=10, seconds=60), Depends (security), requirePermission ("user.export")],
     response_model=str,
     summary="Export Users to File",
     description="""
@@ -265,7 +294,7 @@ Export all active users to CSV, XLSX, or XLS file.
 
 **Process:**
 1. Request export with desired format
-2. Export is processed asynchronously in the background
+2. Export is processed asynchronously on the queue worker, tracked by the `X-Job-Id` response header
 3. Receive notification when export is ready
 4. Download file from notification link
 
@@ -288,6 +317,7 @@ id,name,email,email_verified_at,created_at,updated_at
 )
 async def export_users (
     background_tasks: BackgroundTasks,
+    response: Response,
     export_type: Optional[str] = Query (default="csv", description="File format: csv (default), xlsx, or xls", enum=["csv", "xls", "xlsx"]),
     current_user: User = Depends (get_current_user)
 ) -> str:
@@ -298,9 +328,31 @@ async def export_users (
     The export will be processed asynchronously and you will receive a notification with the download link.
     """
     try:
-        return await UserAdminService.export_users (background_tasks, current_user.id, export_type)
+        message, jobId = await UserAdminService.export_users (background_tasks, current_user.id, export_type)
+        if jobId:
+            response.headers["X-Job-Id"] = jobId
+        return message
     except HTTPException:
         raise
     except Exception as e:
         i18n = AppI18n.i18n ()
         raise HTTPException (status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=i18n.t ("_v1_user.admin.internal_server_error"))
+
+@userAdminRouter.get (
+    "/jobs/{jobId}",
+    status_code=Status.OK,
+    dependencies=[rateLimit (times=60, seconds=60), Depends (security), requirePermission ("user.view")],
+    response_model=JobPayloadType,
+    summary="Import/Export Job Status",
+    responses=getStandardResponses (unauthorized=True, forbidden=True, not_found=True)
+)
+async def job (
+    jobId: str,
+    current_user: User = Depends (get_current_user)
+) -> JobPayloadType:
+    """
+    Import/Export Job Status
+
+    Returns the queue status of an import or export job and the progress reported by the worker.
+    """
+    return await UserAdminService.job (current_user.id, jobId)
@@ -1,8 +1,9 @@
 from typing import Optional
 from src.app.dependencies.app_rate_limit import rateLimit
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials
 from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_response_cache import cacheResponse
 from src.app.bases.app_security import security
 from src.app.dependencies.app_url_guard import urlGuard
 from src.app.dependencies.app_auth_api_dependency import get_current_user
@@ -29,6 +30,7 @@ userAuthRouter = APIRouter (prefix="/api/v1/auth", tags=["UserAuth"])
     responses=getStandardResponses (bad_request=True, unvalidated=True)
 )
 async def login (
+    background_tasks: BackgroundTasks,
     dto: UserAuthDto = Body (...,
         examples={
             "default": {
@@ -45,7 +47,7 @@ async def login (
     """
     Login
     """
-    return await UserAuthService.login (dto)
+    return await UserAuthService.login (dto, background_tasks)
 
 @userAuthRouter.post (
     "/logout",
@@ -96,6 +98,7 @@ async def refresh (
     response_model=UserMeTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True)
 )
+@cacheResponse (tags=("user:{user}",))
 async def me (
     current_user: User = Depends (get_current_user)
 ) -> UserMeTransformerDto:
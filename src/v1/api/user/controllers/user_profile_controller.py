@@ -2,6 +2,7 @@ import re
 from typing import List, Optional
 from src.app.dependencies.app_rate_limit import rateLimit
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from src.app.bases.app_response_cache import cacheResponse
 from src.app.dependencies.app_auth_api_dependency import get_current_user
 from src.app.dtos.app_dto import Status
 from src.app.utils.app_response_helper import getStandardResponses
@@ -43,6 +44,7 @@ async def parseInterestsFromRequest (request: Request) -> List[str]:
     response_model=UserMeTransformerDto,
     responses=getStandardResponses (unauthorized=True, forbidden=True),
 )
+@cacheResponse (tags=("user:{user}",))
 async def showMe (
     current_user: User = Depends (get_current_user),
 ) -> UserMeTransformerDto:
@@ -104,6 +106,7 @@ async def updateMeMultipart (
     dependencies=[rateLimit (times=10, seconds=60)],
     responses=getStandardResponses (unauthorized=True, forbidden=True),
 )
+@cacheResponse (scope="private", tags=("profiles:interests",))
 async def interests (
     current_user: User = Depends (get_current_user),
 ) -> dict:
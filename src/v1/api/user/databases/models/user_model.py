@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field
 from ulid import ULID
 
@@ -33,6 +34,14 @@ class User (UserBase, table=True):
         updated_at (datetime)
     """
     __tablename__ = "users"
+    __table_args__ = (
+        Index ("users_id_active_index", "id", postgresql_where=text ("deleted_at IS NULL")),
+        Index ("users_created_at_active_index", "created_at", postgresql_where=text ("deleted_at IS NULL")),
+        Index ("users_email_pattern_active_index", "email", postgresql_ops={"email": "varchar_pattern_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+        Index ("users_name_pattern_active_index", "name", postgresql_ops={"name": "varchar_pattern_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+        Index ("users_name_trigram_active_index", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+        Index ("users_email_trigram_active_index", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}, postgresql_where=text ("deleted_at IS NULL")),
+    )
     id: str = Field (default_factory=lambda: str (ULID ()), primary_key=True)
     deleted_at: Optional[datetime] = Field (default=None)
     created_at: datetime = Field (default_factory=datetime.utcnow)
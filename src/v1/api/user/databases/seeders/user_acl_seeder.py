@@ -1,8 +1,10 @@
+import logging
 from sqlmodel import Session, select
 from ulid import ULID
 from src.app.bases.app_database import AppDatabase
 from src.v1.api.user.databases.models.acl_model import ModelHasRole, Permission, Role, RoleHasPermission
 from src.v1.api.user.databases.models.user_model import User
+from src.v1.api.user.repositories.user_acl_repository import UserAclRepository
 
 GUARD_NAME = "web"
 USER_MODEL_TYPE = "User"
@@ -16,6 +18,11 @@ ROLE_PERMISSIONS = {
         "user.restore",
         "user.import",
         "user.export",
+        "notification.view",
+        "notification.create",
+        "notification.update",
+        "notification.delete",
+        "notification.restore",
     ],
     "admin": [
         "user.view",
@@ -25,6 +32,11 @@ ROLE_PERMISSIONS = {
         "user.restore",
         "user.import",
         "user.export",
+        "notification.view",
+        "notification.create",
+        "notification.update",
+        "notification.delete",
+        "notification.restore",
     ],
     "speaker": ["user.view"],
     "delegate": ["user.view"],
@@ -35,6 +47,8 @@ ROLE_PERMISSIONS = {
 
 ROLES = list (ROLE_PERMISSIONS.keys ())
 
+logger = logging.getLogger (__name__)
+
 class UserAclSeeder:
     """
     UserAclSeeder
@@ -54,6 +68,11 @@ class UserAclSeeder:
         finally:
             session.close ()
 
+        try:
+            UserAclRepository.invalidateSync ()
+        except Exception as e:
+            logger.warning (f"Acl cache invalidation error: {e}")
+
     @staticmethod
     def _seedPermissions (session: Session) -> dict[str, Permission]:
         permissionNames = sorted ({
@@ -0,0 +1,20 @@
+from src.app.bases.app_event_base import AppEventBase
+
+class UserAdminImportingEvent (AppEventBase):
+    """
+    UserAdminImportingEvent (AppEventBase)
+
+    Attributes:
+        userId (str)
+        filename (str)
+        totalRows (int)
+        processedRows (int)
+        totalImported (int)
+        totalSkipped (int)
+    """
+    userId: str
+    filename: str
+    totalRows: int
+    processedRows: int
+    totalImported: int
+    totalSkipped: int
@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.v1.api.user.events.user.admin.activated.event import UserAdminActivatedEvent
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+@OnEvent ("v1.user.admin.activated")
+async def handleUserAdminActivatedPrincipal (event: UserAdminActivatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminActivatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await UserPrincipalRepository.forget (event.id)
+    except Exception:
+        pass
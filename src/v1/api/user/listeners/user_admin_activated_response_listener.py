@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_response_cache import AppResponseCache
+from src.v1.api.user.events.user.admin.activated.event import UserAdminActivatedEvent
+
+@OnEvent ("v1.user.admin.activated")
+async def handleUserAdminActivatedResponse (event: UserAdminActivatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminActivatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await AppResponseCache.invalidate (f"user:{event.id}")
+    except Exception:
+        pass
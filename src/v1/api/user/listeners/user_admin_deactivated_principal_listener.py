@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.v1.api.user.events.user.admin.deactivated.event import UserAdminDeactivatedEvent
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+@OnEvent ("v1.user.admin.deactivated")
+async def handleUserAdminDeactivatedPrincipal (event: UserAdminDeactivatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminDeactivatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await UserPrincipalRepository.forget (event.id)
+    except Exception:
+        pass
@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_response_cache import AppResponseCache
+from src.v1.api.user.events.user.admin.deactivated.event import UserAdminDeactivatedEvent
+
+@OnEvent ("v1.user.admin.deactivated")
+async def handleUserAdminDeactivatedResponse (event: UserAdminDeactivatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminDeactivatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await AppResponseCache.invalidate (f"user:{event.id}")
+    except Exception:
+        pass
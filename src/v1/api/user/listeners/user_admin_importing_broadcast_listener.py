@@ -0,0 +1,23 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_realtime import emitToUser
+from src.v1.api.user.events.user.admin.importing.event import UserAdminImportingEvent
+
+@OnEvent ("v1.user.admin.importing")
+async def handleUserAdminImporting (event: UserAdminImportingEvent) -> None:
+    """
+    Args:
+        event (UserAdminImportingEvent)
+    Returns:
+        None
+    """
+    try:
+        await emitToUser (event.userId, "v1.user.admin.importing", {
+            "userId": event.userId,
+            "filename": event.filename,
+            "totalRows": event.totalRows,
+            "processedRows": event.processedRows,
+            "totalImported": event.totalImported,
+            "totalSkipped": event.totalSkipped
+        })
+    except Exception:
+        pass
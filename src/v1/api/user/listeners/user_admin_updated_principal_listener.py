@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.v1.api.user.events.user.admin.updated.event import UserAdminUpdatedEvent
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+@OnEvent ("v1.user.admin.updated")
+async def handleUserAdminUpdatedPrincipal (event: UserAdminUpdatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminUpdatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await UserPrincipalRepository.forget (event.id)
+    except Exception:
+        pass
@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_response_cache import AppResponseCache
+from src.v1.api.user.events.user.admin.updated.event import UserAdminUpdatedEvent
+
+@OnEvent ("v1.user.admin.updated")
+async def handleUserAdminUpdatedResponse (event: UserAdminUpdatedEvent) -> None:
+    """
+    Args:
+        event (UserAdminUpdatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await AppResponseCache.invalidate (f"user:{event.id}")
+    except Exception:
+        pass
@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.v1.api.user.events.user.profile.updated.event import UserProfileUpdatedEvent
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+@OnEvent ("v1.user.profile.updated")
+async def handleUserProfileUpdatedPrincipal (event: UserProfileUpdatedEvent) -> None:
+    """
+    Args:
+        event (UserProfileUpdatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await UserPrincipalRepository.forget (event.id)
+    except Exception:
+        pass
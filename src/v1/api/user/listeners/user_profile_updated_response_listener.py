@@ -0,0 +1,16 @@
+from src.app.bases.app_event import OnEvent
+from src.app.bases.app_response_cache import AppResponseCache
+from src.v1.api.user.events.user.profile.updated.event import UserProfileUpdatedEvent
+
+@OnEvent ("v1.user.profile.updated")
+async def handleUserProfileUpdatedResponse (event: UserProfileUpdatedEvent) -> None:
+    """
+    Args:
+        event (UserProfileUpdatedEvent)
+    Returns:
+        None
+    """
+    try:
+        await AppResponseCache.invalidate (f"user:{event.id}", "profiles:interests")
+    except Exception:
+        pass
@@ -1,19 +1,27 @@
 from datetime import datetime
-from typing import Dict
-from sqlmodel import Session, select
-from src.app.bases.app_database import AppDatabase
+from typing import List
 from src.app.bases.app_event import getEventEmitter
+from src.app.bases.app_queue import AppQueue, Process, Processor
+from src.app.constants.queue_constants import LOW_PRIORITY_QUEUE
 from src.app.processors.app_export_processor import AppExportProcessor
-from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.user.events.user.admin.exported.event import UserAdminExportedEvent
 from src.v1.api.user.events.user.admin.exported_failed.event import UserAdminExportedFailedEvent
+from src.v1.api.user.repositories.user_admin_repository import UserAdminRepository
 
+@Processor (LOW_PRIORITY_QUEUE)
 class UserAdminExportProcessor (AppExportProcessor):
     """
     UserAdminExportProcessor (AppExportProcessor)
+
+    Attributes:
+        COLUMNS (List[str])
+        CHUNK_SIZE (int)
     """
+    COLUMNS = ["id", "name", "email", "email_verified_at", "created_at", "updated_at"]
+    CHUNK_SIZE = 1000
 
     @staticmethod
+    @Process ("user.admin.export")
     async def run (userId: str, export_type: str) -> None:
         """
         Args:
@@ -26,50 +34,30 @@ class UserAdminExportProcessor (AppExportProcessor):
             validTypes = ["csv", "xls", "xlsx"]
             normalizedType = export_type.lower () if export_type.lower () in validTypes else "csv"
 
-            engine = AppDatabase.databasePostgresql ()
-            session = Session (engine)
-
-            try:
-                statement = select (User).where (User.deleted_at == None)
-                users = session.exec (statement).all ()
-
-                if not users:
-                    raise Exception ("No users found to export")
-
-                export_data = []
-                for user in users:
-                    export_data.append ({
-                        "id": user.id,
-                        "name": user.name,
-                        "email": user.email,
-                        "email_verified_at": user.email_verified_at.isoformat () if user.email_verified_at else None,
-                        "created_at": user.created_at.isoformat () if user.created_at else None,
-                        "updated_at": user.updated_at.isoformat () if user.updated_at else None
-                    })
-
-                sanitized_data = AppExportProcessor.sanitize_data (export_data)
+            filename = f"users_export_{datetime.now ().strftime ('%Y%m%d_%H%M%S')}.{normalizedType}"
 
-                filename = f"users_export_{datetime.now ().strftime ('%Y%m%d_%H%M%S')}.{normalizedType}"
-
-                result = AppExportProcessor.export_file (
-                    data=sanitized_data,
-                    filename=filename,
-                    file_type=normalizedType,
-                    subfolder="export",
-                    sheet_name="Users"
-                )
+            result = await AppExportProcessor.export_stream (
+                rows=UserAdminRepository.streamExport (UserAdminExportProcessor.COLUMNS, UserAdminExportProcessor.CHUNK_SIZE),
+                columns=UserAdminExportProcessor.COLUMNS,
+                filename=filename,
+                file_type=normalizedType,
+                subfolder="export",
+                sheet_name="Users"
+            )
 
-                eventEmitter = getEventEmitter ()
-                event = UserAdminExportedEvent (
-                    userId=userId,
-                    filename=filename,
-                    fileUrl=result["fileUrl"],
-                    filePath=result["filePath"]
-                )
-                await eventEmitter.emit ("v1.user.admin.exported", event)
+            AppQueue.setJobProgress ({
+                "filename": filename,
+                "fileUrl": result["fileUrl"],
+            })
 
-            finally:
-                session.close ()
+            eventEmitter = getEventEmitter ()
+            event = UserAdminExportedEvent (
+                userId=userId,
+                filename=filename,
+                fileUrl=result["fileUrl"],
+                filePath=result["filePath"]
+            )
+            await eventEmitter.emit ("v1.user.admin.exported", event)
 
         except Exception as e:
             eventEmitter = getEventEmitter ()
@@ -1,35 +1,49 @@
-from typing import Dict
-import asyncio
+from datetime import datetime
+from typing import Dict, List, Set
+import logging
+from ulid import ULID
 from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_disk import AppDisk
 from src.app.bases.app_event import getEventEmitter
 from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_queue import AppQueue, Process, Processor
+from src.app.constants.queue_constants import LOW_PRIORITY_QUEUE
 from src.app.processors.app_import_processor import AppImportProcessor
-from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.user.events.user.admin.imported.event import UserAdminImportedEvent
 from src.v1.api.user.events.user.admin.imported_failed.event import UserAdminImportedFailedEvent
+from src.v1.api.user.events.user.admin.importing.event import UserAdminImportingEvent
 from src.v1.api.user.repositories.user_auth_repository import UserAuthRepository
 
+logger = logging.getLogger (__name__)
+
+@Processor (LOW_PRIORITY_QUEUE)
 class UserAdminImportProcessor (AppImportProcessor):
     """
     UserAdminImportProcessor (AppImportProcessor)
+
+    Attributes:
+        CHUNK_SIZE (int)
     """
+    CHUNK_SIZE = 1000
 
     @staticmethod
-    async def run (userId: str, fileContent: bytes, filename: str) -> None:
+    @Process ("user.admin.import")
+    async def run (userId: str, path: str, filename: str) -> None:
         """
         Args:
             userId (str)
-            fileContent (bytes)
+            path (str)
             filename (str)
         Returns:
             None
         """
         i18n = AppI18n.i18n ()
         try:
-            if not fileContent or not filename:
+            filePath = AppDisk.path (path, disk="private") if path else None
+            if filePath is None or not filename:
                 raise ValueError (i18n.t ("_app.processor.import.missing_file"))
 
-            parsed_data = AppImportProcessor.import_file (fileContent, filename)
+            parsed_data = AppImportProcessor.import_file (filePath, filename)
 
             required_columns = ["name", "email", "password"]
             AppImportProcessor.validate_columns (parsed_data, required_columns)
@@ -38,30 +52,38 @@ class UserAdminImportProcessor (AppImportProcessor):
 
             importedCount = 0
             skippedCount = 0
+            processedCount = 0
+            seenEmails: Set[str] = set ()
+            eventEmitter = getEventEmitter ()
 
-            for row in valid_rows:
+            for chunk in AppImportProcessor.chunk_rows (valid_rows, UserAdminImportProcessor.CHUNK_SIZE):
                 try:
-                    email = row.get ("email")
-
-                    existingUser = await UserAuthRepository.findOneByEmail (email)
-                    if existingUser:
-                        skippedCount += 1
-                        continue
-
-                    hashedPassword = AppAuth.hashPassword (row.get ("password"))
-                    user = User (
-                        name=row.get ("name"),
-                        email=email,
-                        password=hashedPassword
-                    )
-                    await UserAuthRepository.create (user)
-                    importedCount += 1
-
-                except Exception:
-                    skippedCount += 1
-                    continue
+                    imported, skipped = await UserAdminImportProcessor.importChunk (chunk, seenEmails)
+                except Exception as e:
+                    logger.warning (f"Import chunk error: {e}")
+                    imported, skipped = 0, len (chunk)
+
+                importedCount += imported
+                skippedCount += skipped
+                processedCount += len (chunk)
+
+                AppQueue.setJobProgress ({
+                    "totalRows": len (valid_rows),
+                    "processedRows": processedCount,
+                    "totalImported": importedCount,
+                    "totalSkipped": skippedCount,
+                })
+
+                event = UserAdminImportingEvent (
+                    userId=userId,
+                    filename=filename,
+                    totalRows=len (valid_rows),
+                    processedRows=processedCount,
+                    totalImported=importedCount,
+                    totalSkipped=skippedCount
+                )
+                await eventEmitter.emit ("v1.user.admin.importing", event)
 
-            eventEmitter = getEventEmitter ()
             event = UserAdminImportedEvent (
                 userId=userId,
                 filename=filename,
@@ -78,3 +100,46 @@ class UserAdminImportProcessor (AppImportProcessor):
                 error=str (e)
             )
             await eventEmitter.emit ("v1.user.admin.imported-failed", event)
+
+        finally:
+            if path:
+                AppDisk.delete (path, disk="private")
+
+    @staticmethod
+    async def importChunk (chunk: List[Dict[str, object]], seenEmails: Set[str]) -> tuple[int, int]:
+        """
+        Args:
+            chunk (List[Dict[str, object]])
+            seenEmails (Set[str])
+        Returns:
+            tuple[int, int]
+        """
+        candidates: Dict[str, Dict[str, object]] = {}
+        for row in chunk:
+            email = str (row.get ("email"))
+            if email in seenEmails or email in candidates:
+                continue
+            candidates[email] = row
+        seenEmails.update (candidates.keys ())
+
+        existingEmails = await UserAuthRepository.findEmailsIn (candidates.keys ())
+        rows = [row for email, row in candidates.items () if email not in existingEmails]
+        if not rows:
+            return 0, len (chunk)
+
+        hashedPasswords = await AppAuth.hashPasswords ([str (row.get ("password")) for row in rows])
+
+        now = datetime.utcnow ()
+        imported = await UserAuthRepository.createMany ([
+            {
+                "id": str (ULID ()),
+                "name": str (row.get ("name")),
+                "email": str (row.get ("email")),
+                "password": hashedPassword,
+                "email_verified_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row, hashedPassword in zip (rows, hashedPasswords)
+        ])
+        return imported, len (chunk) - imported
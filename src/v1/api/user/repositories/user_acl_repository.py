@@ -1,59 +1,253 @@
-from typing import List, Tuple
-from sqlmodel import Session, select
+import json
+import logging
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import redis
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.app.bases.app_cache_local import AppCacheLocal
+from src.app.bases.app_context import AppContext
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_unit_of_work import afterCommit
+from src.app.configs.auth_config import AuthConfig
+from src.app.configs.cache_config import CacheConfig
 from src.v1.api.user.databases.models.acl_model import ModelHasRole, Permission, Role, RoleHasPermission
 
 USER_MODEL_TYPE = "User"
+ACL_KEY_PREFIX = "acl"
+ACL_VERSION_KEY = f"{ACL_KEY_PREFIX}:version"
+
+logger = logging.getLogger (__name__)
+
+_authConfig = AuthConfig.config ()
+_aclVersion: AppCacheLocal[int] = AppCacheLocal (maxSize=1, ttl=_authConfig.auth_acl_local_ttl)
+_aclUserRoles: AppCacheLocal[FrozenSet[str]] = AppCacheLocal (
+    maxSize=_authConfig.auth_principal_local_size,
+    ttl=_authConfig.auth_acl_local_ttl,
+)
+_aclRolePermissions: Dict[str, FrozenSet[str]] = {}
+_aclRolePermissionsVersion: Optional[int] = None
 
 class UserAclRepository:
     """
     UserAclRepository
     """
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
         """
         Returns:
-            Session
+            AsyncSession
         """
-        return Session (AppDatabase.databasePostgresql ())
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
 
     @staticmethod
-    async def getUserAccesses (userId: str) -> Tuple[List[str], List[str]]:
+    def key (version: int, userId: str) -> str:
         """
         Args:
+            version (int)
             userId (str)
         Returns:
-            Tuple[List[str], List[str]]
+            str
+        """
+        return f"{ACL_KEY_PREFIX}:v{version}:user:{userId}"
+
+    @staticmethod
+    async def version () -> int:
+        """
+        Returns:
+            int
+        """
+        version = _aclVersion.get (ACL_VERSION_KEY)
+        if version is not None:
+            return version
+
+        version = 0
+        cache = AppContext.cacheRedis ()
+        if cache is not None:
+            try:
+                version = int (await cache.get (ACL_VERSION_KEY) or 0)
+            except Exception as e:
+                logger.warning (f"Acl version read error: {e}")
+        _aclVersion.set (ACL_VERSION_KEY, version)
+        return version
+
+    @staticmethod
+    async def rolePermissions () -> Dict[str, FrozenSet[str]]:
+        """
+        Returns:
+            Dict[str, FrozenSet[str]]
+        """
+        global _aclRolePermissions, _aclRolePermissionsVersion
+
+        version = await UserAclRepository.version ()
+        if _aclRolePermissionsVersion == version:
+            return _aclRolePermissions
+
+        session = UserAclRepository.getSession ()
+        try:
+            rows = (await session.exec (
+                select (Role.name, Permission.name)
+                .select_from (Role)
+                .join (RoleHasPermission, RoleHasPermission.role_id == Role.id, isouter=True)
+                .join (Permission, Permission.id == RoleHasPermission.permission_id, isouter=True)
+            )).all ()
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+        permissions: Dict[str, set] = {}
+        for roleName, permissionName in rows:
+            permissions.setdefault (roleName, set ())
+            if permissionName is not None:
+                permissions[roleName].add (permissionName)
+
+        _aclRolePermissions = {roleName: frozenset (names) for roleName, names in permissions.items ()}
+        _aclRolePermissionsVersion = version
+        return _aclRolePermissions
+
+    @staticmethod
+    async def getUserRoles (userId: str) -> FrozenSet[str]:
+        """
+        Args:
+            userId (str)
+        Returns:
+            FrozenSet[str]
         """
+        version = await UserAclRepository.version ()
+        roles = _aclUserRoles.get ((version, userId))
+        if roles is not None:
+            return roles
+
+        cache = AppContext.cacheRedis ()
+        key = UserAclRepository.key (version, userId)
+        if cache is not None:
+            try:
+                cached = await cache.get (key)
+                if cached is not None:
+                    roles = frozenset (json.loads (cached))
+                    _aclUserRoles.set ((version, userId), roles)
+                    return roles
+            except Exception as e:
+                logger.warning (f"Acl roles read error: {e}")
+
         session = UserAclRepository.getSession ()
         try:
-            roleLinks = session.exec (
-                select (ModelHasRole).where (
+            roleNames = (await session.exec (
+                select (Role.name)
+                .join (ModelHasRole, ModelHasRole.role_id == Role.id)
+                .where (
                     ModelHasRole.model_id == userId,
                     ModelHasRole.model_type == USER_MODEL_TYPE,
                 )
-            ).all ()
+            )).all ()
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+        roles = frozenset (roleNames)
+        _aclUserRoles.set ((version, userId), roles)
+        if cache is not None:
+            try:
+                await cache.set (key, json.dumps (sorted (roles)), ex=_authConfig.auth_acl_ttl)
+            except Exception as e:
+                logger.warning (f"Acl roles write error: {e}")
+        return roles
+
+    @staticmethod
+    async def getUserAccesses (userId: str) -> Tuple[List[str], List[str]]:
+        """
+        Args:
+            userId (str)
+        Returns:
+            Tuple[List[str], List[str]]
+        """
+        roles = await UserAclRepository.getUserRoles (userId)
+        if not roles:
+            return [], []
+
+        rolePermissions = await UserAclRepository.rolePermissions ()
+        permissions = set ()
+        for roleName in roles:
+            permissions.update (rolePermissions.get (roleName, ()))
+        return sorted (permissions), sorted (roles)
+
+    @staticmethod
+    async def hasPermission (userId: str, permission: str) -> bool:
+        """
+        Args:
+            userId (str)
+            permission (str)
+        Returns:
+            bool
+        """
+        roles = await UserAclRepository.getUserRoles (userId)
+        if not roles:
+            return False
 
-            roleIds = [link.role_id for link in roleLinks]
-            if not roleIds:
-                return [], []
+        rolePermissions = await UserAclRepository.rolePermissions ()
+        return any (permission in rolePermissions.get (roleName, ()) for roleName in roles)
+
+    @staticmethod
+    async def forgetUser (userId: str) -> None:
+        """
+        Args:
+            userId (str)
+        Returns:
+            None
+        """
+        async def delete () -> None:
+            """
+            Returns:
+                None
+            """
+            version = await UserAclRepository.version ()
+            _aclUserRoles.delete ((version, userId))
+            cache = AppContext.cacheRedis ()
+            if cache is not None:
+                try:
+                    await cache.delete (UserAclRepository.key (version, userId))
+                except Exception as e:
+                    logger.warning (f"Acl roles delete error: {e}")
 
-            roles = session.exec (
-                select (Role).where (Role.id.in_ (roleIds))
-            ).all ()
-            roleNames = sorted ({role.name for role in roles})
+        await afterCommit (delete)
 
-            permissionLinks = session.exec (
-                select (RoleHasPermission).where (RoleHasPermission.role_id.in_ (roleIds))
-            ).all ()
-            permissionIds = [link.permission_id for link in permissionLinks]
-            if not permissionIds:
-                return [], roleNames
+    @staticmethod
+    async def invalidate () -> None:
+        """
+        Returns:
+            None
+        """
+        async def bump () -> None:
+            """
+            Returns:
+                None
+            """
+            cache = AppContext.cacheRedis ()
+            if cache is not None:
+                await cache.incr (ACL_VERSION_KEY)
+            UserAclRepository.forgetLocal ()
 
-            permissions = session.exec (
-                select (Permission).where (Permission.id.in_ (permissionIds))
-            ).all ()
+        await afterCommit (bump)
 
-            return sorted ({permission.name for permission in permissions}), roleNames
+    @staticmethod
+    def invalidateSync () -> None:
+        """
+        Returns:
+            None
+        """
+        cacheConfig = CacheConfig.config ()
+        client = redis.Redis.from_url (cacheConfig.redis_uri ())
+        try:
+            client.incr (ACL_VERSION_KEY)
         finally:
-            session.close ()
+            client.close ()
+        UserAclRepository.forgetLocal ()
+
+    @staticmethod
+    def forgetLocal () -> None:
+        """
+        Returns:
+            None
+        """
+        global _aclRolePermissionsVersion
+
+        _aclVersion.clear ()
+        _aclUserRoles.clear ()
+        _aclRolePermissionsVersion = None
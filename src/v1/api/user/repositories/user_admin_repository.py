@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Optional, List, Dict
-from sqlmodel import Session, select
+from typing import AsyncIterator, Optional, List, Dict, Sequence
+from sqlmodel import select
+from sqlmodel.sql.expression import Select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ulid import ULID
-from src.app.bases.app_auth import AppAuth
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_explain import QueryShape
+from src.app.bases.app_password_hasher import AppPasswordHasher
 from src.app.repositories.app_postgresql_repository import AppPostgresqlRepository
 from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType, CursorPagination, CursorPaginationType, Orderization, Filterization
 from src.v1.api.user.databases.models.user_model import User
@@ -13,6 +16,15 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
     """
     UserAdminRepository (AppPostgresqlRepository)
     """
+    filterable = {
+        "email": ("prefix", "eq", "in", "contains"),
+        "name": ("contains", "prefix"),
+        "created_at": ("range",),
+    }
+    orderable = ("created_at", "updated_at", "name", "email", "id")
+    searchable = ("name", "email")
+    search_vector = "search_vector"
+
     def __init__ (self) -> None:
         """
         Returns:
@@ -20,20 +32,49 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         super ().__init__ ()
 
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
+        """
+        Returns:
+            AsyncSession
+        """
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
+
+    @staticmethod
+    @QueryShape ("user.admin.filter.email", "email", "prefix", "admin@", 10)
+    @QueryShape ("user.admin.filter.name", "name", "prefix", "Admin", 10)
+    def filterStatement (field: str, operator: str, search: str, limit: int) -> Select:
         """
+        Args:
+            field (str)
+            operator (str)
+            search (str)
+            limit (int)
         Returns:
-            Session
+            Select
         """
-        engine = AppDatabase.databasePostgresql ()
-        return Session (engine)
+        conditions = UserAdminRepository ().filter ([Filterization (field=field, operator=operator, search=search)], User)["conditions"]
+        return UserAdminRepository.pageStatement (limit).where (*conditions)
+
+    @staticmethod
+    @QueryShape ("user.admin.search", "john", 10)
+    def searchStatement (search: str, limit: int) -> Select:
+        """
+        Args:
+            search (str)
+            limit (int)
+        Returns:
+            Select
+        """
+        query = UserAdminRepository ().search (search, User)
+        return UserAdminRepository.pageStatement (limit).where (query["search"]).order_by (None).order_by (query["rank"].desc ())
 
     async def allOffset (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: OffsetPaginationType = None
+        page: OffsetPaginationType = None,
+        search: Optional[str] = None
     ) -> OffsetPagination[UserTransformerDto]:
         """
         Args:
@@ -41,6 +82,7 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (OffsetPaginationType)
+            search (Optional[str])
         Returns:
             OffsetPagination[UserTransformerDto]
         """
@@ -55,10 +97,13 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, User))
+
+            if search:
+                query.update (self.search (search, User))
 
             if orders:
-                query.update (self.order (orders))
+                query.update (self.order (orders, User))
 
             result = await self.offset_paginate_all (
                 model=User,
@@ -77,17 +122,19 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
                 previousPage=result.previousPage,
                 firstPage=result.firstPage,
                 lastPage=result.lastPage,
+                countStrategy=result.countStrategy,
                 data=data
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     async def allCursor (
         self,
         userId: str,
         orders: List[Orderization] = None,
         filters: List[Filterization] = None,
-        page: CursorPaginationType = None
+        page: CursorPaginationType = None,
+        search: Optional[str] = None
     ) -> CursorPagination[User]:
         """
         Args:
@@ -95,6 +142,7 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
             orders (List[Orderization])
             filters (List[Filterization])
             page (CursorPaginationType)
+            search (Optional[str])
         Returns:
             CursorPagination[User]
         """
@@ -111,19 +159,20 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
             }
 
             if filters:
-                query["where"].update (self.filter (filters))
+                query.update (self.filter (filters, User))
 
-            if orders:
-                query.update (self.order (orders))
+            if search:
+                query.update (self.search (search, User))
 
             return await self.cursor_paginate_all (
                 model=User,
                 query=query,
                 page=page,
-                session=session
+                session=session,
+                orders=orders
             )
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def get (userId: str, id: str) -> Optional[User]:
@@ -137,10 +186,10 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         session = UserAdminRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at == None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def update (userId: str, id: str, data: Dict[str, object]) -> Optional[User]:
@@ -155,7 +204,7 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         session = UserAdminRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at == None)
-            user = session.exec (statement).first ()
+            user = (await session.exec (statement)).first ()
             if not user:
                 return None
             if "name" in data and data["name"] is not None:
@@ -163,14 +212,14 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
             if "email" in data and data["email"] is not None:
                 user.email = data["email"]
             if "password" in data and data["password"] is not None:
-                user.password = AppAuth.hashPassword (data["password"])
+                user.password = await AppPasswordHasher.hash (data["password"])
             user.updated_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def create (userId: str, data: Dict[str, object]) -> Optional[User]:
@@ -187,17 +236,17 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
                 id=str (ULID ()),
                 name=data.get ("name"),
                 email=data.get ("email"),
-                password=AppAuth.hashPassword (data.get ("password")),
+                password=await AppPasswordHasher.hash (data.get ("password")),
                 email_verified_at=datetime.utcnow (),
                 created_at=datetime.utcnow (),
                 updated_at=datetime.utcnow ()
             )
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def restore (userId: str, id: str) -> Optional[User]:
@@ -211,17 +260,17 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         session = UserAdminRepository.getSession ()
         try:
             statement = select (User).where (User.id == id)
-            user = session.exec (statement).first ()
+            user = (await session.exec (statement)).first ()
             if not user:
                 return None
             user.deleted_at = None
             user.updated_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def delete (userId: str, id: str) -> Optional[User]:
@@ -235,17 +284,17 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         session = UserAdminRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at == None)
-            user = session.exec (statement).first ()
+            user = (await session.exec (statement)).first ()
             if not user:
                 return None
             user.deleted_at = datetime.utcnow ()
             user.updated_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def verify (userId: str, id: str) -> Optional[User]:
@@ -259,13 +308,97 @@ class UserAdminRepository (AppPostgresqlRepository[User]):
         session = UserAdminRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at == None, User.email_verified_at == None)
-            user = session.exec (statement).first ()
+            user = (await session.exec (statement)).first ()
             if not user:
                 return None
             user.email_verified_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def streamExport (columns: List[str], chunkSize: int = 1000) -> AsyncIterator[Sequence[object]]:
+        """
+        Args:
+            columns (List[str])
+            chunkSize (int)
+        Returns:
+            AsyncIterator[Sequence[object]]
+        """
+        # A dedicated session keeps the server-side cursor open for the whole export instead of borrowing the request one.
+        session = AppDatabase.databasePostgresqlAsyncSessionMake ()
+        try:
+            statement = (
+                select (*[getattr (User, column) for column in columns])
+                .where (User.deleted_at == None)
+                .order_by (User.id)
+                .execution_options (yield_per=chunkSize)
+            )
+            result = await session.stream (statement)
+            async for row in result:
+                yield row
+        finally:
+            await session.close ()
+
+    @staticmethod
+    @QueryShape ("user.admin.page", 10)
+    def pageStatement (limit: int) -> Select:
+        """
+        Args:
+            limit (int)
+        Returns:
+            Select
+        """
+        return select (User).where (User.deleted_at == None).order_by (User.created_at.desc ()).limit (limit)
+
+    @staticmethod
+    @QueryShape ("user.admin.stream_ids", None, True, "01HZGXQZJQK9X5Y7Z8W9V0U1T2", 1000)
+    def streamIdsStatement (userIds: Optional[List[str]], verifiedOnly: bool, lastId: Optional[str], chunkSize: int) -> Select:
+        """
+        Args:
+            userIds (Optional[List[str]])
+            verifiedOnly (bool)
+            lastId (Optional[str])
+            chunkSize (int)
+        Returns:
+            Select
+        """
+        statement = select (User.id).where (User.deleted_at == None)
+        if verifiedOnly:
+            statement = statement.where (User.email_verified_at != None)
+        if userIds is not None:
+            statement = statement.where (User.id.in_ (userIds))
+        if lastId is not None:
+            statement = statement.where (User.id > lastId)
+        return statement.order_by (User.id).limit (chunkSize)
+
+    @staticmethod
+    async def streamIds (userIds: Optional[List[str]] = None, verifiedOnly: bool = False, chunkSize: int = 1000) -> AsyncIterator[List[str]]:
+        """
+        Args:
+            userIds (Optional[List[str]])
+            verifiedOnly (bool)
+            chunkSize (int)
+        Returns:
+            AsyncIterator[List[str]]
+        """
+        # Keyset pages on the primary key, each page is its own short read so writes between pages never wait on it.
+        lastId: Optional[str] = None
+        while True:
+            statement = UserAdminRepository.streamIdsStatement (userIds, verifiedOnly, lastId, chunkSize)
+
+            session = AppDatabase.databasePostgresqlAsyncSessionMake ()
+            try:
+                ids = list ((await session.exec (statement)).all ())
+            finally:
+                await session.close ()
+
+            if not ids:
+                return
+            yield ids
+            if len (ids) < chunkSize:
+                return
+            lastId = ids[-1]
@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional
-from sqlmodel import Session, select
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.app.bases.app_database import AppDatabase
-from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_password_hasher import AppPasswordHasher
 from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.user.databases.models.password_reset_token_model import PasswordResetToken
 
@@ -11,13 +14,12 @@ class UserAuthRepository:
     UserAuthRepository
     """
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
         """
         Returns:
-            Session
+            AsyncSession
         """
-        engine = AppDatabase.databasePostgresql ()
-        return Session (engine)
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
 
     @staticmethod
     async def findOneByEmail (email: str) -> Optional[User]:
@@ -30,10 +32,10 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             statement = select (User).where (User.email == email, User.deleted_at == None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def findOneById (id: str) -> Optional[User]:
@@ -46,10 +48,10 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at == None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def findOneByIdIncludingDeleted (id: str) -> Optional[User]:
@@ -62,10 +64,10 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             statement = select (User).where (User.id == id)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def findOneDeletedById (id: str) -> Optional[User]:
@@ -78,10 +80,56 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             statement = select (User).where (User.id == id, User.deleted_at != None)
-            result = session.exec (statement).first ()
+            result = (await session.exec (statement)).first ()
             return result
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def findEmailsIn (emails: Iterable[str]) -> Set[str]:
+        """
+        Args:
+            emails (Iterable[str])
+        Returns:
+            Set[str]
+        """
+        emails = list (emails)
+        if not emails:
+            return set ()
+        session = UserAuthRepository.getSession ()
+        try:
+            statement = select (User.email).where (User.email.in_ (emails))
+            result = (await session.exec (statement)).all ()
+            return set (result)
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def createMany (rows: List[Dict[str, object]]) -> int:
+        """
+        Args:
+            rows (List[Dict[str, object]])
+        Returns:
+            int
+        """
+        if not rows:
+            return 0
+        session = UserAuthRepository.getSession ()
+        try:
+            statement = (
+                insert (User)
+                .values (rows)
+                .on_conflict_do_nothing (index_elements=[User.email])
+                .returning (User.id)
+            )
+            result = (await session.exec (statement)).all ()
+            await AppDatabase.databasePostgresqlCommit (session)
+            return len (result)
+        except Exception:
+            await AppDatabase.databasePostgresqlRollback (session)
+            raise
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def create (user: User) -> User:
@@ -94,11 +142,11 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def update (user: User) -> User:
@@ -111,11 +159,40 @@ class UserAuthRepository:
         session = UserAuthRepository.getSession ()
         try:
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def rehash (userId: str, currentPassword: str, password: str) -> bool:
+        """
+        Args:
+            userId (str)
+            currentPassword (str)
+            password (str)
+        Returns:
+            bool
+        """
+        session = UserAuthRepository.getSession ()
+        try:
+            # Matching on the old hash keeps a password changed in the meantime from being overwritten.
+            statement = (
+                update (User)
+                .where (User.id == userId, User.password == currentPassword)
+                .values (password=password)
+                .returning (User.id)
+                .execution_options (synchronize_session=False)
+            )
+            result = (await session.exec (statement)).all ()
+            await AppDatabase.databasePostgresqlCommit (session)
+            return len (result) > 0
+        except Exception:
+            await AppDatabase.databasePostgresqlRollback (session)
+            raise
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def logout (userId: str) -> Optional[User]:
@@ -152,17 +229,17 @@ class UserAuthRepository:
                 User.deleted_at == None,
                 User.email_verified_at == None
             )
-            user = session.exec (statement).first ()
+            user = (await session.exec (statement)).first ()
             if not user:
                 return None
             user.email_verified_at = datetime.utcnow ()
             user.updated_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def reverify (userId: str) -> Optional[User]:
@@ -190,24 +267,24 @@ class UserAuthRepository:
                 PasswordResetToken.token == token,
                 PasswordResetToken.email == email
             )
-            resetToken = session.exec (statement).first ()
+            resetToken = (await session.exec (statement)).first ()
             if not resetToken:
                 return None
 
-            session.delete (resetToken)
+            await session.delete (resetToken)
 
             user = await UserAuthRepository.findOneByEmail (email)
             if not user:
                 return None
-            hashedPassword = AppAuth.hashPassword (password)
+            hashedPassword = await AppPasswordHasher.hash (password)
             user.password = hashedPassword
             user.updated_at = datetime.utcnow ()
             session.add (user)
-            session.commit ()
-            session.refresh (user)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
             return user
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def forget (token: str, email: str) -> Optional[PasswordResetToken]:
@@ -225,13 +302,13 @@ class UserAuthRepository:
                 return None
 
             statement = select (PasswordResetToken).where (PasswordResetToken.email == email)
-            existingToken = session.exec (statement).first ()
+            existingToken = (await session.exec (statement)).first ()
             if existingToken:
                 existingToken.token = token
                 existingToken.created_at = datetime.utcnow ()
                 session.add (existingToken)
-                session.commit ()
-                session.refresh (existingToken)
+                await AppDatabase.databasePostgresqlCommit (session)
+                await session.refresh (existingToken)
                 return existingToken
             else:
                 resetToken = PasswordResetToken (
@@ -240,8 +317,8 @@ class UserAuthRepository:
                     created_at=datetime.utcnow ()
                 )
                 session.add (resetToken)
-                session.commit ()
-                session.refresh (resetToken)
+                await AppDatabase.databasePostgresqlCommit (session)
+                await session.refresh (resetToken)
                 return resetToken
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
@@ -0,0 +1,120 @@
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+from src.app.bases.app_cache_local import AppCacheLocal
+from src.app.bases.app_context import AppContext
+from src.app.bases.app_database_unit_of_work import afterCommit
+from src.app.configs.auth_config import AuthConfig
+from src.v1.api.user.databases.models.user_model import User
+from src.v1.api.user.repositories.user_auth_repository import UserAuthRepository
+
+logger = logging.getLogger (__name__)
+
+PRINCIPAL_KEY_PREFIX = "auth:principal"
+PRINCIPAL_DATETIME_FIELDS = ("email_verified_at", "deleted_at", "created_at", "updated_at")
+
+_authConfig = AuthConfig.config ()
+_principals: AppCacheLocal[Dict[str, object]] = AppCacheLocal (
+    maxSize=_authConfig.auth_principal_local_size,
+    ttl=_authConfig.auth_principal_local_ttl,
+)
+
+class UserPrincipalRepository:
+    """
+    UserPrincipalRepository
+    """
+    @staticmethod
+    def key (userId: str) -> str:
+        """
+        Args:
+            userId (str)
+        Returns:
+            str
+        """
+        return f"{PRINCIPAL_KEY_PREFIX}:{userId}"
+
+    @staticmethod
+    def dump (user: User) -> Dict[str, object]:
+        """
+        Args:
+            user (User)
+        Returns:
+            Dict[str, object]
+        """
+        return user.model_dump (mode="json", exclude={"password"})
+
+    @staticmethod
+    def load (data: Dict[str, object]) -> User:
+        """
+        Args:
+            data (Dict[str, object])
+        Returns:
+            User
+        """
+        fields = dict (data)
+        for field in PRINCIPAL_DATETIME_FIELDS:
+            value = fields.get (field)
+            if isinstance (value, str):
+                fields[field] = datetime.fromisoformat (value)
+        return User (**fields)
+
+    @staticmethod
+    async def findById (userId: str) -> Optional[User]:
+        """
+        Args:
+            userId (str)
+        Returns:
+            Optional[User]
+        """
+        data = _principals.get (userId)
+        if data is not None:
+            return UserPrincipalRepository.load (data)
+
+        cache = AppContext.cacheRedis ()
+        if cache is not None:
+            try:
+                cached = await cache.get (UserPrincipalRepository.key (userId))
+                if cached:
+                    data = json.loads (cached)
+                    _principals.set (userId, data)
+                    return UserPrincipalRepository.load (data)
+            except Exception as e:
+                logger.warning (f"Principal cache read error: {e}")
+
+        user = await UserAuthRepository.findOneById (userId)
+        if user is None:
+            return None
+
+        data = UserPrincipalRepository.dump (user)
+        _principals.set (userId, data)
+        if cache is not None and _authConfig.auth_principal_ttl > 0:
+            try:
+                await cache.set (UserPrincipalRepository.key (userId), json.dumps (data), ex=_authConfig.auth_principal_ttl)
+            except Exception as e:
+                logger.warning (f"Principal cache write error: {e}")
+        return user
+
+    @staticmethod
+    async def forget (userId: str) -> None:
+        """
+        Args:
+            userId (str)
+        Returns:
+            None
+        """
+        # Dropped after commit, otherwise a concurrent request could refill the cache from the row being replaced.
+        async def delete () -> None:
+            """
+            Returns:
+                None
+            """
+            _principals.delete (userId)
+            cache = AppContext.cacheRedis ()
+            if cache is not None:
+                try:
+                    await cache.delete (UserPrincipalRepository.key (userId))
+                except Exception as e:
+                    logger.warning (f"Principal cache delete error: {e}")
+
+        await afterCommit (delete)
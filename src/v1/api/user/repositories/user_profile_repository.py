@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ulid import ULID
-from src.app.bases.app_auth import AppAuth
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_password_hasher import AppPasswordHasher
 from src.app.utils.app_avatar_storage import deleteAvatarIfExists
 from src.v1.api.user.databases.models.profile_model import Profile
 from src.v1.api.user.databases.models.user_model import User
@@ -14,12 +15,12 @@ class UserProfileRepository:
     UserProfileRepository
     """
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
         """
         Returns:
-            Session
+            AsyncSession
         """
-        return Session (AppDatabase.databasePostgresql ())
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
 
     @staticmethod
     async def findProfileByUserId (userId: str) -> Optional[Profile]:
@@ -31,11 +32,11 @@ class UserProfileRepository:
         """
         session = UserProfileRepository.getSession ()
         try:
-            return session.exec (
+            return (await session.exec (
                 select (Profile).where (Profile.user_id == userId)
-            ).first ()
+            )).first ()
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def getMe (userId: str) -> tuple[Optional[User], Optional[Profile]]:
@@ -69,9 +70,9 @@ class UserProfileRepository:
         """
         session = UserProfileRepository.getSession ()
         try:
-            user = session.exec (
+            user = (await session.exec (
                 select (User).where (User.id == userId, User.deleted_at == None)
-            ).first ()
+            )).first ()
             if user is None:
                 return None, None
 
@@ -80,9 +81,9 @@ class UserProfileRepository:
             user.updated_at = datetime.utcnow ()
             session.add (user)
 
-            profile = session.exec (
+            profile = (await session.exec (
                 select (Profile).where (Profile.user_id == userId)
-            ).first ()
+            )).first ()
             if profile is None:
                 profile = Profile (
                     id=str (ULID ()),
@@ -97,15 +98,15 @@ class UserProfileRepository:
                 setattr (profile, key, value)
             profile.updated_at = datetime.utcnow ()
             session.add (profile)
-            session.commit ()
-            session.refresh (user)
-            session.refresh (profile)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (user)
+            await session.refresh (profile)
             return user, profile
         except Exception:
-            session.rollback ()
+            await AppDatabase.databasePostgresqlRollback (session)
             raise
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def profileInterests () -> List[str]:
@@ -115,9 +116,9 @@ class UserProfileRepository:
         """
         session = UserProfileRepository.getSession ()
         try:
-            profiles = session.exec (
+            profiles = (await session.exec (
                 select (Profile).where (Profile.interests != None)
-            ).all ()
+            )).all ()
             values: set[str] = set ()
             for profile in profiles:
                 for interest in profile.interests or []:
@@ -126,10 +127,10 @@ class UserProfileRepository:
                         values.add (trimmed)
             return sorted (values)
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
-    def hashPasswordIfPresent (userData: dict) -> dict:
+    async def hashPasswordIfPresent (userData: dict) -> dict:
         """
         Args:
             userData (dict)
@@ -138,5 +139,5 @@ class UserProfileRepository:
         """
         password = userData.pop ("password", None)
         if password:
-            userData["password"] = AppAuth.hashPassword (password)
+            userData["password"] = await AppPasswordHasher.hash (password)
         return userData
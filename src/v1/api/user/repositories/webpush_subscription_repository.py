@@ -1,7 +1,10 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlmodel import Session, select
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select
 from src.app.bases.app_database import AppDatabase
+from src.app.bases.app_database_explain import QueryShape
 from src.v1.api.user.databases.models.push_subscription_model import PushSubscription, USER_WEBPUSH_SUBSCRIBABLE_TYPE
 
 class WebpushSubscriptionRepository:
@@ -9,13 +12,12 @@ class WebpushSubscriptionRepository:
     WebpushSubscriptionRepository
     """
     @staticmethod
-    def getSession () -> Session:
+    def getSession () -> AsyncSession:
         """
         Returns:
-            Session
+            AsyncSession
         """
-        engine = AppDatabase.databasePostgresql ()
-        return Session (engine)
+        return AppDatabase.databasePostgresqlAsyncSessionScoped ()
 
     @staticmethod
     async def updatePushSubscription (
@@ -38,7 +40,7 @@ class WebpushSubscriptionRepository:
         session = WebpushSubscriptionRepository.getSession ()
         try:
             statement = select (PushSubscription).where (PushSubscription.endpoint == endpoint)
-            existing = session.exec (statement).first ()
+            existing = (await session.exec (statement)).first ()
             now = datetime.utcnow ()
 
             if (
@@ -51,13 +53,13 @@ class WebpushSubscriptionRepository:
                 existing.content_encoding = contentEncoding
                 existing.updated_at = now
                 session.add (existing)
-                session.commit ()
-                session.refresh (existing)
+                await AppDatabase.databasePostgresqlCommit (session)
+                await session.refresh (existing)
                 return existing
 
             if existing:
-                session.delete (existing)
-                session.commit ()
+                await session.delete (existing)
+                await AppDatabase.databasePostgresqlCommit (session)
 
             subscription = PushSubscription (
                 subscribable_id=userId,
@@ -70,11 +72,11 @@ class WebpushSubscriptionRepository:
                 updated_at=now,
             )
             session.add (subscription)
-            session.commit ()
-            session.refresh (subscription)
+            await AppDatabase.databasePostgresqlCommit (session)
+            await session.refresh (subscription)
             return subscription
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def deletePushSubscription (userId: str, endpoint: str) -> None:
@@ -92,12 +94,12 @@ class WebpushSubscriptionRepository:
                 PushSubscription.subscribable_type == USER_WEBPUSH_SUBSCRIBABLE_TYPE,
                 PushSubscription.endpoint == endpoint,
             )
-            subscriptions = session.exec (statement).all ()
+            subscriptions = (await session.exec (statement)).all ()
             for subscription in subscriptions:
-                session.delete (subscription)
-            session.commit ()
+                await session.delete (subscription)
+            await AppDatabase.databasePostgresqlCommit (session)
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def hasPushSubscriptions (userId: str) -> bool:
@@ -113,9 +115,9 @@ class WebpushSubscriptionRepository:
                 PushSubscription.subscribable_id == userId,
                 PushSubscription.subscribable_type == USER_WEBPUSH_SUBSCRIBABLE_TYPE,
             )
-            return session.exec (statement).first () is not None
+            return (await session.exec (statement)).first () is not None
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def findByUserId (userId: str) -> List[PushSubscription]:
@@ -131,9 +133,41 @@ class WebpushSubscriptionRepository:
                 PushSubscription.subscribable_id == userId,
                 PushSubscription.subscribable_type == USER_WEBPUSH_SUBSCRIBABLE_TYPE,
             )
-            return list (session.exec (statement).all ())
+            return list ((await session.exec (statement)).all ())
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    @QueryShape ("webpush.subscription.by_user_ids", ["01HZGXQZJQK9X5Y7Z8W9V0U1T2"])
+    def byUserIdsStatement (userIds: List[str]) -> Select:
+        """
+        Args:
+            userIds (List[str])
+        Returns:
+            Select
+        """
+        return select (PushSubscription).where (
+            PushSubscription.subscribable_id.in_ (userIds),
+            PushSubscription.subscribable_type == USER_WEBPUSH_SUBSCRIBABLE_TYPE,
+        )
+
+    @staticmethod
+    async def findByUserIds (userIds: List[str]) -> List[PushSubscription]:
+        """
+        Args:
+            userIds (List[str])
+        Returns:
+            List[PushSubscription]
+        """
+        if not userIds:
+            return []
+
+        session = WebpushSubscriptionRepository.getSession ()
+        try:
+            statement = WebpushSubscriptionRepository.byUserIdsStatement (userIds)
+            return list ((await session.exec (statement)).all ())
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
 
     @staticmethod
     async def deleteById (subscriptionId: int) -> None:
@@ -146,9 +180,31 @@ class WebpushSubscriptionRepository:
         session = WebpushSubscriptionRepository.getSession ()
         try:
             statement = select (PushSubscription).where (PushSubscription.id == subscriptionId)
-            subscription = session.exec (statement).first ()
+            subscription = (await session.exec (statement)).first ()
             if subscription:
-                session.delete (subscription)
-                session.commit ()
+                await session.delete (subscription)
+                await AppDatabase.databasePostgresqlCommit (session)
+        finally:
+            await AppDatabase.databasePostgresqlRelease (session)
+
+    @staticmethod
+    async def deleteByIds (subscriptionIds: List[int]) -> int:
+        """
+        Args:
+            subscriptionIds (List[int])
+        Returns:
+            int
+        """
+        if not subscriptionIds:
+            return 0
+
+        session = WebpushSubscriptionRepository.getSession ()
+        try:
+            result = await session.exec (delete (PushSubscription).where (PushSubscription.id.in_ (subscriptionIds)))
+            await AppDatabase.databasePostgresqlCommit (session)
+            return result.rowcount or 0
+        except Exception:
+            await AppDatabase.databasePostgresqlRollback (session)
+            raise
         finally:
-            session.close ()
+            await AppDatabase.databasePostgresqlRelease (session)
@@ -1,21 +1,28 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from fastapi import BackgroundTasks, HTTPException, status
+from typing import Dict, List, Optional, Tuple
+import asyncio
+from fastapi import BackgroundTasks, HTTPException, UploadFile, status
 from sqlmodel import Session, select
-from src.app.bases.app_auth import AppAuth
+from ulid import ULID
 from src.app.bases.app_database import AppDatabase
 from src.app.bases.app_disk import AppDisk
 from src.app.bases.app_event import getEventEmitter
 from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_password_hasher import AppPasswordHasher
+from src.app.bases.app_queue import AppQueue
+from src.app.constants.queue_constants import LOW_PRIORITY_QUEUE
+from src.app.dtos.app_dto import JobPayloadType
 from src.app.processors.app_export_processor import AppExportProcessor
 from src.app.processors.app_import_processor import AppImportProcessor
-from src.app.repositories.app_repository import OffsetPagination, OffsetPaginationType
+from src.app.repositories.app_repository import CursorPagination, CursorPaginationType, OffsetPagination, OffsetPaginationType
+from src.app.utils.app_queue_dispatch import dispatch_or_background
 from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.user.dtos.user_transformer_dto import UserTransformerDto
 from src.v1.api.user.dtos.user_validator_dto import UserCreateValidatorDto, UserUpdateValidatorDto
 from src.v1.api.user.events.user.admin.activated.event import UserAdminActivatedEvent
 from src.v1.api.user.events.user.admin.deactivated.event import UserAdminDeactivatedEvent
+from src.v1.api.user.events.user.admin.updated.event import UserAdminUpdatedEvent
 from src.v1.api.user.processors.user_admin_import_processor import UserAdminImportProcessor
 from src.v1.api.user.processors.user_admin_export_processor import UserAdminExportProcessor
 from src.v1.api.user.repositories.user_auth_repository import UserAuthRepository
@@ -31,21 +38,37 @@ class UserAdminService:
     repository = UserAdminRepository ()
 
     @staticmethod
-    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: Dict[str, object] = None) -> OffsetPagination[UserTransformerDto]:
+    async def all (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: Dict[str, object] = None, search: Optional[str] = None) -> OffsetPagination[UserTransformerDto]:
         """
         Args:
             userId (str)
             orders (List[Orderization])
             filters (List[Filterization])
             page (Dict[str, object])
+            search (Optional[str])
         Returns:
             OffsetPagination[UserTransformerDto]
         """
         pageType = OffsetPaginationType (
             currentPage=page.get ("currentPage", 1) if page else 1,
-            limitPage=page.get ("limitPage", 10) if page else 10
+            limitPage=page.get ("limitPage", 10) if page else 10,
+            countStrategy=page.get ("countStrategy") if page else None
         )
-        return await UserAdminService.repository.allOffset (userId, orders, filters, pageType)
+        return await UserAdminService.repository.allOffset (userId, orders, filters, pageType, search)
+
+    @staticmethod
+    async def allCursor (userId: str, orders: List[Dict[str, object]] = None, filters: List[Dict[str, object]] = None, page: CursorPaginationType = None, search: Optional[str] = None) -> CursorPagination[UserTransformerDto]:
+        """
+        Args:
+            userId (str)
+            orders (List[Dict[str, object]])
+            filters (List[Dict[str, object]])
+            page (CursorPaginationType)
+            search (Optional[str])
+        Returns:
+            CursorPagination[UserTransformerDto]
+        """
+        return await UserAdminService.repository.allCursor (userId, orders, filters, page, search)
 
     @staticmethod
     async def get (userId: str, id: str) -> UserTransformerDto:
@@ -75,7 +98,7 @@ class UserAdminService:
         existingUser = await UserAuthRepository.findOneByEmail (data.email)
         if existingUser:
             raise HTTPException (status_code=status.HTTP_400_BAD_REQUEST, detail=i18n.t ("_v1_user.auth.email_already_exists"))
-        hashedPassword = AppAuth.hashPassword (data.password)
+        hashedPassword = await AppPasswordHasher.hash (data.password)
         user = User (
             name=data.name,
             email=data.email,
@@ -107,8 +130,19 @@ class UserAdminService:
                 raise HTTPException (status_code=status.HTTP_400_BAD_REQUEST, detail=i18n.t ("_v1_user.auth.email_already_exists"))
             user.email = data.email
         if data.password is not None:
-            user.password = AppAuth.hashPassword (data.password)
+            user.password = await AppPasswordHasher.hash (data.password)
         user = await UserAuthRepository.update (user)
+        eventEmitter = getEventEmitter ()
+        event = UserAdminUpdatedEvent (
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            email_verified_at=user.email_verified_at,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            deleted_at=user.deleted_at
+        )
+        await eventEmitter.emit ("v1.user.admin.updated", event)
         return UserTransformerDto.fromUser (user)
 
     @staticmethod
@@ -183,40 +217,86 @@ class UserAdminService:
         if user.email_verified_at is None:
             user.email_verified_at = datetime.utcnow ()
             user = await UserAuthRepository.update (user)
+            eventEmitter = getEventEmitter ()
+            event = UserAdminUpdatedEvent (
+                id=user.id,
+                name=user.name,
+                email=user.email,
+                email_verified_at=user.email_verified_at,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                deleted_at=user.deleted_at
+            )
+            await eventEmitter.emit ("v1.user.admin.updated", event)
         return UserTransformerDto.fromUser (user)
 
     @staticmethod
-    async def import_users (background_tasks: BackgroundTasks, userId: str, fileContent: bytes, filename: str) -> str:
+    async def import_users (background_tasks: BackgroundTasks, userId: str, file: UploadFile) -> Tuple[str, Optional[str]]:
         """
         Args:
+            background_tasks (BackgroundTasks)
             userId (str)
-            fileContent (bytes)
-            filename (str)
+            file (UploadFile)
         Returns:
-            str
+            Tuple[str, Optional[str]]
         """
         i18n = AppI18n.i18n ()
-        background_tasks.add_task (
-            UserAdminImportProcessor.run,
+        path = f"import/{ULID ()}{Path (file.filename or '').suffix.lower ()}"
+        # Stream the upload to the private disk so neither the API nor Redis holds the whole file in memory.
+        if not await asyncio.to_thread (AppDisk.put, path, file.file, "private"):
+            raise HTTPException (status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=i18n.t ("_v1_user.admin.import_failed"))
+
+        jobId = await dispatch_or_background (
+            background_tasks,
+            LOW_PRIORITY_QUEUE,
+            "user.admin.import",
             userId,
-            fileContent,
-            filename,
+            path,
+            file.filename,
+            meta={"userId": userId},
         )
-        return i18n.t ("_v1_user.import.started.message")
+        return i18n.t ("_v1_user.import.started.message"), jobId
 
     @staticmethod
-    async def export_users (background_tasks: BackgroundTasks, userId: str, export_type: str) -> str:
+    async def export_users (background_tasks: BackgroundTasks, userId: str, export_type: str) -> Tuple[str, Optional[str]]:
         """
         Args:
+            background_tasks (BackgroundTasks)
             userId (str)
             export_type (str)
         Returns:
-            str
+            Tuple[str, Optional[str]]
         """
         i18n = AppI18n.i18n ()
-        background_tasks.add_task (
-            UserAdminExportProcessor.run,
+        jobId = await dispatch_or_background (
+            background_tasks,
+            LOW_PRIORITY_QUEUE,
+            "user.admin.export",
             userId,
             export_type,
+            meta={"userId": userId},
+        )
+        return i18n.t ("_v1_user.export.started.message"), jobId
+
+    @staticmethod
+    async def job (userId: str, jobId: str) -> JobPayloadType:
+        """
+        Args:
+            userId (str)
+            jobId (str)
+        Returns:
+            JobPayloadType
+        """
+        i18n = AppI18n.i18n ()
+        job = await asyncio.to_thread (AppQueue.getJob, jobId)
+        meta = (job.meta or {}) if job else {}
+        # Another admin's job answers like a missing one, so job ids cannot be probed.
+        if job is None or meta.get ("userId") != userId:
+            raise HTTPException (status_code=status.HTTP_404_NOT_FOUND, detail=i18n.t ("_v1_user.admin.job_not_found"))
+
+        jobStatus = await asyncio.to_thread (job.get_status)
+        return JobPayloadType (
+            id=jobId,
+            status=str (getattr (jobStatus, "value", jobStatus)),
+            progress=meta.get ("progress"),
         )
-        return i18n.t ("_v1_user.export.started.message")
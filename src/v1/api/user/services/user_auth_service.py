@@ -1,12 +1,16 @@
+import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import HTTPException, Request, status
+from fastapi import BackgroundTasks, HTTPException, Request, status
 from src.app.bases.app_auth import AppAuth
+from src.app.bases.app_auth_token import AppAuthToken
 from src.app.bases.app_cache import AppCache
 from src.app.bases.app_context import AppContext
 from src.app.bases.app_event import getEventEmitter
 from src.app.bases.app_i18n import AppI18n
+from src.app.bases.app_password_hasher import AppPasswordHasher
+from src.app.bases.app_response_cache import AppResponseCache
 from src.app.configs.auth_config import AuthConfig
 from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.user.dtos.user_transformer_dto import UserAuthTransformerDto, UserTransformerDto
@@ -17,6 +21,9 @@ from src.v1.api.user.events.user.auth.refreshed.event import UserAuthRefreshedEv
 from src.v1.api.user.events.user.auth.registered.event import UserAuthRegisteredEvent
 from src.v1.api.user.events.user.auth.reset.event import UserAuthResetEvent
 from src.v1.api.user.repositories.user_auth_repository import UserAuthRepository
+from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+logger = logging.getLogger (__name__)
 
 class UserAuthService:
     """
@@ -46,20 +53,18 @@ class UserAuthService:
         """
         if not token:
             return None
-        isBlacklisted = await AppAuth.isTokenBlacklisted (token)
-        if isBlacklisted:
-            return None
-        payload = AppAuth.decodeToken (token)
+        payload = await AppAuthToken.verify (token)
         if not payload:
             return None
         userId = payload.get ("sub")
         return userId
 
     @staticmethod
-    async def login (dto: UserAuthDto) -> UserAuthTransformerDto:
+    async def login (dto: UserAuthDto, background_tasks: Optional[BackgroundTasks] = None) -> UserAuthTransformerDto:
         """
         Args:
             dto (UserAuthDto)
+            background_tasks (Optional[BackgroundTasks])
         Returns:
             UserAuthTransformerDto
         """
@@ -70,11 +75,16 @@ class UserAuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=i18n.t ("_v1_user.auth.invalid_credentials"),
             )
-        if not AppAuth.verifyPassword (dto.password, user.password):
+        if not await AppPasswordHasher.verify (dto.password, user.password):
             raise HTTPException (
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=i18n.t ("_v1_user.auth.invalid_credentials"),
             )
+        # An upgrade costs a second full hash, so it runs once the tokens are on their way.
+        if background_tasks is not None:
+            background_tasks.add_task (UserAuthService.rehash, user, dto.password)
+        else:
+            await UserAuthService.rehash (user, dto.password)
         authConfig = AuthConfig.config ()
         remember = AppAuth.resolveRemember (dto.remember)
         accessToken = AppAuth.createAccessToken ({"sub": user.id, "email": user.email})
@@ -102,6 +112,23 @@ class UserAuthService:
             refreshToken=refreshToken,
         )
 
+    @staticmethod
+    async def rehash (user: User, password: str) -> None:
+        """
+        Args:
+            user (User)
+            password (str)
+        Returns:
+            None
+        """
+        if not AppAuth.needsRehash (user.password):
+            return
+        # The plain password is only known at login, an upgrade that fails here is retried on the next one.
+        try:
+            await UserAuthRepository.rehash (user.id, user.password, await AppPasswordHasher.hash (password))
+        except Exception as e:
+            logger.warning (f"Password rehash skipped for user {user.id}: {e}")
+
     @staticmethod
     async def register (dto: UserCreateValidatorDto) -> UserTransformerDto:
         """
@@ -117,7 +144,7 @@ class UserAuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=i18n.t ("_v1_user.auth.email_already_exists"),
             )
-        hashedPassword = AppAuth.hashPassword (dto.password)
+        hashedPassword = await AppPasswordHasher.hash (dto.password)
         user = User (
             name=dto.name,
             email=dto.email,
@@ -158,13 +185,7 @@ class UserAuthService:
         """
         i18n = AppI18n.i18n ()
         try:
-            isBlacklisted = await AppAuth.isTokenBlacklisted (refreshToken)
-            if isBlacklisted:
-                raise HTTPException (
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=i18n.t ("_v1_user.auth.invalid_token"),
-                )
-            payload = AppAuth.verifyToken (refreshToken, "refresh")
+            payload = await AppAuthToken.verify (refreshToken, "refresh")
             if not payload:
                 raise HTTPException (
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -189,7 +210,7 @@ class UserAuthService:
                 {"sub": str (user.id), "email": user.email},
                 remember=remember,
             )
-            await AppAuth.blacklistToken (refreshToken)
+            await AppAuthToken.revoke (refreshToken)
             accessTokenTtl = authConfig.jwt_access_token_expire_minutes * 60
             refreshTokenTtl = AppAuth.refreshTokenExpireDays (remember) * 24 * 60 * 60
             eventEmitter = getEventEmitter ()
@@ -234,7 +255,7 @@ class UserAuthService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=i18n.t ("_v1_user.auth.user_not_found"),
             )
-        await AppAuth.blacklistToken (token)
+        await AppAuthToken.revoke (token)
         eventEmitter = getEventEmitter ()
         event = UserAuthLoggedOutEvent (
             id=user.id,
@@ -265,6 +286,31 @@ class UserAuthService:
             )
         return UserTransformerDto.fromUser (user)
 
+    @staticmethod
+    async def meCached (userId: str) -> UserTransformerDto:
+        """
+        Args:
+            userId (str)
+        Returns:
+            UserTransformerDto
+        """
+        async def produce () -> str:
+            """
+            Returns:
+                str
+            """
+            return AppResponseCache.encode (await UserAuthService.me (userId))
+
+        body = await AppResponseCache.remember (
+            "v1.user.auth.me",
+            userId,
+            "me",
+            [f"user:{userId}"],
+            AppResponseCache.config ().response_cache_ttl,
+            produce,
+        )
+        return UserTransformerDto.model_validate_json (body)
+
     @staticmethod
     async def verify (userEmail: str, token: Optional[str] = None) -> UserTransformerDto:
         """
@@ -300,6 +346,8 @@ class UserAuthService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=i18n.t ("_v1_user.auth.user_not_found"),
             )
+        await UserPrincipalRepository.forget (user.id)
+        await AppResponseCache.invalidate (f"user:{user.id}")
         return UserTransformerDto.fromUser (user)
 
     @staticmethod
@@ -356,6 +404,7 @@ class UserAuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=i18n.t ("_v1_user.auth.invalid_or_expired_reset_token"),
             )
+        await AppResponseCache.invalidate (f"user:{user.id}")
         return UserTransformerDto.fromUser (user)
 
     @staticmethod
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import HTTPException, UploadFile, status
+from src.app.bases.app_event import getEventEmitter
 from src.app.bases.app_i18n import AppI18n
 from src.app.configs.app_config import AppConfig
 from src.app.utils.app_avatar_storage import saveAvatar
@@ -8,6 +9,7 @@ from src.v1.api.user.dtos.user_transformer_dto import (
     UserMeTransformerDto,
 )
 from src.v1.api.user.dtos.user_validator_dto import UserMeUpdateValidatorDto
+from src.v1.api.user.events.user.profile.updated.event import UserProfileUpdatedEvent
 from src.v1.api.user.repositories.user_acl_repository import UserAclRepository
 from src.v1.api.user.repositories.user_profile_repository import UserProfileRepository
 
@@ -64,7 +66,7 @@ class UserProfileService:
         }
 
         avatarPath = await saveAvatar (avatar) if avatar is not None else None
-        userData = UserProfileRepository.hashPasswordIfPresent (userData)
+        userData = await UserProfileRepository.hashPasswordIfPresent (userData)
         user, profile = await UserProfileRepository.updateMe (
             userId,
             userData,
@@ -77,6 +79,17 @@ class UserProfileService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=i18n.t ("_v1_user.auth.user_not_found"),
             )
+        eventEmitter = getEventEmitter ()
+        event = UserProfileUpdatedEvent (
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            email_verified_at=user.email_verified_at,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            deleted_at=user.deleted_at
+        )
+        await eventEmitter.emit ("v1.user.profile.updated", event)
         appConfig = AppConfig.config ()
         return UserMeTransformerDto.fromUser (user, profile, getattr (appConfig, "app_url", ""))
 
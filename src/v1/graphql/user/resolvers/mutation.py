@@ -25,7 +25,7 @@ class UserMutation:
             identifierValue=inputs.identifierValue,
             password=inputs.password
         )
-        result = await UserAuthService.login (dto)
+        result = await UserAuthService.login (dto, info.context.get ("background_tasks"))
         return UserAuthTransformerDto (
             accessTokenTtl=float (result.accessTokenTtl) if result.accessTokenTtl else None,
             refreshTokenTtl=float (result.refreshTokenTtl) if result.refreshTokenTtl else None,
@@ -22,7 +22,7 @@ class UserQuery:
         if not user:
             return None
         try:
-            result = await UserAuthService.me (user.id)
+            result = await UserAuthService.meCached (user.id)
             return UserTransformerDto.fromModel (result) if result else None
         except Exception:
             return None
@@ -45,14 +45,13 @@ async def client (test_db: Session) -> AsyncGenerator[AsyncClient, None]:
         AsyncGenerator[AsyncClient, None]
     """
     from main import app, lifespan
-    from unittest.mock import AsyncMock, patch
+    from unittest.mock import patch
+    from src.app.bases.app_rate_limiter import AppRateLimitDecision
 
-    with patch ('fastapi_limiter.FastAPILimiter.redis', new=AsyncMock ()):
-        with patch ('fastapi_limiter.FastAPILimiter.identifier', new=AsyncMock ()):
-            with patch ('fastapi_limiter.FastAPILimiter.http_callback', new=AsyncMock ()):
-                async with lifespan (app):
-                    async with AsyncClient (transport=ASGITransport (app=app), base_url="http://test") as ac:
-                        yield ac
+    with patch ('src.app.bases.app_rate_limiter.AppRateLimiter.hit', return_value=AppRateLimitDecision (True, 1, 1, 0.0, 0.0, 60)):
+        async with lifespan (app):
+            async with AsyncClient (transport=ASGITransport (app=app), base_url="http://test") as ac:
+                yield ac
 
 @pytest.fixture (scope="function")
 def test_user (test_db: Session) -> Dict:
@@ -113,6 +112,79 @@ def auth_token (test_user: Dict) -> str:
     """
     return AppAuth.createAccessToken ({"sub": test_user["id"]})
 
+@pytest.fixture (scope="function")
+def test_admin (test_db: Session, test_user: Dict) -> Generator[Dict, None, None]:
+    """
+    Args:
+        test_db (Session)
+        test_user (Dict)
+    Returns:
+        Generator[Dict, None, None]
+    """
+    from src.v1.api.user.databases.models.acl_model import ModelHasRole
+    from src.v1.api.user.databases.seeders.user_acl_seeder import USER_MODEL_TYPE, UserAclSeeder
+    from src.v1.api.user.repositories.user_acl_repository import UserAclRepository
+
+    permissionMap = UserAclSeeder._seedPermissions (test_db)
+    roleMap = UserAclSeeder._seedRoles (test_db)
+    UserAclSeeder._seedRolePermissions (test_db, permissionMap, roleMap)
+
+    role = roleMap["admin"]
+    statement = select (ModelHasRole).where (
+        ModelHasRole.role_id == role.id,
+        ModelHasRole.model_type == USER_MODEL_TYPE,
+        ModelHasRole.model_id == test_user["id"],
+    )
+    if test_db.exec (statement).first () is None:
+        test_db.add (ModelHasRole (role_id=role.id, model_type=USER_MODEL_TYPE, model_id=test_user["id"]))
+    test_db.commit ()
+    UserAclRepository.invalidateSync ()
+
+    yield test_user
+
+    for assignment in test_db.exec (statement).all ():
+        test_db.delete (assignment)
+    test_db.commit ()
+    UserAclRepository.invalidateSync ()
+
+@pytest.fixture (scope="function")
+def other_admin_token (test_db: Session, test_admin: Dict) -> Generator[str, None, None]:
+    """
+    Args:
+        test_db (Session)
+        test_admin (Dict)
+    Returns:
+        Generator[str, None, None]
+    """
+    from ulid import ULID
+    from src.v1.api.user.databases.models.acl_model import ModelHasRole, Role
+    from src.v1.api.user.databases.seeders.user_acl_seeder import USER_MODEL_TYPE
+
+    user_id = str (ULID ())
+    test_db.add (User (
+        id=user_id,
+        name=f"test-admin-{user_id}",
+        email=f"admin-{user_id.lower ()}@mail.com",
+        password=AppAuth.hashPassword ("12345678"),
+        email_verified_at=datetime.utcnow (),
+        created_at=datetime.utcnow (),
+        updated_at=datetime.utcnow ()
+    ))
+    test_db.commit ()
+    role = test_db.exec (select (Role).where (Role.name == "admin")).first ()
+    test_db.add (ModelHasRole (role_id=role.id, model_type=USER_MODEL_TYPE, model_id=user_id))
+    test_db.commit ()
+
+    yield AppAuth.createAccessToken ({"sub": user_id})
+
+    for assignment in test_db.exec (select (ModelHasRole).where (ModelHasRole.model_id == user_id)).all ():
+        test_db.delete (assignment)
+    test_db.commit ()
+    user = test_db.exec (select (User).where (User.id == user_id)).first ()
+    if user:
+        test_db.delete (user)
+        test_db.commit ()
+
 @pytest.fixture (scope="function", autouse=True)
 def cleanup_test_data (test_db: Session, test_user: Dict) -> None:
     """
@@ -80,3 +80,25 @@ def create_notification (test_db: Session, notification_id: str, user_id: str, n
     )
     test_db.add (notification)
     test_db.commit ()
+
+def forget_notification_cache (user_id: str) -> None:
+    """
+    Args:
+        user_id (str)
+    Returns:
+        None
+    """
+    import redis
+    from src.app.bases.app_response_cache import AppResponseCache
+    from src.app.configs.cache_config import CacheConfig
+    from src.app.utils.app_count_cache import COUNT_KEY_PREFIX
+    from src.v1.api.notification.repositories.notification_unread_repository import NotificationUnreadRepository
+
+    client = redis.Redis.from_url (CacheConfig.config ().redis_uri ())
+    try:
+        client.delete (NotificationUnreadRepository.key (user_id))
+        client.incr (AppResponseCache.tagKey (f"notifications:{user_id}"))
+        for key in client.scan_iter (f"{COUNT_KEY_PREFIX}:notifications:*"):
+            client.delete (key)
+    finally:
+        client.close ()
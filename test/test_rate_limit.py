@@ -0,0 +1,115 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.app.bases.app_rate_limiter import AppRateLimitBucket, AppRateLimiter, AppRateLimitMiddleware
+
+class TestRateLimit:
+    """Rate limiter tests"""
+
+    @pytest.mark.parametrize ("algorithm", ["gcra", "sliding"])
+    def test_bucket_admits_up_to_limit (self, algorithm: str) -> None:
+        """
+        Test AppRateLimitBucket.hitGcra and AppRateLimitBucket.hitSliding
+
+        Should admit the limit within one period, then deny with a Retry-After
+        """
+        bucket = AppRateLimitBucket ("test", 5, 60, algorithm)
+        now = 6000.0
+
+        decisions = [bucket.hit (now) for _ in range (5)]
+        assert all (decision.allowed for decision in decisions)
+        assert [decision.remaining for decision in decisions] == [4, 3, 2, 1, 0]
+
+        denied = bucket.hit (now)
+        assert not denied.allowed
+        assert denied.remaining == 0
+        assert denied.retryAfter > 0
+        assert int (denied.headers ()["Retry-After"]) >= 1
+
+    def test_bucket_gcra_readmits_after_interval (self) -> None:
+        """
+        Test AppRateLimitBucket.hitGcra
+
+        Should admit again once one emission interval has passed
+        """
+        bucket = AppRateLimitBucket ("test", 5, 60, "gcra")
+        now = 6000.0
+        for _ in range (5):
+            bucket.hitGcra (now)
+
+        denied = bucket.hitGcra (now)
+        assert not denied.allowed
+        assert denied.retryAfter == pytest.approx (12.0)
+        assert bucket.hitGcra (now + denied.retryAfter).allowed
+
+    def test_bucket_sliding_weighs_previous_window (self) -> None:
+        """
+        Test AppRateLimitBucket.hitSliding
+
+        Should keep denying early in the next window while the previous one still overlaps
+        """
+        bucket = AppRateLimitBucket ("test", 5, 60, "sliding")
+        now = 6000.0
+        for _ in range (5):
+            bucket.hitSliding (now)
+
+        denied = bucket.hitSliding (now + 60)
+        assert not denied.allowed
+        assert denied.retryAfter > 0
+        assert bucket.hitSliding (now + 60 + denied.retryAfter).allowed
+
+    def test_limiter_prunes_idle_buckets (self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test AppRateLimiter.hit without Redis
+
+        Should drop buckets idle for two periods instead of keeping every key forever
+        """
+        monkeypatch.setattr (AppRateLimiter, "_buckets", {})
+        monkeypatch.setattr (AppRateLimiter, "_dirty", {})
+        monkeypatch.setattr (AppRateLimiter, "_syncer", None)
+        monkeypatch.setattr (AppRateLimiter, "_prunedAt", 0.0)
+        clock = [6000.0]
+        monkeypatch.setattr ("src.app.bases.app_rate_limiter.time.time", lambda: clock[0])
+
+        AppRateLimiter.hit ("idle", 5, 1)
+        assert len (AppRateLimiter._buckets) == 1
+        assert AppRateLimiter._dirty == {}
+
+        clock[0] += 3
+        AppRateLimiter.hit ("active", 5, 1)
+        assert [bucket.key for bucket in AppRateLimiter._buckets.values ()] == ["gcra:5:1:active"]
+
+    @pytest.mark.asyncio
+    async def test_response_headers (self) -> None:
+        """
+        Test AppRateLimitMiddleware
+
+        Should add the RateLimit-* headers of the tightest limit to the response
+        """
+        async def endpoint (request: Request) -> JSONResponse:
+            """
+            Args:
+                request (Request)
+            Returns:
+                JSONResponse
+            """
+            bucket = AppRateLimitBucket ("test", 2, 60, "gcra")
+            AppRateLimiter.remember (AppRateLimitBucket ("loose", 10, 60, "gcra").hit (6000.0))
+            AppRateLimiter.remember (bucket.hit (6000.0))
+            AppRateLimiter.remember (bucket.hit (6000.0))
+            return JSONResponse ({"data": "ok"})
+
+        app = AppRateLimitMiddleware (Starlette (routes=[Route ("/", endpoint)]))
+        async with AsyncClient (transport=ASGITransport (app=app), base_url="http://test") as ac:
+            response = await ac.get ("/")
+
+        assert response.status_code == 200
+        assert response.headers["ratelimit-limit"] == "2"
+        assert response.headers["ratelimit-remaining"] == "0"
+        assert response.headers["ratelimit-policy"] == "2;w=60"
+        assert int (response.headers["ratelimit-reset"]) >= 1
+        assert "retry-after" not in response.headers
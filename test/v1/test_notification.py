@@ -5,7 +5,7 @@ from datetime import datetime
 
 from src.v1.api.user.databases.models.user_model import User
 from src.v1.api.notification.databases.models.notification_model import Notification
-from test.helpers import update_user_verification, create_notification
+from test.helpers import update_user_verification, create_notification, forget_notification_cache
 
 @pytest.fixture (scope="function")
 def test_notification (
@@ -37,6 +37,8 @@ def test_notification (
     )
     test_db.add (notification)
     test_db.commit ()
+    # Rows written straight to the database bypass the cached counter and responses, so both are rebuilt on the next read.
+    forget_notification_cache (test_user["id"])
 
     return notification_id
 
@@ -74,6 +76,87 @@ class TestNotification:
         assert "currentPage" in data
         assert isinstance (data["data"], list)
 
+    @pytest.mark.asyncio
+    async def test_user_notifications_index_count_none_get (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_user: dict,
+        test_db: Session
+    ) -> None:
+        """
+        Test GET /api/v1/notifications endpoint with countStrategy=none
+
+        Should tell whether a next page exists from one extra row instead of a total
+        """
+        from ulid import ULID
+
+        for _ in range (2):
+            create_notification (test_db, str (ULID ()), test_user["id"], "test", {"message": "Count strategy"})
+        forget_notification_cache (test_user["id"])
+
+        response = await client.get (
+            "/api/v1/notifications/",
+            params={"limitPage": 1, "countStrategy": "exact"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        total = response.json ()["totalPage"]
+        assert total >= 2
+
+        response = await client.get (
+            "/api/v1/notifications/",
+            params={"limitPage": 1, "countStrategy": "none"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        data = response.json ()
+        assert data["countStrategy"] == "none"
+        assert len (data["data"]) == 1
+        assert data["nextPage"] == 2
+
+        response = await client.get (
+            "/api/v1/notifications/",
+            params={"limitPage": 1, "currentPage": total, "countStrategy": "none"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        data = response.json ()
+        assert len (data["data"]) == 1
+        assert data["nextPage"] is None
+
+    @pytest.mark.asyncio
+    async def test_user_notifications_index_count_cached_get (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_user: dict,
+        test_db: Session
+    ) -> None:
+        """
+        Test GET /api/v1/notifications endpoint with countStrategy=cached
+
+        Should report the same total as an exact count
+        """
+        from ulid import ULID
+
+        create_notification (test_db, str (ULID ()), test_user["id"], "test", {"message": "Count strategy"})
+        forget_notification_cache (test_user["id"])
+
+        totals = {}
+        for strategy in ("exact", "cached", "cached"):
+            response = await client.get (
+                "/api/v1/notifications/",
+                params={"limitPage": 1, "countStrategy": strategy},
+                headers={"Authorization": f"Bearer {auth_token}"}
+            )
+            assert response.status_code == 200
+            data = response.json ()
+            assert data["countStrategy"] == strategy
+            totals.setdefault (strategy, []).append (data["totalPage"])
+
+        assert totals["cached"] == totals["exact"] * 2
+
     @pytest.mark.asyncio
     async def test_user_notifications_count_get (
         self,
@@ -96,6 +179,100 @@ class TestNotification:
         assert "count" in data
         assert isinstance (data["count"], int)
 
+    @pytest.mark.asyncio
+    async def test_user_notifications_cursor_get (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_notification: str
+    ) -> None:
+        """
+        Test GET /api/v1/notifications/cursor endpoint
+
+        Should return a keyset page with opaque cursors
+        """
+        response = await client.get (
+            "/api/v1/notifications/cursor",
+            params={"orders": "created_at:desc", "limitPage": 1},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+
+        data = response.json ()
+        assert isinstance (data["data"], list)
+        assert "nextCursorPage" in data
+        assert data["previousCursorPage"] is None
+
+    @pytest.mark.asyncio
+    async def test_user_notifications_cursor_walk_get (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_user: dict,
+        test_db: Session
+    ) -> None:
+        """
+        Test GET /api/v1/notifications/cursor endpoint across pages
+
+        Should visit every row once forward and again backward, without gaps or duplicates
+        """
+        from ulid import ULID
+
+        notification_ids = [str (ULID ()) for _ in range (3)]
+        for notification_id in notification_ids:
+            create_notification (test_db, notification_id, test_user["id"], "test", {"message": "Cursor walk"})
+        forget_notification_cache (test_user["id"])
+
+        forward = []
+        params = {"orders": "created_at:desc", "limitPage": 1}
+        while True:
+            response = await client.get (
+                "/api/v1/notifications/cursor",
+                params=params,
+                headers={"Authorization": f"Bearer {auth_token}"}
+            )
+            assert response.status_code == 200
+            data = response.json ()
+            forward += [item["id"] for item in data["data"]]
+            if not data["nextCursorPage"]:
+                break
+            params = {"orders": "created_at:desc", "limitPage": 1, "cursorPage": data["nextCursorPage"]}
+
+        assert forward == list (reversed (notification_ids))
+
+        backward = []
+        while data["previousCursorPage"]:
+            response = await client.get (
+                "/api/v1/notifications/cursor",
+                params={"orders": "created_at:desc", "limitPage": 1, "cursorPage": data["previousCursorPage"], "direction": "previous"},
+                headers={"Authorization": f"Bearer {auth_token}"}
+            )
+            assert response.status_code == 200
+            data = response.json ()
+            backward = [item["id"] for item in data["data"]] + backward
+
+        assert backward == forward[:-1]
+
+    @pytest.mark.asyncio
+    async def test_user_notifications_cursor_invalid_get (
+        self,
+        client: AsyncClient,
+        auth_token: str
+    ) -> None:
+        """
+        Test GET /api/v1/notifications/cursor endpoint with a malformed cursor
+
+        Should return 400 instead of an empty page
+        """
+        response = await client.get (
+            "/api/v1/notifications/cursor",
+            params={"orders": "created_at:desc", "cursorPage": "not-a-cursor"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_user_notifications_read_all_put (
         self,
@@ -118,6 +295,41 @@ class TestNotification:
         assert "count" in data
         assert isinstance (data["count"], int)
 
+    @pytest.mark.asyncio
+    async def test_user_notifications_bulk_read_put (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_notification: str
+    ) -> None:
+        """
+        Test PUT /api/v1/notifications/bulk/read endpoint
+
+        Should mark the selected notifications as read
+        """
+        unread_response = await client.get (
+            "/api/v1/notifications/unread",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        unread_before = unread_response.json ()["unread"]
+
+        response = await client.put (
+            "/api/v1/notifications/bulk/read",
+            json={"ids": [test_notification]},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+
+        data = response.json ()
+        assert data["count"] == 1
+
+        unread_response = await client.get (
+            "/api/v1/notifications/unread",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert unread_response.json ()["unread"] == unread_before - 1
+
     @pytest.mark.asyncio
     async def test_user_notifications_read_put (
         self,
@@ -225,6 +437,7 @@ class TestNotification:
 
         return new_notification_id
 
+@pytest.mark.usefixtures ("test_admin")
 class TestNotificationAdmin:
     """Notification admin tests"""
 
@@ -325,3 +538,31 @@ class TestNotificationAdmin:
 
         data = response.json ()
         assert data["deleted_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_admin_notifications_broadcast_post (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        test_user: dict
+    ) -> None:
+        """
+        Test POST /api/v1/admin/notifications/broadcast endpoint
+
+        Should accept the broadcast and return its job
+        """
+        response = await client.post (
+            "/api/v1/admin/notifications/broadcast",
+            json={
+                "type": "announcement",
+                "data": {"title": "Test", "body": "Broadcast notification"},
+                "user_ids": [test_user["id"]]
+            },
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+
+        data = response.json ()
+        assert "id" in data
+        assert data["status"] == "queued"
@@ -60,6 +60,65 @@ class TestUserAuth:
         assert "accessTokenTtl" in data
         assert "refreshTokenTtl" in data
 
+    @pytest.mark.asyncio
+    async def test_auth_login_post_rehash (self, client: AsyncClient, test_user: dict, test_db: Session) -> None:
+        """
+        Test POST /api/v1/auth/login endpoint with an outdated hash
+
+        Should upgrade the stored hash to the configured parameters
+        """
+        from src.app.helpers.password_helper import passwordHasher
+
+        update_user_password (test_db, test_user["id"], passwordHasher ("bcrypt", {"rounds": 4}).hash (test_user["password"]))
+
+        response = await client.post (
+            "/api/v1/auth/login",
+            json={
+                "identifierKey": "email",
+                "identifierValue": test_user["email"],
+                "password": test_user["password"]
+            }
+        )
+
+        assert response.status_code == 201
+
+        test_db.expire_all ()
+        user = test_db.exec (select (User).where (User.id == test_user["id"])).first ()
+        assert not AppAuth.needsRehash (user.password)
+        assert AppAuth.verifyPassword (test_user["password"], user.password)
+
+    @pytest.mark.asyncio
+    async def test_auth_login_post_burst (self, client: AsyncClient, test_user: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test POST /api/v1/auth/login endpoint under a burst
+
+        Should authenticate what one hashing slot admits and shed the rest with 503
+        """
+        import asyncio
+        from src.app.configs.auth_config import AuthConfig
+
+        monkeypatch.setattr (AuthConfig.config (), "auth_hash_workers", 1)
+        monkeypatch.setattr (AuthConfig.config (), "auth_hash_queue_limit", 0)
+
+        responses = await asyncio.gather (*[
+            client.post (
+                "/api/v1/auth/login",
+                json={
+                    "identifierKey": "email",
+                    "identifierValue": test_user["email"],
+                    "password": test_user["password"]
+                }
+            )
+            for _ in range (8)
+        ])
+
+        assert all (response.status_code in [201, 503] for response in responses)
+        assert any (response.status_code == 201 for response in responses)
+        shed = [response for response in responses if response.status_code == 503]
+        assert shed
+        for response in shed:
+            assert response.headers["retry-after"] == "1"
+
     @pytest.mark.asyncio
     async def test_auth_logout_post (self, client: AsyncClient, test_user: dict) -> None:
         """
@@ -137,6 +196,46 @@ class TestUserAuth:
         assert "email" in data
         assert "name" in data
 
+    @pytest.mark.asyncio
+    async def test_auth_me_get_forged_token (self, client: AsyncClient, auth_token: str) -> None:
+        """
+        Test GET /api/v1/auth/me endpoint with a re-signed token
+
+        Should reject a token whose signature does not match
+        """
+        from jose import jwt
+
+        forged = jwt.encode (jwt.get_unverified_claims (auth_token), "not-the-secret", algorithm="HS256")
+
+        response = await client.get (
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {forged}"}
+        )
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_auth_me_get_not_modified (self, client: AsyncClient, auth_token: str) -> None:
+        """
+        Test GET /api/v1/auth/me endpoint with If-None-Match
+
+        Should return 304 when the ETag still matches
+        """
+        response = await client.get (
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+        response = await client.get (
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {auth_token}", "If-None-Match": response.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+
     @pytest.mark.asyncio
     async def test_auth_forgot_password_post (self, client: AsyncClient, test_user: dict) -> None:
         """
@@ -252,6 +351,134 @@ class TestUserAuth:
         assert isinstance (result, str)
         assert len (result) > 0
 
+class TestRealtimeHandshake:
+    """Socket.IO handshake tests"""
+
+    @staticmethod
+    def connectHandler (monkeypatch: pytest.MonkeyPatch):
+        """
+        Args:
+            monkeypatch (pytest.MonkeyPatch)
+        Returns:
+            Callable
+        """
+        from src.app.routes.app_ws_router import getSocketIOServer
+
+        server = getSocketIOServer ()
+
+        async def noop (*args, **kwargs) -> None:
+            """
+            Returns:
+                None
+            """
+            return None
+
+        # The handshakes under test have no Engine.IO session behind them, so the session and room writes are skipped.
+        monkeypatch.setattr (server, "save_session", noop)
+        monkeypatch.setattr (server, "enter_room", noop)
+        return server.handlers["/"]["connect"]
+
+    @pytest.mark.asyncio
+    async def test_handshake_over_capacity (self, client: AsyncClient, auth_token: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test Socket.IO connect over the concurrent handshake cap
+
+        Should refuse with a retry hint before touching the token, and leave the in-flight count alone
+        """
+        import socketio
+        from src.app.bases.app_realtime_handshake import AppRealtimeHandshake
+        from src.app.configs.auth_config import AuthConfig
+
+        connect = self.connectHandler (monkeypatch)
+        monkeypatch.setattr (AuthConfig.config (), "auth_ws_handshake_limit", 1)
+        monkeypatch.setattr (AppRealtimeHandshake, "_inFlight", 1)
+        throttled = AppRealtimeHandshake._throttled
+
+        with pytest.raises (socketio.exceptions.ConnectionRefusedError) as error:
+            await connect ("sid-over-capacity", {}, {"token": auth_token})
+
+        assert error.value.error_args["data"] == {"retryAfter": 1}
+        assert AppRealtimeHandshake._inFlight == 1
+        assert AppRealtimeHandshake._throttled == throttled + 1
+
+    @pytest.mark.asyncio
+    async def test_handshake_releases_slot (self, client: AsyncClient, auth_token: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test Socket.IO connect outcomes
+
+        Should release the handshake slot and record the outcome whether accepted, denied or failed
+        """
+        from src.app.bases.app_realtime_handshake import AppRealtimeHandshake
+
+        connect = self.connectHandler (monkeypatch)
+        inFlight = AppRealtimeHandshake._inFlight
+        counts = {outcome: metric["count"] for outcome, metric in AppRealtimeHandshake._metrics.items ()}
+
+        assert await connect ("sid-accepted", {}, {"token": auth_token}) is True
+        assert AppRealtimeHandshake._inFlight == inFlight
+
+        assert await connect ("sid-denied", {}, {"token": "invalid"}) is False
+        assert AppRealtimeHandshake._inFlight == inFlight
+
+        async def fail (environ: dict, auth: dict) -> None:
+            """
+            Returns:
+                None
+            """
+            raise RuntimeError ("principal lookup failed")
+
+        monkeypatch.setattr ("src.app.routes.app_ws_router.authenticateHandshake", fail)
+        with pytest.raises (RuntimeError):
+            await connect ("sid-failed", {}, {"token": auth_token})
+        assert AppRealtimeHandshake._inFlight == inFlight
+
+        for outcome in ("accepted", "denied", "failed"):
+            assert AppRealtimeHandshake._metrics[outcome]["count"] == counts[outcome] + 1
+
+    @pytest.mark.asyncio
+    async def test_handshake_token (self, client: AsyncClient, test_user: dict, auth_token: str) -> None:
+        """
+        Test Socket.IO handshake authentication
+
+        Should accept a valid access token from auth or the query string, and reject a missing, invalid or revoked one
+        """
+        from src.app.bases.app_auth_token import AppAuthToken
+        from src.app.routes.app_ws_router import authenticateHandshake
+
+        assert await authenticateHandshake ({}, {"token": auth_token}) == test_user["id"]
+        assert await authenticateHandshake ({"QUERY_STRING": f"token={auth_token}"}, None) == test_user["id"]
+        assert await authenticateHandshake ({}, None) is None
+        assert await authenticateHandshake ({}, {"token": "invalid"}) is None
+
+        refresh_token = AppAuth.createRefreshToken ({"sub": test_user["id"]})
+        assert await authenticateHandshake ({}, {"token": refresh_token}) is None
+
+        await AppAuthToken.revoke (auth_token)
+        assert await authenticateHandshake ({}, {"token": auth_token}) is None
+
+    @pytest.mark.asyncio
+    async def test_handshake_unverified_principal (self, client: AsyncClient, test_db: Session, test_user: dict, auth_token: str) -> None:
+        """
+        Test Socket.IO handshake authentication for an unverified user
+
+        Should reject a valid token once the principal is no longer verified
+        """
+        from src.app.routes.app_ws_router import authenticateHandshake
+        from src.v1.api.user.repositories.user_principal_repository import UserPrincipalRepository
+
+        user = test_db.exec (select (User).where (User.id == test_user["id"])).first ()
+        user.email_verified_at = None
+        test_db.add (user)
+        test_db.commit ()
+        await UserPrincipalRepository.forget (test_user["id"])
+
+        try:
+            assert await authenticateHandshake ({}, {"token": auth_token}) is None
+        finally:
+            update_user_verification (test_db, test_user["id"])
+            await UserPrincipalRepository.forget (test_user["id"])
+
+@pytest.mark.usefixtures ("test_admin")
 class TestUserAdmin:
     """User admin tests"""
 
@@ -275,6 +502,47 @@ class TestUserAdmin:
         assert "currentPage" in data
         assert isinstance (data["data"], list)
 
+    @pytest.mark.asyncio
+    async def test_admin_users_index_filter_get (self, client: AsyncClient, auth_token: str, test_user: dict) -> None:
+        """
+        Test GET /api/v1/admin/users endpoint with filters
+
+        Should apply whitelisted filters and ignore unknown fields and raw order expressions
+        """
+        response = await client.get (
+            "/api/v1/admin/users/",
+            params={"filters": f"email:eq:{test_user['email']}", "orders": "created_at:desc"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        assert [user["id"] for user in response.json ()["data"]] == [test_user["id"]]
+
+        response = await client.get (
+            "/api/v1/admin/users/",
+            params={"filters": "email:prefix:%", "orders": "password:asc,created_at desc:asc"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.json ()["data"] == []
+
+    @pytest.mark.asyncio
+    async def test_admin_users_index_search_get (self, client: AsyncClient, auth_token: str, test_user: dict) -> None:
+        """
+        Test GET /api/v1/admin/users endpoint with search
+
+        Should return users ranked by name and email relevance
+        """
+        response = await client.get (
+            "/api/v1/admin/users/",
+            params={"search": test_user["email"].split ("@")[0]},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        assert test_user["id"] in [user["id"] for user in response.json ()["data"]]
+
     @pytest.mark.asyncio
     async def test_admin_users_show_get (
         self,
@@ -495,6 +763,94 @@ Test User 2,import2@test.com,password123"""
         assert isinstance (result, str)
         assert len (result) > 0
 
+    @pytest.mark.asyncio
+    async def test_admin_users_job_get (
+        self,
+        client: AsyncClient,
+        auth_token: str
+    ) -> None:
+        """
+        Test GET /api/v1/admin/users/jobs/{jobId} endpoint
+
+        Should return 404 for an unknown job
+        """
+        response = await client.get (
+            "/api/v1/admin/users/jobs/unknown-job-id",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_admin_users_job_get_other_admin (
+        self,
+        client: AsyncClient,
+        auth_token: str,
+        other_admin_token: str
+    ) -> None:
+        """
+        Test GET /api/v1/admin/users/jobs/{jobId} endpoint as another admin
+
+        Should return the job to its owner and 404 to anyone else
+        """
+        export_response = await client.post (
+            "/api/v1/admin/users/export",
+            headers={"Authorization": f"Bearer {auth_token}"},
+            json={
+                "type": "csv"
+            }
+        )
+
+        assert export_response.status_code == 200
+        job_id = export_response.headers["x-job-id"]
+
+        response = await client.get (
+            f"/api/v1/admin/users/jobs/{job_id}",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.json ()["id"] == job_id
+
+        response = await client.get (
+            f"/api/v1/admin/users/jobs/{job_id}",
+            headers={"Authorization": f"Bearer {other_admin_token}"}
+        )
+
+        assert response.status_code == 404
+
+class TestUserAdminAccess:
+    """User admin access tests"""
+
+    @pytest.mark.asyncio
+    async def test_admin_users_index_forbidden_get (self, client: AsyncClient, auth_token: str) -> None:
+        """
+        Test GET /api/v1/admin/users endpoint without an admin role
+
+        Should return 403
+        """
+        response = await client.get (
+            "/api/v1/admin/users/",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_admin_notifications_broadcast_forbidden_post (self, client: AsyncClient, auth_token: str) -> None:
+        """
+        Test POST /api/v1/admin/notifications/broadcast endpoint without an admin role
+
+        Should return 403
+        """
+        response = await client.post (
+            "/api/v1/admin/notifications/broadcast",
+            headers={"Authorization": f"Bearer {auth_token}"},
+            json={"type": "test", "data": {"message": "Forbidden broadcast"}}
+        )
+
+        assert response.status_code == 403
+
 class TestUserProfile:
     """User profile tests"""
 
@@ -611,6 +967,7 @@ class TestUserProfile:
         )
 
         assert response.status_code == 200
+        assert response.headers["cache-control"].startswith ("private")
         data = response.json ()
         assert "data" in data
         assert isinstance (data["data"], list)